@@ -1,4 +1,7 @@
 SECRET_KEY=...
+BCRYPT_ROUNDS=12
+PASSWORD_HASH_WORKERS=4
+PASSWORD_HASH_MAX_PENDING=64
 DATABASE_URL=postgresql+asyncpg://postgres:password@db/docker_file_processing
 
 AWS_ACCESS_KEY_ID=...
@@ -6,6 +9,37 @@ AWS_SECRET_ACCESS_KEY=...
 AWS_S3_BUCKET_NAME=...
 AWS_REGION=...
 AWS_SQS_QUEUE_URL=...
+AWS_MAX_POOL_CONNECTIONS=20
+AWS_CONNECT_TIMEOUT=5
+AWS_READ_TIMEOUT=30
+AWS_MAX_ATTEMPTS=3
+SQS_BATCH_LINGER_MS=10
+SQS_BATCH_MAX_RETRIES=1
+PRESIGNED_URL_EXPIRES_IN=1800
+PRESIGNED_URL_MIN_REMAINING=300
+PRESIGNED_URL_CACHE_SIZE=10000
+PRESIGNED_URL_REDIS_CACHE=False
+UPLOAD_URL_EXPIRES_IN=900
+RESUMABLE_UPLOAD_TTL=86400
+S3_COMPRESSION=none
+UPLOAD_INFLIGHT_BYTES=209715200
+UPLOAD_USER_CONCURRENCY=4
+UPLOAD_RETRY_AFTER=5
+
+# Job transport: sqs | redis | memory
+JOB_TRANSPORT=sqs
+REDIS_STREAM_PREFIX=jobs
+REDIS_STREAM_MAXLEN=100000
+MEMORY_TRANSPORT_MAX_SIZE=1000
+JOB_OUTBOX_ENABLED=True
+OUTBOX_BATCH_SIZE=100
+OUTBOX_POLL_INTERVAL=1
+OUTBOX_MAX_ATTEMPTS=10
+OUTBOX_RETRY_DELAY=1
+FILE_REAPER_BATCH_SIZE=1000
+FILE_REAPER_POLL_INTERVAL=30
+RESULT_CACHE_TTL=3600
+RESULT_CACHE_MAX_ENTRIES=100000
 
 CONVERTER_WEBHOOK_URL="http://main_app:8000/webhooks/converter-webhook"
 FILE_PARSER_WEBHOOK_URL="http://main_app:8000/webhooks/parser-webhook"
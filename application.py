@@ -7,6 +7,7 @@ from starlette.middleware.sessions import SessionMiddleware
 from starlette.status import HTTP_422_UNPROCESSABLE_ENTITY
 
 from src.app.constants import SESSION_AGE
+from src.settings.config import settings
 from src.app.file_management import router as fm_router
 from src.app.webhooks import router as webhook_router
 from src.app.auth import router as auth_router
@@ -34,6 +35,29 @@ async def validation_exception_handler(request, exc):
 @app.on_event("startup")
 async def startup():
     from src.settings.database import engine, Base
+    from src.app.file_management.reaper import file_reaper
+    from src.app.transport import get_transport, outbox_relay
+    from src.app.webhooks.listener import result_listener
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+
+    get_transport().start()
+    result_listener.start()
+    file_reaper.start()
+    if settings.JOB_OUTBOX_ENABLED:
+        outbox_relay.start()
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    from src.app.aws import aws_executor
+    from src.app.file_management.reaper import file_reaper
+    from src.app.transport import get_transport, outbox_relay
+    from src.app.webhooks.listener import result_listener
+
+    await result_listener.stop()
+    await file_reaper.stop()
+    await outbox_relay.stop()
+    await get_transport().close()
+    aws_executor.shutdown(wait=False)
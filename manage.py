@@ -1,5 +1,7 @@
+import asyncio
 import os
 import uuid
+from datetime import timedelta
 
 import typer
 from passlib.hash import bcrypt
@@ -48,5 +50,42 @@ def init_alembic():
     typer.echo(output)
 
 
+@app.command()
+def reconcile_storage(
+    fix: bool = typer.Option(False, help="Delete orphan objects and remove rows whose object is gone"),
+    grace_minutes: int = typer.Option(60, help="Ignore objects modified more recently than this"),
+    batch_size: int = typer.Option(1000, help="Keys per S3 page, DB fetch and fix batch (max 1000)"),
+):
+    """Compares the bucket with the files table and reports (or fixes) the keys present on one side only."""
+    from src.app.aws import s3_client
+    from src.management.reconcile import Reconciler
+    from src.settings.config import settings
+    from src.settings.database import async_session
+
+    def on_mismatch(kind: str, key: str):
+        typer.echo(shell_logger.warn_message(f"{kind}: {key}"))
+
+    reconciler = Reconciler(
+        s3_client,
+        settings.AWS_S3_BUCKET_NAME,
+        async_session,
+        grace=timedelta(minutes=grace_minutes),
+        batch_size=batch_size,
+        fix=fix,
+    )
+    try:
+        report = asyncio.run(reconciler.run(on_mismatch))
+    except Exception as e:
+        typer.echo(shell_logger.error_message(f"Error: {e}"))
+        raise typer.Exit(code=1)
+
+    typer.echo(
+        shell_logger.info_message(
+            f"Orphan objects: {report.orphan_objects} (deleted {report.deleted_objects}), "
+            f"rows without object: {report.missing_objects} (removed {report.removed_rows})"
+        )
+    )
+
+
 if __name__ == "__main__":
     app()
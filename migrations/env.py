@@ -5,7 +5,8 @@ from decouple import config as env_config
 from sqlalchemy.ext.asyncio import create_async_engine
 
 from src.app.auth.models import User
-from src.app.file_management.models import File
+from src.app.file_management.models import File, ProcessingResult
+from src.app.transport.models import OutboxMessage
 from src.settings.config import local_db
 from src.settings.database import Base
 
@@ -0,0 +1,27 @@
+"""files s3_key byte order index
+
+Revision ID: 4a8e0d27c915
+Revises: f2b6c9d3e481
+Create Date: 2026-10-16 14:48:10.502671
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "4a8e0d27c915"
+down_revision: Union[str, None] = "f2b6c9d3e481"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_files_s3_key_c", "files", [sa.text('(s3_key COLLATE "C")')], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_files_s3_key_c", table_name="files")
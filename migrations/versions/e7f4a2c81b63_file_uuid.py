@@ -0,0 +1,34 @@
+"""file uuid column
+
+Revision ID: e7f4a2c81b63
+Revises: c5e08b1d9a47
+Create Date: 2026-10-16 13:20:52.640118
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e7f4a2c81b63"
+down_revision: Union[str, None] = "c5e08b1d9a47"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("files", sa.Column("file_uuid", sa.String(length=36), nullable=True))
+    # Keys are "<uuid>_<file name>"
+    op.execute("UPDATE files SET file_uuid = split_part(s3_key, '_', 1) WHERE file_uuid IS NULL")
+    op.alter_column("files", "file_uuid", nullable=False)
+    op.create_index(op.f("ix_files_file_uuid"), "files", ["file_uuid"], unique=False)
+    op.create_index("ix_files_s3_key_user_id", "files", ["s3_key", "user_id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_files_s3_key_user_id", table_name="files")
+    op.drop_index(op.f("ix_files_file_uuid"), table_name="files")
+    op.drop_column("files", "file_uuid")
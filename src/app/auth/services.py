@@ -18,7 +18,7 @@ class AuthService:
         if existing_user:
             raise HTTPException(status_code=400, detail="User already exists")
 
-        hashed_password = self.auth_util.hash_password(user_data["password"])
+        hashed_password = await self.auth_util.hash_password(user_data["password"])
         new_user = User(
             username=user_data["username"],
             email=user_data["email"],
@@ -40,7 +40,12 @@ class AuthService:
         if not user:
             return None
 
-        if not self.auth_util.verify_password(password, user.password):
+        is_valid, new_hash = await self.auth_util.verify_password(password, user.password)
+        if not is_valid:
             return None
 
+        if new_hash:
+            # Rehashed with the current bcrypt cost, committed together with `last_login`
+            user.password = new_hash
+
         return user
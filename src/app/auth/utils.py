@@ -1,4 +1,7 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import partial
 
 from fastapi import HTTPException
 from fastapi.requests import Request
@@ -6,19 +9,59 @@ from jose import jwt
 from passlib.context import CryptContext
 
 from src.app.constants import SESSION_AGE
+from src.app.responses.statuses import ResponseErrorMessage
 from src.settings.config import settings, redis
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS)
+
+# bcrypt releases the GIL, so hashing scales with the number of workers
+password_executor = ThreadPoolExecutor(max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="bcrypt")
+
+
+class PasswordHasher:
+    """
+    Runs bcrypt on a dedicated bounded thread pool, so hashing never blocks the event loop.
+
+    At most `max_pending` calls may be queued or running at a time; further calls are rejected right away
+    with 503 and `Retry-After` instead of piling up behind a login storm.
+    """
+
+    def __init__(self, context: CryptContext, executor: ThreadPoolExecutor, max_pending: int):
+        self.context = context
+        self.executor = executor
+        self.max_pending = max_pending
+        self.pending = 0
+
+    async def hash(self, password: str) -> str:
+        return await self._run(self.context.hash, password)
+
+    async def verify_and_update(self, password: str, hashed_password: str) -> tuple[bool, str | None]:
+        """Returns whether the password matches and, if its hash uses outdated settings, a new hash."""
+        return await self._run(self.context.verify_and_update, password, hashed_password)
+
+    async def _run(self, func, *args):
+        if self.pending >= self.max_pending:
+            raise HTTPException(status_code=503, detail=ResponseErrorMessage.AUTH_BUSY, headers={"Retry-After": "1"})
+
+        self.pending += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self.executor, partial(func, *args))
+        finally:
+            self.pending -= 1
+
+
+password_hasher = PasswordHasher(pwd_context, password_executor, settings.PASSWORD_HASH_MAX_PENDING)
 
 
 class AuthUtils:
     @staticmethod
-    def hash_password(password: str) -> str:
-        return pwd_context.hash(password)
+    async def hash_password(password: str) -> str:
+        return await password_hasher.hash(password)
 
     @staticmethod
-    def verify_password(plain_password: str, hashed_password: str) -> bool:
-        return pwd_context.verify(plain_password, hashed_password)
+    async def verify_password(plain_password: str, hashed_password: str) -> tuple[bool, str | None]:
+        """Returns whether the password matches and a new hash when the configured bcrypt cost has changed."""
+        return await password_hasher.verify_and_update(plain_password, hashed_password)
 
     @staticmethod
     def create_access_token() -> str:
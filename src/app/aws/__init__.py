@@ -0,0 +1,3 @@
+from .clients import AsyncAWSClient, aws_executor, s3_client, sqs_client
+
+__all__ = ["AsyncAWSClient", "aws_executor", "s3_client", "sqs_client"]
@@ -1,17 +1,64 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
 import boto3
+from botocore.config import Config
 
 from src.settings.config import settings
 
-s3_client = boto3.client(
-    "s3",
-    aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-    aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-    region_name=settings.AWS_REGION,
+boto_config = Config(
+    max_pool_connections=settings.AWS_MAX_POOL_CONNECTIONS,
+    connect_timeout=settings.AWS_CONNECT_TIMEOUT,
+    read_timeout=settings.AWS_READ_TIMEOUT,
+    retries={"max_attempts": settings.AWS_MAX_ATTEMPTS, "mode": "standard"},
+)
+
+# One worker per pooled connection, so calls queue in the executor instead of waiting on the urllib3 pool
+aws_executor = ThreadPoolExecutor(max_workers=settings.AWS_MAX_POOL_CONNECTIONS, thread_name_prefix="aws")
+
+
+class AsyncAWSClient:
+    """
+    Awaitable facade over a boto3 client.
+
+    Every client method is exposed as a coroutine that runs the blocking boto3 call on the
+    shared, bounded `aws_executor`, so S3/SQS round trips never stall the event loop.
+    The wrapped client stays reachable through `sync` for paginators and exception classes.
+    """
+
+    def __init__(self, client, executor: ThreadPoolExecutor):
+        self.sync = client
+        self._executor = executor
+
+    def __getattr__(self, name: str):
+        method = getattr(self.sync, name)
+
+        async def _call(*args, **kwargs):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, partial(method, *args, **kwargs))
+
+        return _call
+
+
+s3_client = AsyncAWSClient(
+    boto3.client(
+        "s3",
+        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+        region_name=settings.AWS_REGION,
+        config=boto_config,
+    ),
+    aws_executor,
 )
 
-sqs_client = boto3.client(
-    "sqs",
-    aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-    aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-    region_name=settings.AWS_REGION,
+sqs_client = AsyncAWSClient(
+    boto3.client(
+        "sqs",
+        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+        region_name=settings.AWS_REGION,
+        config=boto_config,
+    ),
+    aws_executor,
 )
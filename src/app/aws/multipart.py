@@ -0,0 +1,67 @@
+from src.app.constants import UPLOAD_CHUNK_SIZE
+
+
+class MultipartUploader:
+    """
+    Streams an object to S3 part by part so the whole file never has to be held in memory.
+
+    Data passed to `write` is buffered until a full part is available and then sent with
+    `upload_part`. The multipart upload is only created once the first full part is ready,
+    so objects smaller than a single part are stored with one `put_object` call on `complete`.
+    `extra_args` (e.g. `ContentEncoding`) are passed to the call creating the object.
+    """
+
+    def __init__(self, s3_client, bucket: str, key: str, part_size: int = UPLOAD_CHUNK_SIZE, extra_args: dict = None):
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.key = key
+        self.part_size = part_size
+        self.extra_args = extra_args or {}
+        self.upload_id = None
+        self._buffer = bytearray()
+        self._parts = []
+
+    async def write(self, data: bytes) -> None:
+        self._buffer.extend(data)
+        while len(self._buffer) >= self.part_size:
+            part = bytes(self._buffer[: self.part_size])
+            del self._buffer[: self.part_size]
+            await self._upload_part(part)
+
+    async def complete(self) -> None:
+        if self.upload_id is None:
+            await self.s3_client.put_object(
+                Bucket=self.bucket, Key=self.key, Body=bytes(self._buffer), **self.extra_args
+            )
+            self._buffer.clear()
+            return
+
+        if self._buffer:
+            await self._upload_part(bytes(self._buffer))
+            self._buffer.clear()
+
+        await self.s3_client.complete_multipart_upload(
+            Bucket=self.bucket,
+            Key=self.key,
+            UploadId=self.upload_id,
+            MultipartUpload={"Parts": self._parts},
+        )
+
+    async def abort(self) -> None:
+        self._buffer.clear()
+        if self.upload_id is None:
+            return
+
+        await self.s3_client.abort_multipart_upload(Bucket=self.bucket, Key=self.key, UploadId=self.upload_id)
+        self.upload_id = None
+
+    async def _upload_part(self, body: bytes) -> None:
+        if self.upload_id is None:
+            response = await self.s3_client.create_multipart_upload(Bucket=self.bucket, Key=self.key, **self.extra_args)
+            self.upload_id = response["UploadId"]
+
+        part_number = len(self._parts) + 1
+        response = await self.s3_client.upload_part(
+            Bucket=self.bucket, Key=self.key, PartNumber=part_number, UploadId=self.upload_id, Body=body
+        )
+        self._parts.append({"ETag": response["ETag"], "PartNumber": part_number})
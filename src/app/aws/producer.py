@@ -0,0 +1,168 @@
+import asyncio
+from dataclasses import dataclass, field
+
+from src.app.constants import SQS_MAX_BATCH_BYTES, SQS_MAX_BATCH_SIZE
+from src.app.responses.statuses import ResponseErrorMessage
+from src.settings.config import settings, logger
+
+
+class SQSSendError(Exception):
+    def __init__(self, message: ResponseErrorMessage, detail: str | None = None):
+        super().__init__(detail or message)
+        self.message = message
+
+
+@dataclass(eq=False)
+class _PendingMessage:
+    queue_url: str
+    body: str
+    future: asyncio.Future
+    attempts: int = field(default=0)
+
+
+# Put on the queue by `stop` to make `_run` flush what it holds and exit
+_STOP = None
+
+
+class SQSBatchProducer:
+    """
+    Coalesces messages sent by concurrent requests into SendMessageBatch calls.
+
+    Callers put a message on an in-process queue and await a future. A background task
+    groups messages per queue URL into batches of up to SQS_MAX_BATCH_SIZE entries, waiting at
+    most `linger` seconds for a batch to fill, and resolves every future with its MessageId.
+    Entries that fail on the AWS side are retried up to `max_retries` times. On `stop`, the batches
+    being collected and the messages still queued are flushed before it returns.
+    """
+
+    def __init__(
+        self,
+        sqs_client,
+        linger: float = settings.SQS_BATCH_LINGER_MS / 1000,
+        max_retries: int = settings.SQS_BATCH_MAX_RETRIES,
+    ):
+        self.sqs_client = sqs_client
+        self.linger = linger
+        self.max_retries = max_retries
+        self._queue: asyncio.Queue[_PendingMessage | None] | None = None
+        self._task: asyncio.Task | None = None
+        self._flushes: set[asyncio.Task] = set()
+
+    def start(self) -> None:
+        if self._task and not self._task.done():
+            return
+
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Flushes the batches being collected and every queued message, then waits for all sends."""
+        if self._task:
+            if not self._task.done():
+                # Not cancelled: `_run` may hold messages it already took off the queue while lingering
+                await self._queue.put(_STOP)
+                await self._task
+            self._task = None
+
+        if self._queue:
+            batches = {}
+            while not self._queue.empty():
+                message = self._queue.get_nowait()
+                batches.setdefault(message.queue_url, []).append(message)
+            for queue_url, batch in batches.items():
+                self._schedule_flush(queue_url, batch)
+
+        if self._flushes:
+            await asyncio.gather(*self._flushes, return_exceptions=True)
+
+    async def send(self, queue_url: str, body: str) -> str:
+        """Enqueues the message and returns its SQS MessageId once the batch containing it is sent."""
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put(_PendingMessage(queue_url, body, future))
+        return await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        stopping = False
+        while not stopping:
+            first = await self._queue.get()
+            if first is _STOP:
+                return
+
+            batches = {first.queue_url: [first]}
+            deadline = loop.time() + self.linger
+
+            while (remaining := deadline - loop.time()) > 0:
+                try:
+                    message = await asyncio.wait_for(self._queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+
+                if message is _STOP:
+                    stopping = True
+                    break
+
+                batch = batches.setdefault(message.queue_url, [])
+                if batch and _batch_size(batch) + len(message.body.encode("utf-8")) > SQS_MAX_BATCH_BYTES:
+                    self._schedule_flush(message.queue_url, batch)
+                    batch = batches[message.queue_url] = []
+
+                batch.append(message)
+                if len(batch) == SQS_MAX_BATCH_SIZE:
+                    self._schedule_flush(message.queue_url, batches.pop(message.queue_url))
+
+            for queue_url, batch in batches.items():
+                if batch:
+                    self._schedule_flush(queue_url, batch)
+
+    def _schedule_flush(self, queue_url: str, batch: list[_PendingMessage]) -> None:
+        task = asyncio.create_task(self._flush(queue_url, batch))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _flush(self, queue_url: str, batch: list[_PendingMessage]) -> None:
+        entries = [{"Id": str(index), "MessageBody": message.body} for index, message in enumerate(batch)]
+
+        try:
+            response = await self.sqs_client.send_message_batch(QueueUrl=queue_url, Entries=entries)
+        except Exception as e:
+            logger.error(f"SQS batch send error: {str(e)}", exc_info=True)
+            for message in batch:
+                _set_exception(message.future, SQSSendError(ResponseErrorMessage.AWS_QUEUE_ERROR, str(e)))
+            return
+
+        for entry in response.get("Successful", []):
+            future = batch[int(entry["Id"])].future
+            if not future.done():
+                future.set_result(entry["MessageId"])
+
+        retries = []
+        for entry in response.get("Failed", []):
+            message = batch[int(entry["Id"])]
+            if not entry.get("SenderFault") and message.attempts < self.max_retries:
+                message.attempts += 1
+                retries.append(message)
+                continue
+
+            logger.error(f"SQS rejected message: {entry.get('Code')} {entry.get('Message')}")
+            _set_exception(
+                message.future, SQSSendError(ResponseErrorMessage.AWS_SQS_ENQUEUE_TASK_ERROR, entry.get("Message"))
+            )
+
+        for message in batch:
+            if not message.future.done() and message not in retries:
+                _set_exception(message.future, SQSSendError(ResponseErrorMessage.AWS_SQS_ENQUEUE_TASK_ERROR))
+
+        if retries:
+            await self._flush(queue_url, retries)
+
+
+def _batch_size(batch: list[_PendingMessage]) -> int:
+    return sum(len(message.body.encode("utf-8")) for message in batch)
+
+
+def _set_exception(future: asyncio.Future, exc: Exception) -> None:
+    if not future.done():
+        future.set_exception(exc)
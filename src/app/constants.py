@@ -2,3 +2,25 @@ SESSION_AGE = 60 * 60 * 24 * 30  # 30 days
 MAX_FILE_SIZE_MB = 20
 MAX_FILE_SIZE_BYTES = MAX_FILE_SIZE_MB * 1024 * 1024
 SUPPORTED_FORMATS = ["doc", "docx", "pdf", "txt", "png", "jpg", "jpeg"]
+COMPRESSIBLE_FORMATS = ["txt", "doc"]  # other supported formats are already compressed
+GZIP_WBITS = 16 + 15  # zlib window bits producing a gzip container
+CONTENT_SNIFF_BYTES = 8 * 1024  # leading bytes inspected to detect the real file type
+UPLOAD_CHUNK_SIZE = 5 * 1024 * 1024  # S3 minimum multipart part size
+RESULT_CACHE_PREFIXES = ["file_conversion", "file_parsing", "tonality_analysis"]
+JOB_TTL = 60 * 60 * 24  # 1 day
+USER_EVENTS_PREFIX = "user_events"
+SSE_HEARTBEAT_INTERVAL = 15  # seconds
+SSE_QUEUE_SIZE = 100
+SQS_MAX_BATCH_SIZE = 10  # SendMessageBatch entry limit
+SQS_MAX_BATCH_BYTES = 256 * 1024  # SendMessageBatch payload limit
+JOB_INFLIGHT_TTL = 30  # seconds, must stay below the 60s result cache TTL
+RESULT_CACHE_TRIM_EVERY = 100  # cold tier trim runs once per this many stored results
+STORAGE_PAGE_SIZE = 50
+STORAGE_MAX_PAGE_SIZE = 500
+S3_DELETE_BATCH_SIZE = 1000  # DeleteObjects key limit
+BULK_REMOVE_MAX_FILES = 10000
+BATCH_UPLOAD_MAX_FILES = 100
+BATCH_UPLOAD_CONCURRENCY = 8  # concurrent S3 transfers per batch upload
+OUTBOX_MAX_RETRY_DELAY = 15 * 60  # seconds, cap of the exponential outbox retry backoff
+UPLOAD_CONFIRM_CLAIM_TTL = 60  # seconds a confirm holds a direct upload before it may be confirmed again
+UPLOAD_SLOT_TTL = 10 * 60  # seconds after which the upload slot of a crashed process is released
@@ -0,0 +1,95 @@
+import time
+import uuid
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from fastapi import HTTPException
+from redis.exceptions import RedisError
+
+from src.app.constants import UPLOAD_SLOT_TTL
+from src.app.responses.statuses import ResponseErrorMessage
+from src.settings.config import redis, settings, logger
+
+
+class UploadAdmission:
+    """
+    Admission control for uploads passing through the API.
+
+    Every process admits uploads while their total size stays within `max_bytes`, a request larger than
+    the whole budget is admitted alone. Every user may run `max_per_user` uploads at a time across all
+    processes: each upload holds a slot in the Redis sorted set `upload_slots:<user_id>`, scored by its
+    start time, so slots of a crashed process are dropped after `slot_ttl` seconds.
+
+    Rejections are immediate, 503 when the process budget is full and 429 when the user has too many
+    uploads, both with `Retry-After`. Redis failures are logged and let the upload through.
+    """
+
+    def __init__(
+        self,
+        redis_client,
+        max_bytes: int = settings.UPLOAD_INFLIGHT_BYTES,
+        max_per_user: int = settings.UPLOAD_USER_CONCURRENCY,
+        retry_after: int = settings.UPLOAD_RETRY_AFTER,
+        slot_ttl: int = UPLOAD_SLOT_TTL,
+    ):
+        self.redis = redis_client
+        self.max_bytes = max_bytes
+        self.max_per_user = max_per_user
+        self.retry_after = retry_after
+        self.slot_ttl = slot_ttl
+        self.inflight_bytes = 0
+
+    @asynccontextmanager
+    async def admit(self, user_id: int, size: int) -> AsyncIterator[None]:
+        size = min(size, self.max_bytes)
+        if self.inflight_bytes + size > self.max_bytes:
+            raise self._reject(503, ResponseErrorMessage.UPLOADS_BUSY)
+
+        # Reserved before the first await, so concurrent requests cannot overshoot the budget
+        self.inflight_bytes += size
+        slot = None
+        try:
+            slot = await self._acquire_slot(user_id)
+            yield
+        finally:
+            self.inflight_bytes -= size
+            await self._release_slot(user_id, slot)
+
+    async def _acquire_slot(self, user_id: int) -> str | None:
+        slot, now = str(uuid.uuid4()), time.time()
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.zremrangebyscore(self._key(user_id), "-inf", now - self.slot_ttl)
+                pipe.zadd(self._key(user_id), {slot: now})
+                pipe.zcard(self._key(user_id))
+                pipe.expire(self._key(user_id), self.slot_ttl)
+                _, _, slots, _ = await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Upload admission failed open: {e}")
+            return None
+
+        if slots > self.max_per_user:
+            await self._release_slot(user_id, slot)
+            raise self._reject(429, ResponseErrorMessage.TOO_MANY_UPLOADS)
+
+        return slot
+
+    async def _release_slot(self, user_id: int, slot: str | None) -> None:
+        if slot is None:
+            return
+
+        try:
+            await self.redis.zrem(self._key(user_id), slot)
+        except RedisError as e:
+            logger.warning(f"Failed to release upload slot of user {user_id}: {e}")
+
+    def _reject(self, status_code: int, message: ResponseErrorMessage) -> HTTPException:
+        logger.warning(f"Upload rejected: {message}")
+        return HTTPException(status_code=status_code, detail=message, headers={"Retry-After": str(self.retry_after)})
+
+    @staticmethod
+    def _key(user_id: int) -> str:
+        return f"upload_slots:{user_id}"
+
+
+upload_admission = UploadAdmission(redis)
@@ -0,0 +1,187 @@
+import asyncio
+import hashlib
+import json
+import uuid
+from datetime import datetime, timezone
+from typing import Awaitable, Callable
+
+from redis.exceptions import RedisError
+
+from src.app.constants import JOB_TTL, JOB_INFLIGHT_TTL
+from src.app.responses.statuses import JobStatus
+from src.settings.config import redis, logger
+
+
+class JobStore:
+    """
+    Keeps the state of asynchronous processing jobs in Redis.
+
+    A job is stored under `job:<job_id>` and indexed under the result cache key it is waiting
+    for (e.g. `job_index:file_parsing:<uuid>`), so the webhook that caches a result can complete
+    every job attached to it.
+    """
+
+    def __init__(self, redis_client, ttl: int = JOB_TTL):
+        self.redis = redis_client
+        self.ttl = ttl
+
+    async def create(self, user_id: int, job_type: str, s3_key: str) -> str:
+        job_id = str(uuid.uuid4())
+        job = {
+            "job_id": job_id,
+            "user_id": user_id,
+            "job_type": job_type,
+            "s3_key": s3_key,
+            "status": JobStatus.PENDING,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+        }
+        index_key = self._index_key(f"{job_type}:{s3_key.split('_')[0]}")
+
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.set(self._job_key(job_id), json.dumps(job), ex=self.ttl)
+            pipe.sadd(index_key, job_id)
+            pipe.expire(index_key, self.ttl)
+            await pipe.execute()
+
+        return job_id
+
+    async def get(self, job_id: str) -> dict | None:
+        job = await self.redis.get(self._job_key(job_id))
+        return json.loads(job) if job else None
+
+    async def delete(self, job_id: str) -> None:
+        await self.redis.delete(self._job_key(job_id))
+
+    async def complete(self, job_id: str, result: dict) -> dict | None:
+        job = await self.get(job_id)
+        if not job:
+            return None
+
+        job["status"] = JobStatus.COMPLETED
+        job["result"] = result
+        await self.redis.set(self._job_key(job_id), json.dumps(job), ex=self.ttl)
+        return job
+
+    async def resolve(self, cache_key: str, result: dict) -> list[dict]:
+        """Completes every job waiting for `cache_key` and returns them."""
+        index_key = self._index_key(cache_key)
+        # Read and cleared atomically: a job indexed in between would otherwise be dropped and never completed
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.smembers(index_key)
+            pipe.delete(index_key)
+            job_ids, _ = await pipe.execute()
+        if not job_ids:
+            return []
+
+        completed_jobs = []
+        for job_id in job_ids:
+            job = await self.complete(job_id.decode("utf-8") if isinstance(job_id, bytes) else job_id, result)
+            if job:
+                completed_jobs.append(job)
+
+        return completed_jobs
+
+    @staticmethod
+    def _job_key(job_id: str) -> str:
+        return f"job:{job_id}"
+
+    @staticmethod
+    def _index_key(cache_key: str) -> str:
+        return f"job_index:{cache_key}"
+
+
+class JobCoalescer:
+    """
+    Singleflight registry for processing jobs.
+
+    Identical requests (same job type, file and parameters) share a fingerprint. The first caller
+    claims `inflight:<fingerprint>` with `SET NX` and enqueues the job; every other caller, in this
+    process or another one, attaches to it and waits for the same cached result instead of sending
+    a duplicate message to the workers. Callers racing inside one process share a local future so
+    only one of them talks to Redis. The claim is dropped when the result webhook arrives, when
+    enqueueing fails, or when the TTL expires.
+    """
+
+    def __init__(self, redis_client, ttl: int = JOB_INFLIGHT_TTL):
+        self.redis = redis_client
+        self.ttl = ttl
+        self._local: dict[str, asyncio.Future] = {}
+
+    @staticmethod
+    def fingerprint(job_type: str, s3_key: str, **params) -> str:
+        raw = json.dumps({"job_type": job_type, "s3_key": s3_key, "params": params}, sort_keys=True)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    async def run(
+        self, fingerprint: str, cache_key: str, enqueue: Callable[[], Awaitable[tuple]]
+    ) -> tuple[str | None, bool]:
+        """
+        Calls `enqueue` unless an identical job is already in flight.
+
+        Returns the `(message, is_sent)` pair of `enqueue`, or `(None, True)` when the request was
+        attached to an existing job.
+        """
+        future = self._local.get(fingerprint)
+        if future:
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._local[fingerprint] = future
+        try:
+            result = await self._claim_and_enqueue(fingerprint, cache_key, enqueue)
+            future.set_result(result)
+            return result
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # mark as retrieved when no one else is waiting
+            raise
+        finally:
+            self._local.pop(fingerprint, None)
+
+    async def resolve(self, cache_key: str) -> None:
+        """Releases every in-flight claim waiting for `cache_key`."""
+        index_key = self._index_key(cache_key)
+        try:
+            keys = await self.redis.smembers(index_key)
+            await self.redis.delete(index_key, *keys)
+        except RedisError as e:
+            logger.warning(f"Failed to release in-flight jobs for {cache_key}: {e}")
+
+    async def _claim_and_enqueue(self, fingerprint: str, cache_key: str, enqueue) -> tuple[str | None, bool]:
+        inflight_key = self._inflight_key(fingerprint)
+        index_key = self._index_key(cache_key)
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.set(inflight_key, "1", nx=True, ex=self.ttl)
+                pipe.sadd(index_key, inflight_key)
+                pipe.expire(index_key, self.ttl)
+                is_claimed, *_ = await pipe.execute()
+        except RedisError as e:
+            # Duplicated work is cheaper than a dropped request.
+            logger.warning(f"In-flight registry unavailable, enqueueing without coalescing: {e}")
+            return await enqueue()
+
+        if not is_claimed:
+            logger.info(f"Attached to in-flight job {fingerprint}")
+            return None, True
+
+        message, is_sent = await enqueue()
+        if not is_sent:
+            try:
+                await self.redis.delete(inflight_key)
+            except RedisError as e:
+                logger.warning(f"Failed to release in-flight job {fingerprint}: {e}")
+
+        return message, is_sent
+
+    @staticmethod
+    def _inflight_key(fingerprint: str) -> str:
+        return f"inflight:{fingerprint}"
+
+    @staticmethod
+    def _index_key(cache_key: str) -> str:
+        return f"inflight_index:{cache_key}"
+
+
+job_store = JobStore(redis)
+job_coalescer = JobCoalescer(redis)
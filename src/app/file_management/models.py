@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, JSON, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -12,7 +12,30 @@ class File(Base):
     file_name = Column(String, nullable=False)
     s3_url = Column(String, nullable=False)
     s3_key = Column(String, nullable=False)
+    file_uuid = Column(String(36), nullable=False, index=True)
     uploaded_at = Column(DateTime(timezone=True), default=func.now())
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    content_hash = Column(String(64), nullable=True, index=True)
+    deleted_at = Column(DateTime(timezone=True), nullable=True)
+    purge_attempts = Column(Integer, nullable=False, default=0, server_default="0")
+    content_encoding = Column(String(16), nullable=True)  # e.g. "gzip" when the S3 object is stored compressed
+
+    __table_args__ = (
+        Index("ix_files_user_id_uploaded_at_id", "user_id", "uploaded_at", "id"),
+        Index("ix_files_s3_key_user_id", "s3_key", "user_id"),
+        Index("ix_files_deleted_at", "deleted_at", postgresql_where=deleted_at.isnot(None)),
+        # Byte-ordered scan used by the storage reconciliation
+        Index("ix_files_s3_key_c", s3_key.collate("C")),
+    )
 
     owner = relationship("src.app.auth.models.User", back_populates="files")
+
+
+class ProcessingResult(Base):
+    __tablename__ = "processing_results"
+
+    digest = Column(String(64), primary_key=True)
+    kind = Column(String, nullable=False)
+    payload = Column(JSON, nullable=False)
+    created_at = Column(DateTime(timezone=True), default=func.now())
+    last_accessed_at = Column(DateTime(timezone=True), default=func.now(), index=True)
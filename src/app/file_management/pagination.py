@@ -0,0 +1,18 @@
+import base64
+import json
+from datetime import datetime
+
+
+def encode_cursor(uploaded_at: datetime, file_id: int) -> str:
+    """Opaque token pointing right after the given row of the `(uploaded_at, id)` ordering."""
+    raw = json.dumps([uploaded_at.isoformat(), file_id])
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Raises ValueError for tokens not produced by `encode_cursor`."""
+    try:
+        uploaded_at, file_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return datetime.fromisoformat(uploaded_at), int(file_id)
+    except (TypeError, UnicodeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
@@ -0,0 +1,137 @@
+import asyncio
+
+from sqlalchemy import delete, select, update
+
+from src.app.aws import s3_client
+from src.app.constants import S3_DELETE_BATCH_SIZE
+from src.app.file_management.models import File as FileModel
+from src.settings.config import settings, logger
+from src.settings.database import async_session
+
+
+class FileReaper:
+    """
+    Garbage-collects soft-deleted files.
+
+    Removing a file only sets `deleted_at`; each pass of the reaper locks up to `batch_size` tombstoned
+    rows with `FOR UPDATE SKIP LOCKED`, deletes their objects with one S3 `DeleteObjects` call and purges
+    the rows whose objects are gone in the same transaction. Objects still referenced by other rows (see
+    `FileManagementService.find_shared_object`) are kept. Rows that failed stay tombstoned with
+    `purge_attempts` increased and are retried after the others on later passes.
+
+    Two reapers purging the last two references of one object at the same time both keep it; such
+    objects are found by `reconcile-storage`.
+    """
+
+    def __init__(
+        self,
+        session_factory,
+        s3,
+        bucket: str = settings.AWS_S3_BUCKET_NAME,
+        batch_size: int = settings.FILE_REAPER_BATCH_SIZE,
+        poll_interval: float = settings.FILE_REAPER_POLL_INTERVAL,
+    ):
+        self.session_factory = session_factory
+        self.s3_client = s3
+        self.bucket = bucket
+        self.batch_size = min(batch_size, S3_DELETE_BATCH_SIZE)
+        self.poll_interval = poll_interval
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task and not self._task.done():
+            return
+
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def notify(self) -> None:
+        """Wakes the reaper up right after files are removed instead of waiting for the next poll."""
+        if self._wakeup:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                reaped = await self.reap_batch()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"File reaper error: {str(e)}", exc_info=True)
+                reaped = 0
+
+            if reaped < self.batch_size:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+
+    async def reap_batch(self) -> int:
+        async with self.session_factory() as session:
+            async with session.begin():
+                stmt = (
+                    select(FileModel.id, FileModel.s3_key)
+                    .filter(FileModel.deleted_at.isnot(None))
+                    .order_by(FileModel.purge_attempts, FileModel.deleted_at)
+                    .limit(self.batch_size)
+                    .with_for_update(skip_locked=True)
+                )
+                files = (await session.execute(stmt)).tuples().all()
+                if not files:
+                    return 0
+
+                # Deduplicated uploads share objects, an object is only deleted with its last reference
+                stmt = (
+                    select(FileModel.s3_key)
+                    .filter(
+                        FileModel.s3_key.in_({s3_key for _, s3_key in files}),
+                        FileModel.id.notin_([file_id for file_id, _ in files]),
+                    )
+                    .distinct()
+                )
+                shared_keys = {s3_key for s3_key, in (await session.execute(stmt)).tuples().all()}
+                unreferenced_keys = sorted({s3_key for _, s3_key in files} - shared_keys)
+                failed_keys = await self.delete_objects(unreferenced_keys) if unreferenced_keys else set()
+                purged_ids = [file_id for file_id, s3_key in files if s3_key not in failed_keys]
+                failed_ids = [file_id for file_id, s3_key in files if s3_key in failed_keys]
+                if purged_ids:
+                    await session.execute(delete(FileModel).where(FileModel.id.in_(purged_ids)))
+                if failed_ids:
+                    await session.execute(
+                        update(FileModel)
+                        .where(FileModel.id.in_(failed_ids))
+                        .values(purge_attempts=FileModel.purge_attempts + 1)
+                    )
+
+        return len(files)
+
+    async def delete_objects(self, s3_keys: list[str]) -> set[str]:
+        """Deletes the keys with one `DeleteObjects` call and returns the keys that could not be deleted."""
+        try:
+            response = await self.s3_client.delete_objects(
+                Bucket=self.bucket, Delete={"Objects": [{"Key": s3_key} for s3_key in s3_keys], "Quiet": True}
+            )
+        except Exception as e:
+            logger.error(f"S3 batch delete error: {str(e)}", exc_info=True)
+            return set(s3_keys)
+
+        failed_keys = set()
+        for error in response.get("Errors", []):
+            logger.warning(f"Failed to delete {error['Key']} from S3: {error.get('Message')}")
+            failed_keys.add(error["Key"])
+
+        return failed_keys
+
+
+file_reaper = FileReaper(async_session, s3_client)
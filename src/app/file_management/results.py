@@ -0,0 +1,148 @@
+import hashlib
+import json
+from pathlib import PurePath
+
+from redis.exceptions import RedisError
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import func
+
+from src.app.constants import RESULT_CACHE_TRIM_EVERY
+from src.app.file_management.models import File as FileModel, ProcessingResult
+from src.settings.config import redis, settings, logger
+
+
+def converted_content_hash(content_hash: str | None, new_s3_key: str) -> str | None:
+    """Content identity of a converted file: the source hash plus the target format."""
+    if not content_hash:
+        return None
+
+    target_format = PurePath(new_s3_key).suffix.lstrip(".").lower()
+    return hashlib.sha256(f"{content_hash}:{target_format}".encode("utf-8")).hexdigest()
+
+
+class ResultCache:
+    """
+    Content-addressed cache of processing results.
+
+    Results are keyed by a digest of the job type, the SHA-256 of the file content and the job
+    parameters, so a repeated job on unchanged content is answered without going through the queue,
+    whatever the file is called. Reads hit the Redis hot tier (`result:<digest>`, TTL refreshed on
+    every hit) first and fall back to the `processing_results` table, promoting the row back to Redis.
+    The table is trimmed to `max_entries` rows by `last_accessed_at`, least recently used first.
+    The cold tier is read and written on the caller's session, so a request never holds a second
+    pooled connection for the cache.
+
+    Cache failures are logged and treated as misses: the job then simply goes through the queue.
+    """
+
+    def __init__(
+        self,
+        redis_client,
+        ttl: int = settings.RESULT_CACHE_TTL,
+        max_entries: int = settings.RESULT_CACHE_MAX_ENTRIES,
+        trim_every: int = RESULT_CACHE_TRIM_EVERY,
+    ):
+        self.redis = redis_client
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.trim_every = trim_every
+        self._stored = 0
+
+    @staticmethod
+    def digest(kind: str, content_hash: str, **params) -> str:
+        raw = json.dumps({"kind": kind, "content_hash": content_hash, "params": params}, sort_keys=True)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    async def lookup(self, db: AsyncSession, kind: str, s3_key: str, **params) -> tuple[str | None, dict | None]:
+        """
+        Returns `(digest, result)` for a job on `s3_key`.
+
+        The digest is None when the content hash of the file is unknown (files uploaded before it
+        was recorded), the result is None on a miss.
+        """
+        content_hash = await db.scalar(
+            select(FileModel.content_hash).filter(FileModel.s3_key == s3_key, FileModel.deleted_at.is_(None))
+        )
+        if not content_hash:
+            return None, None
+
+        digest = self.digest(kind, content_hash, **params)
+        return digest, await self.get(db, digest)
+
+    async def get(self, db: AsyncSession, digest: str) -> dict | None:
+        try:
+            cached = await self.redis.getex(self._key(digest), ex=self.ttl)
+            if cached:
+                return json.loads(cached)
+        except (RedisError, ValueError) as e:
+            logger.warning(f"Result cache hot tier read failed: {e}")
+
+        try:
+            stmt = (
+                update(ProcessingResult)
+                .where(ProcessingResult.digest == digest)
+                .values(last_accessed_at=func.now())
+                .returning(ProcessingResult.payload)
+            )
+            payload = (await db.execute(stmt)).scalar_one_or_none()
+            await db.commit()
+        except Exception as e:
+            logger.error(f"Result cache cold tier read failed: {e}", exc_info=True)
+            await db.rollback()
+            return None
+
+        if payload is not None:
+            await self._set_hot(digest, payload)
+
+        return payload
+
+    async def put(self, db: AsyncSession, digest: str, kind: str, payload: dict) -> None:
+        await self._set_hot(digest, payload)
+
+        try:
+            stmt = insert(ProcessingResult).values(digest=digest, kind=kind, payload=payload)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[ProcessingResult.digest],
+                set_={"payload": stmt.excluded.payload, "last_accessed_at": func.now()},
+            )
+            await db.execute(stmt)
+
+            self._stored += 1
+            if self._stored % self.trim_every == 0:
+                await self._trim(db)
+
+            await db.commit()
+        except Exception as e:
+            logger.error(f"Result cache cold tier write failed: {e}", exc_info=True)
+            await db.rollback()
+
+    async def discard(self, db: AsyncSession, digest: str) -> None:
+        """Drops a result that can no longer be served (e.g. its converted object is gone)."""
+        try:
+            await self.redis.delete(self._key(digest))
+            await db.execute(delete(ProcessingResult).where(ProcessingResult.digest == digest))
+            await db.commit()
+        except Exception as e:
+            logger.error(f"Result cache discard failed: {e}", exc_info=True)
+            await db.rollback()
+
+    async def _set_hot(self, digest: str, payload: dict) -> None:
+        try:
+            await self.redis.set(self._key(digest), json.dumps(payload), ex=self.ttl)
+        except RedisError as e:
+            logger.warning(f"Result cache hot tier write failed: {e}")
+
+    async def _trim(self, session: AsyncSession) -> None:
+        evicted = (
+            select(ProcessingResult.digest).order_by(ProcessingResult.last_accessed_at.desc()).offset(self.max_entries)
+        )
+        await session.execute(delete(ProcessingResult).where(ProcessingResult.digest.in_(evicted)))
+
+    @staticmethod
+    def _key(digest: str) -> str:
+        return f"result:{digest}"
+
+
+result_cache = ResultCache(redis)
@@ -1,18 +1,37 @@
 import json
 
-from fastapi import APIRouter, Depends, UploadFile, File, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.requests import Request
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.datastructures import UploadFile
+from starlette.exceptions import HTTPException as StarletteHTTPException
 from starlette.responses import JSONResponse
 
 from src.app.auth.utils import blacklist_check
-from src.app.aws.utils import send_message_to_sqs
+from src.app.constants import (
+    STORAGE_PAGE_SIZE,
+    STORAGE_MAX_PAGE_SIZE,
+    BULK_REMOVE_MAX_FILES,
+    BATCH_UPLOAD_MAX_FILES,
+    UPLOAD_CHUNK_SIZE,
+)
+from src.app.file_management.admission import upload_admission
+from src.app.file_management.jobs import job_store, job_coalescer
+from src.app.file_management.results import result_cache
 from src.app.file_management.services import FileManagementService
+from src.app.file_management.uploads import (
+    pending_uploads,
+    resumable_uploads,
+    chunk_part_number,
+    missing_parts,
+    received_offset,
+)
 from src.app.responses.generator import ResponseGeneratorService
-from src.app.responses.statuses import ResponseErrorMessage
+from src.app.responses.statuses import ResponseErrorMessage, JobStatus
+from src.app.transport import JobQueue, enqueue_job
 from src.app.validators.file_validation import FileValidator, invalid_file
-from src.app.webhooks.utils import wait_for_cache
+from src.app.webhooks.utils import wait_for_cache, publish_job_event
 from src.settings.config import logger
 from src.settings.config import settings
 from src.settings.database import get_db
@@ -35,33 +54,320 @@ class FileParserRequest(BaseModel):
     keywords: list[str]
 
 
+class UploadUrlRequest(BaseModel):
+    file_name: str
+    file_size: int = Field(gt=0)
+
+
+class UploadConfirmRequest(BaseModel):
+    upload_id: str
+
+
+class ResumableUploadRequest(BaseModel):
+    file_name: str
+    file_size: int = Field(gt=0)
+
+
+class BulkRemoveRequest(BaseModel):
+    file_ids: list[int] = Field(min_length=1, max_length=BULK_REMOVE_MAX_FILES)
+
+
+async def enqueue_once(job_type: str, s3_key: str, queue: JobQueue, request_body: str, db: AsyncSession, **params):
+    """Enqueues the job unless an identical one is already in flight, see `JobCoalescer`."""
+    fingerprint = job_coalescer.fingerprint(job_type, s3_key, **params)
+    cache_key = f"{job_type}:{s3_key.split('_')[0]}"
+    return await job_coalescer.run(fingerprint, cache_key, lambda: enqueue_job(queue, request_body, db=db))
+
+
+def resumable_upload_status(upload_id: str, upload: dict) -> dict:
+    return {
+        "upload_id": upload_id,
+        "file_size": upload["file_size"],
+        "chunk_size": UPLOAD_CHUNK_SIZE,
+        "offset": received_offset(upload, UPLOAD_CHUNK_SIZE),
+        "missing_parts": missing_parts(upload, UPLOAD_CHUNK_SIZE),
+    }
+
+
+async def read_chunk(request: Request, limit: int) -> bytes | None:
+    """Reads the request body, returns None as soon as it exceeds `limit` bytes."""
+    chunk = bytearray()
+    async for data in request.stream():
+        chunk.extend(data)
+        if len(chunk) > limit:
+            return None
+    return bytes(chunk)
+
+
+def with_result_digest(callback_url: str, digest: str | None) -> str:
+    """Passes the result cache digest to the webhook, see `ResultCache`."""
+    if not digest:
+        return callback_url
+
+    separator = "&" if "?" in callback_url else "?"
+    return f"{callback_url}{separator}result_digest={digest}"
+
+
 async def get_file_manager(db: AsyncSession = Depends(get_db)) -> FileManagementService:
     return FileManagementService(db)
 
 
+def job_accepted_response(fapi_req: Request, job_id: str, status: JobStatus = JobStatus.PENDING) -> JSONResponse:
+    return JSONResponse(
+        status_code=202,
+        content={
+            "job_id": job_id,
+            "status": status,
+            "status_url": str(fapi_req.url_for("job_status", job_id=job_id)),
+        },
+    )
+
+
+async def cached_result_response(
+    fapi_req: Request,
+    job_type: str,
+    s3_key: str,
+    result: dict,
+    async_mode: bool,
+    response_generator: ResponseGeneratorService,
+    use_s3: bool = False,
+):
+    """Answers a job from the result cache; in async mode the job is created already completed."""
+    if async_mode:
+        job_id = await job_store.create(fapi_req.session.get("user_id"), job_type, s3_key)
+        await publish_job_event(await job_store.complete(job_id, result))
+        return job_accepted_response(fapi_req, job_id, status=JobStatus.COMPLETED)
+
+    return await response_generator.generate_response(result, use_s3=use_s3)
+
+
 @router.get("/storage", dependencies=[Depends(blacklist_check)], status_code=200)
-async def files_history(request: Request, service: FileManagementService = Depends(get_file_manager)):
+async def files_history(
+    request: Request,
+    limit: int = Query(STORAGE_PAGE_SIZE, ge=1, le=STORAGE_MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    service: FileManagementService = Depends(get_file_manager),
+):
     try:
-        return await service.get_files_history(request.session.get("user_id"))
+        return await service.get_files_history(request.session.get("user_id"), limit=limit, cursor=cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=ResponseErrorMessage.INVALID_CURSOR)
     except Exception as e:
         logger.error(f"File History Error: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=ResponseErrorMessage.INTERNAL_ERROR)
 
 
+def _request_size(request: Request) -> int:
+    """Size to admit for an upload request, the whole budget when the client sends no Content-Length."""
+    try:
+        return int(request.headers["content-length"])
+    except (KeyError, ValueError):
+        return upload_admission.max_bytes
+
+
 @router.post("/upload", dependencies=[Depends(blacklist_check)], status_code=201)
-async def upload_file(
-    request: Request, file: UploadFile = File(...), service: FileManagementService = Depends(get_file_manager)
+async def upload_file(request: Request, service: FileManagementService = Depends(get_file_manager)):
+    # The body is parsed only once the upload is admitted, so rejected uploads are never spooled
+    user_id: int = request.session.get("user_id")
+    try:
+        async with upload_admission.admit(user_id, _request_size(request)), request.form() as form:
+            file = form.get("file")
+            validator = FileValidator()
+            is_valid_file = (
+                isinstance(file, UploadFile)
+                and validator.validate_file(file)
+                and await validator.validate_content(file)
+            )
+            if not is_valid_file:
+                logger.warning("File Upload Validation Error", exc_info=True)
+                raise HTTPException(status_code=400, detail=invalid_file)
+
+            return await service.add_file(file, user_id)
+    except StarletteHTTPException as e:
+        raise e
+    except Exception as e:
+        logger.error(f"File Upload Error: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=ResponseErrorMessage.INTERNAL_ERROR)
+
+
+@router.post("/upload-batch", dependencies=[Depends(blacklist_check)], status_code=201)
+async def upload_files(request: Request, service: FileManagementService = Depends(get_file_manager)):
+    user_id: int = request.session.get("user_id")
+    try:
+        async with upload_admission.admit(user_id, _request_size(request)), request.form() as form:
+            files = [file for file in form.getlist("files") if isinstance(file, UploadFile)]
+            if not files:
+                raise HTTPException(status_code=400, detail=invalid_file)
+            if len(files) > BATCH_UPLOAD_MAX_FILES:
+                return JSONResponse(status_code=400, content={"message": ResponseErrorMessage.TOO_MANY_FILES})
+
+            return await service.add_files(files, user_id)
+    except StarletteHTTPException as e:
+        raise e
+    except Exception as e:
+        logger.error(f"Batch Upload Error: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=ResponseErrorMessage.INTERNAL_ERROR)
+
+
+@router.post("/upload-url", dependencies=[Depends(blacklist_check)], status_code=201)
+async def create_upload_url(
+    request: Request, body: UploadUrlRequest, service: FileManagementService = Depends(get_file_manager)
 ):
-    is_valid_file = FileValidator().validate_file(file)
-    if not is_valid_file:
-        logger.warning("File Upload Validation Error", exc_info=True)
+    if not FileValidator().validate_metadata(body.file_name, body.file_size):
+        logger.warning("File Upload Validation Error")
         raise HTTPException(status_code=400, detail=invalid_file)
 
     try:
-        user_id: int = request.session.get("user_id")
-        return await service.add_file(file, user_id)
+        upload = await service.create_upload_url(body.file_name, body.file_size)
+        await pending_uploads.create(
+            upload["upload_id"], request.session.get("user_id"), upload["s3_key"], body.file_name
+        )
+        return upload
     except Exception as e:
-        logger.error(f"File Upload Error: {str(e)}", exc_info=True)
+        logger.error(f"Upload URL Error: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=ResponseErrorMessage.INTERNAL_ERROR)
+
+
+@router.post("/upload-confirm", dependencies=[Depends(blacklist_check)], status_code=201)
+async def confirm_upload(
+    request: Request, body: UploadConfirmRequest, service: FileManagementService = Depends(get_file_manager)
+):
+    user_id = request.session.get("user_id")
+    try:
+        upload = await pending_uploads.get(body.upload_id, user_id)
+        if not upload:
+            return JSONResponse(status_code=404, content={"message": ResponseErrorMessage.UPLOAD_DOES_NOT_EXIST})
+        if not await pending_uploads.claim(body.upload_id):
+            return JSONResponse(status_code=409, content={"message": ResponseErrorMessage.UPLOAD_CONFIRM_IN_PROGRESS})
+    except Exception as e:
+        logger.error(f"Upload Confirm Error: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=ResponseErrorMessage.INTERNAL_ERROR)
+
+    try:
+        new_file = await service.confirm_upload(upload["s3_key"], upload["file_name"], user_id)
+        if not new_file:
+            await pending_uploads.release(body.upload_id)
+            return JSONResponse(status_code=409, content={"message": ResponseErrorMessage.UPLOAD_NOT_COMPLETED})
+
+        await pending_uploads.delete(body.upload_id)
+        return new_file
+    except HTTPException as e:
+        await pending_uploads.delete(body.upload_id)
+        raise e
+    except Exception as e:
+        logger.error(f"Upload Confirm Error: {str(e)}", exc_info=True)
+        await pending_uploads.release(body.upload_id)
+        raise HTTPException(status_code=500, detail=ResponseErrorMessage.INTERNAL_ERROR)
+
+
+@router.post("/uploads", dependencies=[Depends(blacklist_check)], status_code=201)
+async def create_resumable_upload(
+    request: Request, body: ResumableUploadRequest, service: FileManagementService = Depends(get_file_manager)
+):
+    if not FileValidator().validate_metadata(body.file_name, body.file_size):
+        logger.warning("File Upload Validation Error")
+        raise HTTPException(status_code=400, detail=invalid_file)
+
+    try:
+        upload = await service.start_resumable_upload(body.file_name)
+        await resumable_uploads.create(
+            upload["upload_id"],
+            request.session.get("user_id"),
+            upload["s3_key"],
+            body.file_name,
+            body.file_size,
+            upload["multipart_id"],
+        )
+        return resumable_upload_status(upload["upload_id"], {"file_size": body.file_size, "parts": {}})
+    except Exception as e:
+        logger.error(f"Resumable Upload Error: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=ResponseErrorMessage.INTERNAL_ERROR)
+
+
+@router.get("/uploads/{upload_id}", dependencies=[Depends(blacklist_check)], status_code=200)
+async def get_resumable_upload(request: Request, upload_id: str):
+    try:
+        upload = await resumable_uploads.get(upload_id, request.session.get("user_id"))
+        if not upload:
+            return JSONResponse(status_code=404, content={"message": ResponseErrorMessage.UPLOAD_DOES_NOT_EXIST})
+
+        return resumable_upload_status(upload_id, upload)
+    except Exception as e:
+        logger.error(f"Resumable Upload Error: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=ResponseErrorMessage.INTERNAL_ERROR)
+
+
+@router.put("/uploads/{upload_id}", dependencies=[Depends(blacklist_check)], status_code=200)
+async def upload_chunk(
+    request: Request, upload_id: str, offset: int, service: FileManagementService = Depends(get_file_manager)
+):
+    try:
+        upload = await resumable_uploads.get(upload_id, request.session.get("user_id"))
+        if not upload:
+            return JSONResponse(status_code=404, content={"message": ResponseErrorMessage.UPLOAD_DOES_NOT_EXIST})
+
+        async with upload_admission.admit(request.session.get("user_id"), UPLOAD_CHUNK_SIZE):
+            chunk = await read_chunk(request, UPLOAD_CHUNK_SIZE)
+            try:
+                length = len(chunk) if chunk is not None else -1
+                part_number = chunk_part_number(offset, length, upload["file_size"], UPLOAD_CHUNK_SIZE)
+            except ValueError:
+                return JSONResponse(status_code=400, content={"message": ResponseErrorMessage.INVALID_CHUNK})
+            if part_number == 1 and not FileValidator().content_matches_type(upload["file_name"], chunk):
+                logger.warning("File Upload Validation Error")
+                raise HTTPException(status_code=400, detail=invalid_file)
+
+            etag = await service.upload_chunk(upload, part_number, chunk)
+        await resumable_uploads.add_part(upload_id, part_number, etag)
+        upload["parts"][part_number] = etag
+
+        return resumable_upload_status(upload_id, upload)
+    except HTTPException as e:
+        raise e
+    except Exception as e:
+        logger.error(f"Chunk Upload Error: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=ResponseErrorMessage.INTERNAL_ERROR)
+
+
+@router.post("/uploads/{upload_id}/complete", dependencies=[Depends(blacklist_check)], status_code=201)
+async def complete_resumable_upload(
+    request: Request, upload_id: str, service: FileManagementService = Depends(get_file_manager)
+):
+    user_id = request.session.get("user_id")
+    try:
+        upload = await resumable_uploads.get(upload_id, user_id)
+        if not upload:
+            return JSONResponse(status_code=404, content={"message": ResponseErrorMessage.UPLOAD_DOES_NOT_EXIST})
+        if missing_parts(upload, UPLOAD_CHUNK_SIZE):
+            return JSONResponse(
+                status_code=409,
+                content={
+                    "message": ResponseErrorMessage.UPLOAD_NOT_COMPLETED,
+                    "offset": received_offset(upload, UPLOAD_CHUNK_SIZE),
+                },
+            )
+
+        new_file = await service.complete_resumable_upload(upload, user_id)
+        await resumable_uploads.delete(upload_id)
+        return new_file
+    except Exception as e:
+        logger.error(f"Resumable Upload Error: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=ResponseErrorMessage.INTERNAL_ERROR)
+
+
+@router.delete("/uploads/{upload_id}", dependencies=[Depends(blacklist_check)], status_code=204)
+async def abort_resumable_upload(
+    request: Request, upload_id: str, service: FileManagementService = Depends(get_file_manager)
+):
+    try:
+        upload = await resumable_uploads.get(upload_id, request.session.get("user_id"))
+        if not upload:
+            return JSONResponse(status_code=404, content={"message": ResponseErrorMessage.UPLOAD_DOES_NOT_EXIST})
+
+        await service.abort_resumable_upload(upload)
+        await resumable_uploads.delete(upload_id)
+    except Exception as e:
+        logger.error(f"Resumable Upload Error: {str(e)}", exc_info=True)
         raise HTTPException(status_code=500, detail=ResponseErrorMessage.INTERNAL_ERROR)
 
 
@@ -83,24 +389,62 @@ async def remove_file(request: Request, file_id: int, service: FileManagementSer
         raise HTTPException(status_code=500, detail=ResponseErrorMessage.INTERNAL_ERROR)
 
 
+@router.post("/remove", dependencies=[Depends(blacklist_check)], status_code=200)
+async def remove_files(
+    request: Request, body: BulkRemoveRequest, service: FileManagementService = Depends(get_file_manager)
+):
+    try:
+        return await service.remove_files(body.file_ids, request.session.get("user_id"))
+    except Exception as e:
+        logger.error(f"Bulk File Remove Error: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=ResponseErrorMessage.INTERNAL_ERROR)
+
+
 @router.post("/convert", dependencies=[Depends(blacklist_check)], status_code=201)
 async def convert_file(
-    request: ConvertFileRequest, fapi_req: Request, service: FileManagementService = Depends(get_file_manager)
+    request: ConvertFileRequest,
+    fapi_req: Request,
+    async_mode: bool = False,
+    service: FileManagementService = Depends(get_file_manager),
+    db: AsyncSession = Depends(get_db),
 ):
-    s3_key = request.s3_key
     user_id = fapi_req.session.get("user_id")
     response_generator = ResponseGeneratorService(file_manager_service=service)
 
     try:
-        request_body = request.model_dump()
-        request_body["callback_url"] = settings.CONVERTER_WEBHOOK_URL
+        is_user_file = await service.check_user_file(s3_key=request.s3_key, user_id=user_id)
+        if not is_user_file:
+            logger.warning(f"{ResponseErrorMessage.FILE_DOES_NOT_EXIST}, File key: {request.s3_key}")
+            return JSONResponse(status_code=400, content={"message": ResponseErrorMessage.FILE_DOES_NOT_EXIST})
+
+        s3_key = await service.detach_shared_object(request.s3_key, user_id)
+        formats = {"format_from": request.format_from, "format_to": request.format_to}
+        digest, cached_result = await result_cache.lookup(db, "file_conversion", s3_key, **formats)
+        if cached_result:
+            cached_result = await service.apply_cached_conversion(s3_key, cached_result)
+            if cached_result:
+                return await cached_result_response(
+                    fapi_req, "file_conversion", s3_key, cached_result, async_mode, response_generator, use_s3=True
+                )
+            await result_cache.discard(db, digest)
+
+        request_body = {**request.model_dump(), "s3_key": s3_key}
+        request_body["callback_url"] = with_result_digest(settings.CONVERTER_WEBHOOK_URL, digest)
         request_body = json.dumps(request_body)
+        job_id = await job_store.create(user_id, "file_conversion", s3_key) if async_mode else None
 
-        message, is_sent = await send_message_to_sqs(settings.AWS_SQS_QUEUE_CONVERTER_URL, request_body)
+        message, is_sent = await enqueue_once(
+            "file_conversion", s3_key, JobQueue.CONVERTER, request_body, db, **formats
+        )
         if not is_sent:
             logger.error(message)
+            if job_id:
+                await job_store.delete(job_id)
             return JSONResponse(status_code=500, content={"message": message})
 
+        if async_mode:
+            return job_accepted_response(fapi_req, job_id)
+
         cashed_data = await wait_for_cache(s3_key, "file_conversion")
         logger.info(cashed_data)
         return await response_generator.generate_response(cashed_data, use_s3=True)
@@ -112,7 +456,11 @@ async def convert_file(
 
 @router.post("/parse-file")
 async def parse_file(
-    request: FileParserRequest, fapi_req: Request, service: FileManagementService = Depends(get_file_manager)
+    request: FileParserRequest,
+    fapi_req: Request,
+    async_mode: bool = False,
+    service: FileManagementService = Depends(get_file_manager),
+    db: AsyncSession = Depends(get_db),
 ):
     s3_key = request.s3_key
     user_id = fapi_req.session.get("user_id")
@@ -124,15 +472,31 @@ async def parse_file(
             logger.warning(f"{ResponseErrorMessage.FILE_DOES_NOT_EXIST}, File key: {s3_key}")
             return JSONResponse(status_code=400, content={"message": ResponseErrorMessage.FILE_DOES_NOT_EXIST})
 
+        keywords = sorted(set(request.keywords))
+        digest, cached_result = await result_cache.lookup(db, "file_parsing", s3_key, keywords=keywords)
+        if cached_result:
+            cached_result = {**cached_result, "s3_key": s3_key}
+            return await cached_result_response(
+                fapi_req, "file_parsing", s3_key, cached_result, async_mode, response_generator
+            )
+
         request_body = request.model_dump()
-        request_body["callback_url"] = settings.FILE_PARSER_WEBHOOK_URL
+        request_body["callback_url"] = with_result_digest(settings.FILE_PARSER_WEBHOOK_URL, digest)
         request_body = json.dumps(request_body)
+        job_id = await job_store.create(user_id, "file_parsing", s3_key) if async_mode else None
 
-        message, is_sent = await send_message_to_sqs(settings.AWS_SQS_QUEUE_CONVERTER_URL, request_body)
+        message, is_sent = await enqueue_once(
+            "file_parsing", s3_key, JobQueue.CONVERTER, request_body, db, keywords=keywords
+        )
         if not is_sent:
             logger.error(message)
+            if job_id:
+                await job_store.delete(job_id)
             return JSONResponse(status_code=500, content={"message": message})
 
+        if async_mode:
+            return job_accepted_response(fapi_req, job_id)
+
         cashed_data = await wait_for_cache(s3_key, "file_parsing")
         return await response_generator.generate_response(cashed_data)
 
@@ -143,7 +507,11 @@ async def parse_file(
 
 @router.post("/tonality-analysis", dependencies=[Depends(blacklist_check)], status_code=201)
 async def process_tonality_analysis(
-    request: FileTonalityAnalysisRequest, fapi_req: Request, service: FileManagementService = Depends(get_file_manager)
+    request: FileTonalityAnalysisRequest,
+    fapi_req: Request,
+    async_mode: bool = False,
+    service: FileManagementService = Depends(get_file_manager),
+    db: AsyncSession = Depends(get_db),
 ):
     s3_key = request.s3_key
     user_id = fapi_req.session.get("user_id")
@@ -155,18 +523,51 @@ async def process_tonality_analysis(
             logger.warning(f"{ResponseErrorMessage.FILE_DOES_NOT_EXIST}, File key: {s3_key}")
             return JSONResponse(status_code=400, content={"message": ResponseErrorMessage.FILE_DOES_NOT_EXIST})
 
+        digest, cached_result = await result_cache.lookup(db, "tonality_analysis", s3_key)
+        if cached_result:
+            cached_result = {**cached_result, "s3_key": s3_key}
+            return await cached_result_response(
+                fapi_req, "tonality_analysis", s3_key, cached_result, async_mode, response_generator
+            )
+
         request_body = request.model_dump()
-        request_body["callback_url"] = settings.ANALYSIS_WEBHOOK_URL
+        request_body["callback_url"] = with_result_digest(settings.ANALYSIS_WEBHOOK_URL, digest)
         request_body = json.dumps(request_body)
+        job_id = await job_store.create(user_id, "tonality_analysis", s3_key) if async_mode else None
 
-        message, is_sent = await send_message_to_sqs(settings.AWS_SQS_QUEUE_ANALYSIS_URL, request_body)
+        message, is_sent = await enqueue_once("tonality_analysis", s3_key, JobQueue.ANALYSIS, request_body, db)
         if not is_sent:
             logger.error(message)
+            if job_id:
+                await job_store.delete(job_id)
             return JSONResponse(status_code=500, content={"message": message})
 
+        if async_mode:
+            return job_accepted_response(fapi_req, job_id)
+
         cashed_data = await wait_for_cache(s3_key, "tonality_analysis")
         return await response_generator.generate_response(cashed_data)
 
     except Exception as e:
         logger.error(f"File tonality analysis error: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=ResponseErrorMessage.INTERNAL_ERROR)
+
+
+@router.get("/jobs/{job_id}", dependencies=[Depends(blacklist_check)], status_code=200)
+async def job_status(job_id: str, request: Request, service: FileManagementService = Depends(get_file_manager)):
+    try:
+        job = await job_store.get(job_id)
+        if not job or job["user_id"] != request.session.get("user_id"):
+            return JSONResponse(status_code=404, content={"message": ResponseErrorMessage.JOB_DOES_NOT_EXIST})
+
+        if job["status"] == JobStatus.PENDING:
+            return {"job_id": job_id, "status": job["status"]}
+
+        response_generator = ResponseGeneratorService(file_manager_service=service)
+        use_s3 = job["job_type"] == "file_conversion"
+        result = await response_generator.generate_response(job["result"], use_s3=use_s3)
+        return {"job_id": job_id, "status": job["status"], "result": result}
+
+    except Exception as e:
+        logger.error(f"Job status error: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=ResponseErrorMessage.INTERNAL_ERROR)
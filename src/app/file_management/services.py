@@ -1,14 +1,34 @@
+import asyncio
+import hashlib
 import uuid
+import zlib
+from pathlib import PurePath
 
-from botocore.exceptions import NoCredentialsError, PartialCredentialsError
+from botocore.exceptions import ClientError, NoCredentialsError, PartialCredentialsError
 from fastapi import HTTPException
-from sqlalchemy import select
+from sqlalchemy import select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import func
 from starlette.responses import JSONResponse
 
+from src.app.constants import (
+    BATCH_UPLOAD_CONCURRENCY,
+    COMPRESSIBLE_FORMATS,
+    CONTENT_SNIFF_BYTES,
+    GZIP_WBITS,
+    MAX_FILE_SIZE_BYTES,
+    UPLOAD_CHUNK_SIZE,
+    STORAGE_PAGE_SIZE,
+)
 from src.app.file_management.models import File as FileModel
+from src.app.file_management.reaper import file_reaper
+from src.app.file_management.pagination import decode_cursor, encode_cursor
+from src.app.file_management.results import converted_content_hash
+from src.app.file_management.url_cache import presigned_url_cache
+from src.app.validators.file_validation import FileValidator, invalid_file
 from src.app.responses.statuses import ResponseErrorMessage
-from src.app.aws.clients import s3_client
+from src.app.aws import aws_executor, s3_client
+from src.app.aws.multipart import MultipartUploader
 from src.settings.config import settings, logger
 
 
@@ -16,31 +36,68 @@ class FileManagementService:
     def __init__(self, db: AsyncSession):
         self.db = db
         self.s3_client = s3_client
+        self.url_cache = presigned_url_cache
         self.bucket = settings.AWS_S3_BUCKET_NAME
         self.region = settings.AWS_REGION
 
-    async def get_files_history(self, user_id: int):
-        user_files = await self.db.execute(select(FileModel).filter_by(user_id=user_id))
-        files = user_files.scalars().all()
+    async def get_files_history(self, user_id: int, limit: int = STORAGE_PAGE_SIZE, cursor: str | None = None):
+        """
+        Returns one page of the user's files, newest first, and the cursor of the next page (`items` is empty
+        when the user has no files).
+        Pages are keyset-paginated on `(uploaded_at, id)`, raises ValueError for an invalid cursor.
+        """
+        stmt = (
+            select(FileModel.id, FileModel.file_name, FileModel.s3_url, FileModel.s3_key, FileModel.uploaded_at)
+            .filter(FileModel.user_id == user_id, FileModel.deleted_at.is_(None))
+            .order_by(FileModel.uploaded_at.desc(), FileModel.id.desc())
+            .limit(limit + 1)
+        )
+        if cursor:
+            uploaded_at, file_id = decode_cursor(cursor)
+            stmt = stmt.filter(tuple_(FileModel.uploaded_at, FileModel.id) < tuple_(uploaded_at, file_id))
 
-        if not files:
-            return {"detail": "The files have not been uploaded yet"}
+        result = await self.db.execute(stmt)
+        files = [dict(row) for row in result.mappings().all()]
+
+        next_cursor = None
+        if len(files) > limit:
+            files = files[:limit]
+            next_cursor = encode_cursor(files[-1]["uploaded_at"], files[-1]["id"])
 
-        return files
+        return {"items": files, "next_cursor": next_cursor}
 
     async def add_file(self, file, user_id: int):
-        file_content = await file.read()
         original_file_name = file.filename
+        file_uuid = str(uuid.uuid4())
+        content_hash = await self._hash_upload(file)
+
+        shared_object = await self.find_shared_object(content_hash, original_file_name, user_id)
+        await self.db.commit()  # ends the lookup transaction, no pooled connection is held during the transfer
+        if shared_object and not await self._lock_shared_objects({shared_object[0]}):
+            await self.db.commit()  # removed since the lookup, the upload gets its own object
+            shared_object = None
 
-        s3_file_name = f"{str(uuid.uuid4())}_{original_file_name}"
-        file_url = await self._upload_to_s3(s3_file_name, file_content)
+        if shared_object:
+            s3_file_name, content_encoding = shared_object
+            file_url = {
+                "status": "success",
+                "file_url": self._object_url(s3_file_name),
+                "content_encoding": content_encoding,
+            }
+        else:
+            s3_file_name = f"{file_uuid}_{original_file_name}"
+            await file.seek(0)
+            file_url = await self._stream_to_s3(s3_file_name, file)
 
         if file_url["status"] == "success":
             new_file = FileModel(
                 file_name=original_file_name,
                 s3_url=file_url["file_url"],
                 s3_key=s3_file_name,
+                file_uuid=file_uuid,
                 user_id=user_id,
+                content_hash=content_hash,
+                content_encoding=file_url["content_encoding"],
             )
             self.db.add(new_file)
             await self.db.commit()
@@ -49,26 +106,303 @@ class FileManagementService:
 
         return file_url
 
-    async def download_file(self, file_id: int = None, user_id: int = None, s3_key: str = None):
-        file = None
+    async def add_files(self, files: list, user_id: int) -> dict:
+        """
+        Uploads a batch of files. Every file is validated and hashed, new content is transferred to S3 with at
+        most BATCH_UPLOAD_CONCURRENCY concurrent uploads (identical files in the batch share one object, see
+        `find_shared_object`) and the rows of all transferred files are added with one commit.
+        Returns the added files and the files that failed with the reason.
+
+        No transaction is open during the transfers: the shared objects are locked right before the rows are
+        added, and files whose shared object was removed in the meantime are transferred as new objects.
+        """
+        accepted, failed = [], []
+        for file in files:
+            validator = FileValidator()
+            if not (validator.validate_file(file) and await validator.validate_content(file)):
+                failed.append({"file_name": file.filename, "detail": invalid_file})
+                continue
+            try:
+                accepted.append((file, await self._hash_upload(file)))
+            except HTTPException as e:
+                failed.append({"file_name": file.filename, "detail": e.detail})
+
+        shared_objects = await self._find_shared_objects({content_hash for _, content_hash in accepted}, user_id)
+        await self.db.commit()  # ends the lookup transaction, no pooled connection is held during the transfers
+
+        file_uuids = [str(uuid.uuid4()) for _ in accepted]
+        transferred_keys, failed_keys = set(), {}
+        while True:
+            transfers = {}
+            for (file, content_hash), file_uuid in zip(accepted, file_uuids):
+                content_id = (content_hash, PurePath(file.filename).suffix)
+                if content_id not in shared_objects:
+                    s3_key = f"{file_uuid}_{file.filename}"
+                    shared_objects[content_id] = (s3_key, self._content_encoding(s3_key))
+                    transfers[s3_key] = file
+
+            failed_keys.update(await self._transfer_files(transfers))
+            transferred_keys.update(transfers)
+
+            shared_keys = {s3_key for s3_key, _ in shared_objects.values()} - transferred_keys
+            if not shared_keys:
+                break
+
+            removed_keys = shared_keys - await self._lock_shared_objects(shared_keys)
+            if not removed_keys:
+                break
+
+            await self.db.commit()  # releases the locks, the files of removed objects get their own objects
+            shared_objects = {
+                content_id: shared for content_id, shared in shared_objects.items() if shared[0] not in removed_keys
+            }
+
+        uploaded = []
+        for (file, content_hash), file_uuid in zip(accepted, file_uuids):
+            s3_key, content_encoding = shared_objects[(content_hash, PurePath(file.filename).suffix)]
+            if s3_key in failed_keys:
+                failed.append({"file_name": file.filename, "detail": failed_keys[s3_key]})
+                continue
+
+            uploaded.append(
+                FileModel(
+                    file_name=file.filename,
+                    s3_url=self._object_url(s3_key),
+                    s3_key=s3_key,
+                    file_uuid=file_uuid,
+                    user_id=user_id,
+                    content_hash=content_hash,
+                    content_encoding=content_encoding,
+                )
+            )
+
+        self.db.add_all(uploaded)
+        await self.db.commit()
+
+        return {"uploaded": uploaded, "failed": failed}
+
+    async def _transfer_files(self, transfers: dict) -> dict[str, str]:
+        """
+        Streams the files to their keys with at most BATCH_UPLOAD_CONCURRENCY concurrent uploads.
+        Returns the error message of every key that failed.
+        """
+        semaphore = asyncio.Semaphore(BATCH_UPLOAD_CONCURRENCY)
+
+        async def transfer(s3_key: str, file) -> dict:
+            async with semaphore:
+                await file.seek(0)
+                return await self._stream_to_s3(s3_key, file)
+
+        results = await asyncio.gather(*(transfer(s3_key, file) for s3_key, file in transfers.items()))
+        return {
+            s3_key: result["message"] for s3_key, result in zip(transfers, results) if result["status"] != "success"
+        }
+
+    async def find_shared_object(
+        self, content_hash: str, file_name: str, user_id: int
+    ) -> tuple[str, str | None] | None:
+        """
+        Returns `(s3_key, content_encoding)` of a stored object of the user with the same content and extension
+        as an upload, so the upload can reference it instead of writing a new object. Only the user's own files
+        are matched: the key carries the name the object was first uploaded under. An object is shared by every
+        row with its key and only deleted by the reaper once the last of them is purged.
+
+        The lookup takes no lock: the rows referencing the object are locked with `_lock_shared_objects`
+        right before the new row is inserted.
+        """
+        stmt = (
+            select(FileModel.s3_key, FileModel.content_encoding)
+            .filter(
+                FileModel.content_hash == content_hash,
+                FileModel.user_id == user_id,
+                FileModel.deleted_at.is_(None),
+                FileModel.s3_key.endswith(PurePath(file_name).suffix, autoescape=True),
+            )
+            .limit(1)
+        )
+        return (await self.db.execute(stmt)).tuples().first()
+
+    async def _find_shared_objects(
+        self, content_hashes: set[str], user_id: int
+    ) -> dict[tuple[str, str], tuple[str, str | None]]:
+        """`find_shared_object` for a batch, keyed by `(content_hash, extension)`."""
+        if not content_hashes:
+            return {}
 
+        stmt = select(FileModel.content_hash, FileModel.s3_key, FileModel.content_encoding).filter(
+            FileModel.content_hash.in_(content_hashes),
+            FileModel.user_id == user_id,
+            FileModel.deleted_at.is_(None),
+        )
+        result = await self.db.execute(stmt)
+        return {
+            (content_hash, PurePath(s3_key).suffix): (s3_key, content_encoding)
+            for content_hash, s3_key, content_encoding in result.tuples().all()
+        }
+
+    async def _lock_shared_objects(self, s3_keys: set[str]) -> set[str]:
+        """
+        Locks the live rows referencing the keys FOR SHARE until the new rows are committed, so the objects
+        cannot be removed and reaped in between. Returns the keys that are still referenced.
+        """
+        stmt = (
+            select(FileModel.s3_key)
+            .filter(FileModel.s3_key.in_(s3_keys), FileModel.deleted_at.is_(None))
+            .with_for_update(read=True)
+        )
+        return set((await self.db.execute(stmt)).scalars().all())
+
+    async def detach_shared_object(self, s3_key: str, user_id: int) -> str:
+        """
+        Copies a shared object to a key of the user's own file before a job replaces it (copy-on-write),
+        the converter webhook finds the file to update by the uuid prefix of the key.
+        Returns the key the job has to run on.
+
+        When several files of the user share the key, the job acts on the file the key was created for
+        (its `file_uuid` prefixes the key), which is converted in place; otherwise on the oldest one.
+        """
+        stmt = (
+            select(FileModel)
+            .filter(FileModel.s3_key == s3_key, FileModel.user_id == user_id, FileModel.deleted_at.is_(None))
+            .order_by((FileModel.file_uuid == s3_key.split("_")[0]).desc(), FileModel.id)
+            .limit(1)
+        )
+        file = await self.db.scalar(stmt)
+        if not file or s3_key.startswith(f"{file.file_uuid}_"):
+            return s3_key
+
+        own_key = f"{file.file_uuid}_{file.file_name}"
+        await self.s3_client.copy_object(
+            Bucket=self.bucket, Key=own_key, CopySource={"Bucket": self.bucket, "Key": s3_key}
+        )
+        file.s3_key = own_key
+        file.s3_url = self._object_url(own_key)
+        await self.db.commit()
+
+        return own_key
+
+    async def create_upload_url(self, file_name: str, file_size: int) -> dict:
+        """Returns a presigned POST policy to upload the file straight to S3, see `confirm_upload`."""
+        file_uuid = str(uuid.uuid4())
+        s3_key = f"{file_uuid}_{file_name}"
+        post = await self.s3_client.generate_presigned_post(
+            Bucket=self.bucket,
+            Key=s3_key,
+            Conditions=[["content-length-range", 1, file_size]],
+            ExpiresIn=settings.UPLOAD_URL_EXPIRES_IN,
+        )
+
+        return {
+            "upload_id": file_uuid,
+            "s3_key": s3_key,
+            "url": post["url"],
+            "fields": post["fields"],
+            "expires_in": settings.UPLOAD_URL_EXPIRES_IN,
+        }
+
+    async def confirm_upload(self, s3_key: str, file_name: str, user_id: int) -> FileModel | None:
+        """
+        Registers a file uploaded with `create_upload_url` once its object exists in S3.
+        Returns None while the object is missing; an object failing validation is deleted.
+        """
+        try:
+            head = await self.s3_client.head_object(Bucket=self.bucket, Key=s3_key)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise
+
+        validator = FileValidator()
+        is_valid_file = validator.validate_metadata(file_name, head["ContentLength"])
+        if is_valid_file:
+            is_valid_file = validator.content_matches_type(file_name, await self._read_object_head(s3_key))
+        if not is_valid_file:
+            await self.s3_client.delete_object(Bucket=self.bucket, Key=s3_key)
+            raise HTTPException(status_code=400, detail=invalid_file)
+
+        return await self._register_file(s3_key, file_name, user_id)
+
+    async def start_resumable_upload(self, file_name: str) -> dict:
+        """Creates the S3 multipart upload backing a resumable upload, see `ResumableUploadStore`."""
+        file_uuid = str(uuid.uuid4())
+        s3_key = f"{file_uuid}_{file_name}"
+        response = await self.s3_client.create_multipart_upload(Bucket=self.bucket, Key=s3_key)
+
+        return {"upload_id": file_uuid, "s3_key": s3_key, "multipart_id": response["UploadId"]}
+
+    async def upload_chunk(self, upload: dict, part_number: int, body: bytes) -> str:
+        response = await self.s3_client.upload_part(
+            Bucket=self.bucket,
+            Key=upload["s3_key"],
+            PartNumber=part_number,
+            UploadId=upload["multipart_id"],
+            Body=body,
+        )
+        return response["ETag"]
+
+    async def complete_resumable_upload(self, upload: dict, user_id: int) -> FileModel:
+        parts = [{"ETag": etag, "PartNumber": part_number} for part_number, etag in sorted(upload["parts"].items())]
+        await self.s3_client.complete_multipart_upload(
+            Bucket=self.bucket,
+            Key=upload["s3_key"],
+            UploadId=upload["multipart_id"],
+            MultipartUpload={"Parts": parts},
+        )
+
+        return await self._register_file(upload["s3_key"], upload["file_name"], user_id)
+
+    async def abort_resumable_upload(self, upload: dict) -> None:
+        await self.s3_client.abort_multipart_upload(
+            Bucket=self.bucket, Key=upload["s3_key"], UploadId=upload["multipart_id"]
+        )
+
+    async def _read_object_head(self, s3_key: str) -> bytes:
+        """Reads the first CONTENT_SNIFF_BYTES of an object with a ranged GET."""
+        response = await self.s3_client.get_object(
+            Bucket=self.bucket, Key=s3_key, Range=f"bytes=0-{CONTENT_SNIFF_BYTES - 1}"
+        )
+        return await asyncio.get_running_loop().run_in_executor(aws_executor, response["Body"].read)
+
+    async def _register_file(self, s3_key: str, file_name: str, user_id: int) -> FileModel:
+        """Adds the row of a file whose object was written to S3 by the client, its content hash is unknown."""
+        new_file = FileModel(
+            file_name=file_name,
+            s3_url=self._object_url(s3_key),
+            s3_key=s3_key,
+            file_uuid=s3_key.split("_")[0],
+            user_id=user_id,
+        )
+        self.db.add(new_file)
+        await self.db.commit()
+
+        return new_file
+
+    async def download_file(self, file_id: int = None, user_id: int = None, s3_key: str = None):
         # if not s3_key and (not file_id or not user_id):
         #     return JSONResponse(status_code=400, content={"message": ResponseErrorMessage.AWS_MISSED_DOWNLOAD_AGS})
 
+        content_encoding = None
         if not s3_key:
-            stmt = select(FileModel).filter(FileModel.id == file_id, FileModel.user_id == user_id)
+            stmt = select(FileModel.s3_key, FileModel.content_encoding).filter(
+                FileModel.id == file_id, FileModel.user_id == user_id, FileModel.deleted_at.is_(None)
+            )
             result = await self.db.execute(stmt)
-            file = result.scalar_one_or_none()
+            file = result.first()
 
             if not file:
                 return JSONResponse(status_code=404, content={"message": ResponseErrorMessage.FILE_DOES_NOT_EXIST})
+            s3_key, content_encoding = file
+
+        params = {"Bucket": self.bucket, "Key": s3_key}
+        if content_encoding:
+            # Compressed objects are served with their encoding, so clients decompress them transparently
+            params["ResponseContentEncoding"] = content_encoding
+
+        async def sign(expires_in: int) -> str:
+            return await self.s3_client.generate_presigned_url("get_object", Params=params, ExpiresIn=expires_in)
 
         try:
-            presigned_url = self.s3_client.generate_presigned_url(
-                "get_object",
-                Params={"Bucket": self.bucket, "Key": s3_key or file.s3_key},
-                ExpiresIn=1800,
-            )
+            presigned_url = await self.url_cache.get_or_sign(s3_key, sign)
             return {"file_url": presigned_url}
 
         except NoCredentialsError:
@@ -82,38 +416,63 @@ class FileManagementService:
             return {"status": "error", "message": str(e)}
 
     async def remove_file(self, file_id: int, user_id: int):
-        stmt = select(FileModel).filter(FileModel.id == file_id, FileModel.user_id == user_id)
-        result = await self.db.execute(stmt)
-        file: FileModel = result.scalar_one_or_none()
-
-        if not file:
-            raise HTTPException(status_code=404, detail="File does not exist")
-
+        """Soft-deletes the file; its S3 object and row are removed later by the `FileReaper`."""
+        stmt = (
+            update(FileModel)
+            .where(FileModel.id == file_id, FileModel.user_id == user_id, FileModel.deleted_at.is_(None))
+            .values(deleted_at=func.now())
+            .returning(FileModel.s3_key)
+        )
         try:
-            self.s3_client.delete_object(Bucket=self.bucket, Key=file.s3_key)
-        except NoCredentialsError:
-            logger.error(ResponseErrorMessage.AWS_MISSED_CREDENTIALS, exc_info=True)
-            return {"status": "error", "message": ResponseErrorMessage.INTERNAL_ERROR}
-        except PartialCredentialsError:
-            logger.error(ResponseErrorMessage.AWS_INCOMPLETE_CREDENTIALS, exc_info=True)
-            return {"status": "error", "message": ResponseErrorMessage.INTERNAL_ERROR}
-        except Exception as e:
-            logger.error(f"Unexpected download error: {str(e)}", exc_info=True)
-            return {"status": "error", "message": str(e)}
-
-        try:
-            await self.db.delete(file)
+            s3_key = (await self.db.execute(stmt)).scalar_one_or_none()
             await self.db.commit()
-            return {"detail": "File deleted successfully"}
         except Exception:
             await self.db.rollback()
             raise HTTPException(status_code=500, detail="Failed to delete file from database")
 
+        if not s3_key:
+            raise HTTPException(status_code=404, detail="File does not exist")
+
+        await self.url_cache.invalidate(s3_key)
+        file_reaper.notify()
+        return {"detail": "File deleted successfully"}
+
+    async def remove_files(self, file_ids: list[int], user_id: int) -> dict:
+        """
+        Soft-deletes several files of the user with a single `UPDATE ... RETURNING`. Returns the removed
+        ids and a failure per file that was not found.
+        """
+        file_ids = list(dict.fromkeys(file_ids))
+        stmt = (
+            update(FileModel)
+            .where(FileModel.id.in_(file_ids), FileModel.user_id == user_id, FileModel.deleted_at.is_(None))
+            .values(deleted_at=func.now())
+            .returning(FileModel.id, FileModel.s3_key)
+        )
+        removed = dict((await self.db.execute(stmt)).tuples().all())
+        await self.db.commit()
+
+        if removed:
+            await self.url_cache.invalidate(*removed.values())
+            file_reaper.notify()
+
+        return {
+            "deleted": [file_id for file_id in file_ids if file_id in removed],
+            "failed": [
+                {"file_id": file_id, "message": ResponseErrorMessage.FILE_DOES_NOT_EXIST}
+                for file_id in file_ids
+                if file_id not in removed
+            ],
+        }
+
     async def check_user_file(self, s3_key: str, user_id: int) -> bool:
-        stmt = select(FileModel).filter(FileModel.s3_key == s3_key, FileModel.user_id == user_id)
+        stmt = (
+            select(FileModel.id)
+            .filter(FileModel.s3_key == s3_key, FileModel.user_id == user_id, FileModel.deleted_at.is_(None))
+            .limit(1)
+        )
         result = await self.db.execute(stmt)
-        file = result.scalar_one_or_none()
-        return file is not None
+        return result.scalar_one_or_none() is not None
 
     async def validate_file_access(self, s3_key: str, user_id: int) -> JSONResponse | None:
         is_user_file = await self.check_user_file(s3_key=s3_key, user_id=user_id)
@@ -122,19 +481,95 @@ class FileManagementService:
             return JSONResponse(status_code=400, content={"message": ResponseErrorMessage.FILE_DOES_NOT_EXIST})
 
     async def find_file_by_uuid(self, s3_key: str) -> FileModel | None:
-        file_uuid_code = s3_key.split("_")[0]
-        stmt = select(FileModel).filter(FileModel.s3_key.startswith(file_uuid_code))
+        file_uuid = s3_key.split("_")[0]
+        stmt = select(FileModel).filter(FileModel.file_uuid == file_uuid, FileModel.deleted_at.is_(None))
         result = await self.db.execute(stmt)
         file: FileModel = result.scalar_one_or_none()
 
         return file
 
-    async def _upload_to_s3(self, file_name: str, file_content: bytes):
+    async def apply_cached_conversion(self, s3_key: str, result: dict) -> dict | None:
+        """
+        Serves a conversion from the result cache by copying the cached converted object next to `s3_key`
+        and updating the file row the same way the converter webhook does.
+
+        Returns the conversion result for `s3_key`, or None when the cached object is gone.
+        """
+        file = await self.find_file_by_uuid(s3_key=s3_key)
+        if not file:
+            return None
+
+        source_key = result["new_s3_key"]
+        new_s3_key = f"{PurePath(s3_key).stem}{PurePath(source_key).suffix}"
         try:
-            self.s3_client.put_object(Bucket=self.bucket, Key=file_name, Body=file_content)
-            file_url = f"https://{self.bucket}.s3.{self.region}.amazonaws.com/{file_name}"
-            return {"status": "success", "file_url": file_url}
+            if source_key != new_s3_key:
+                await self.s3_client.copy_object(
+                    Bucket=self.bucket, Key=new_s3_key, CopySource={"Bucket": self.bucket, "Key": source_key}
+                )
+        except ClientError as e:
+            logger.warning(f"Cached conversion {source_key} is not available: {e}")
+            return None
+
+        file_url = self._object_url(new_s3_key)
+        await self.url_cache.invalidate(file.s3_key)
+        file.file_name = new_s3_key.split("_")[1]
+        file.s3_url = file_url
+        file.s3_key = new_s3_key
+        file.content_hash = converted_content_hash(file.content_hash, new_s3_key)
+        file.content_encoding = None
+        await self.db.commit()
+
+        return {**result, "file_url": file_url, "new_s3_key": new_s3_key, "s3_key": new_s3_key}
+
+    async def _hash_upload(self, file) -> str:
+        """
+        Reads the upload once to compute the SHA-256 of its content, raising 413 as soon as
+        MAX_FILE_SIZE_BYTES is exceeded. The upload is spooled locally, so nothing is sent anywhere yet.
+        """
+        content_hash = hashlib.sha256()
+        read_size = 0
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            read_size += len(chunk)
+            if read_size > MAX_FILE_SIZE_BYTES:
+                logger.warning(f"{ResponseErrorMessage.FILE_TOO_LARGE}, File: {file.filename}")
+                raise HTTPException(status_code=413, detail=ResponseErrorMessage.FILE_TOO_LARGE)
+            content_hash.update(chunk)
+
+        return content_hash.hexdigest()
 
+    async def _stream_to_s3(self, file_name: str, file):
+        """
+        Uploads the file in UPLOAD_CHUNK_SIZE parts, aborting as soon as MAX_FILE_SIZE_BYTES is exceeded.
+        Compressible formats are gzipped on the way when S3_COMPRESSION is enabled, see `_content_encoding`.
+        """
+        content_encoding = self._content_encoding(file_name)
+        extra_args = {"ContentEncoding": content_encoding} if content_encoding else {}
+        uploader = MultipartUploader(
+            self.s3_client, self.bucket, file_name, part_size=UPLOAD_CHUNK_SIZE, extra_args=extra_args
+        )
+        compressor = zlib.compressobj(wbits=GZIP_WBITS) if content_encoding else None
+        uploaded_size = 0
+
+        try:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                uploaded_size += len(chunk)
+                if uploaded_size > MAX_FILE_SIZE_BYTES:
+                    await uploader.abort()
+                    logger.warning(f"{ResponseErrorMessage.FILE_TOO_LARGE}, File key: {file_name}")
+                    raise HTTPException(status_code=413, detail=ResponseErrorMessage.FILE_TOO_LARGE)
+
+                if compressor:
+                    # zlib releases the GIL, so a worker thread keeps compression off the event loop
+                    chunk = await asyncio.to_thread(compressor.compress, chunk)
+                await uploader.write(chunk)
+
+            if compressor:
+                await uploader.write(compressor.flush())
+            await uploader.complete()
+            return {"status": "success", "file_url": self._object_url(file_name), "content_encoding": content_encoding}
+
+        except HTTPException:
+            raise
         except NoCredentialsError:
             logger.error(ResponseErrorMessage.AWS_MISSED_CREDENTIALS, exc_info=True)
             return {"status": "error", "message": ResponseErrorMessage.INTERNAL_ERROR}
@@ -142,5 +577,23 @@ class FileManagementService:
             logger.error(ResponseErrorMessage.AWS_INCOMPLETE_CREDENTIALS, exc_info=True)
             return {"status": "error", "message": ResponseErrorMessage.INTERNAL_ERROR}
         except Exception as e:
-            logger.error(f"Unexpected download error: {str(e)}", exc_info=True)
+            logger.error(f"Unexpected upload error: {str(e)}", exc_info=True)
+            await self._abort_upload(uploader)
             return {"status": "error", "message": str(e)}
+
+    @staticmethod
+    async def _abort_upload(uploader: MultipartUploader) -> None:
+        try:
+            await uploader.abort()
+        except Exception as e:
+            logger.error(f"Failed to abort multipart upload {uploader.key}: {str(e)}", exc_info=True)
+
+    def _object_url(self, s3_key: str) -> str:
+        return f"https://{self.bucket}.s3.{self.region}.amazonaws.com/{s3_key}"
+
+    @staticmethod
+    def _content_encoding(s3_key: str) -> str | None:
+        """Encoding a new object is stored with: gzip for COMPRESSIBLE_FORMATS when S3_COMPRESSION is "gzip"."""
+        if settings.S3_COMPRESSION != "gzip":
+            return None
+        return "gzip" if PurePath(s3_key).suffix.lstrip(".") in COMPRESSIBLE_FORMATS else None
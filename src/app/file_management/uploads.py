@@ -0,0 +1,147 @@
+import json
+
+from src.app.constants import UPLOAD_CHUNK_SIZE, UPLOAD_CONFIRM_CLAIM_TTL
+from src.settings.config import redis, settings
+
+
+class PendingUploadStore:
+    """
+    Keeps track of direct-to-S3 uploads between the presigned POST and the confirm step.
+
+    An upload is stored under `pending_upload:<upload_id>`, where the upload id is the UUID prefix of its
+    S3 key, and expires shortly after its POST policy does. Objects of uploads that are never confirmed
+    are found by the storage reconciliation. A confirm first claims the upload with `SET NX` on
+    `pending_upload_claim:<upload_id>`, so concurrent confirms (e.g. client retries) register it only once.
+    """
+
+    def __init__(
+        self, redis_client, ttl: int = settings.UPLOAD_URL_EXPIRES_IN + 60, claim_ttl: int = UPLOAD_CONFIRM_CLAIM_TTL
+    ):
+        self.redis = redis_client
+        self.ttl = ttl
+        self.claim_ttl = claim_ttl
+
+    async def create(self, upload_id: str, user_id: int, s3_key: str, file_name: str) -> None:
+        upload = {"user_id": user_id, "s3_key": s3_key, "file_name": file_name}
+        await self.redis.set(self._key(upload_id), json.dumps(upload), ex=self.ttl)
+
+    async def get(self, upload_id: str, user_id: int) -> dict | None:
+        """Returns the upload if it exists and belongs to `user_id`."""
+        upload = await self.redis.get(self._key(upload_id))
+        if not upload:
+            return None
+
+        upload = json.loads(upload)
+        return upload if upload["user_id"] == user_id else None
+
+    async def claim(self, upload_id: str) -> bool:
+        """Returns False when another confirm of the upload is in progress."""
+        return bool(await self.redis.set(self._claim_key(upload_id), 1, nx=True, ex=self.claim_ttl))
+
+    async def release(self, upload_id: str) -> None:
+        """Drops the claim of a confirm that did not register the upload, so it can be confirmed again."""
+        await self.redis.delete(self._claim_key(upload_id))
+
+    async def delete(self, upload_id: str) -> None:
+        await self.redis.delete(self._key(upload_id), self._claim_key(upload_id))
+
+    @staticmethod
+    def _key(upload_id: str) -> str:
+        return f"pending_upload:{upload_id}"
+
+    @staticmethod
+    def _claim_key(upload_id: str) -> str:
+        return f"pending_upload_claim:{upload_id}"
+
+
+def chunk_part_number(offset: int, length: int, file_size: int, chunk_size: int = UPLOAD_CHUNK_SIZE) -> int:
+    """
+    Returns the S3 part number of a chunk of a resumable upload, raises ValueError if the chunk does not
+    start on a chunk boundary or is not `chunk_size` long (only the last chunk may be shorter).
+    """
+    if offset < 0 or offset % chunk_size or offset >= file_size:
+        raise ValueError(f"Invalid chunk offset {offset}")
+    if length != min(chunk_size, file_size - offset):
+        raise ValueError(f"Invalid chunk length {length} at offset {offset}")
+
+    return offset // chunk_size + 1
+
+
+def missing_parts(upload: dict, chunk_size: int = UPLOAD_CHUNK_SIZE) -> list[int]:
+    total_parts = -(-upload["file_size"] // chunk_size)
+    return [part for part in range(1, total_parts + 1) if part not in upload["parts"]]
+
+
+def received_offset(upload: dict, chunk_size: int = UPLOAD_CHUNK_SIZE) -> int:
+    """Number of bytes received without a gap from the start of the file, i.e. where the client resumes."""
+    missing = missing_parts(upload, chunk_size)
+    if not missing:
+        return upload["file_size"]
+    return (missing[0] - 1) * chunk_size
+
+
+class ResumableUploadStore:
+    """
+    State of resumable uploads, each backed by an S3 multipart upload.
+
+    An upload is a Redis hash under `resumable_upload:<upload_id>` holding its metadata and one
+    `part:<number>` field with the ETag of every chunk received, so chunks may arrive in any order and
+    a retried chunk simply overwrites its part. The hash expires after `ttl` seconds without a chunk;
+    S3 should abort the orphaned multipart upload with an `AbortIncompleteMultipartUpload` lifecycle rule.
+    """
+
+    def __init__(self, redis_client, ttl: int = settings.RESUMABLE_UPLOAD_TTL):
+        self.redis = redis_client
+        self.ttl = ttl
+
+    async def create(
+        self, upload_id: str, user_id: int, s3_key: str, file_name: str, file_size: int, multipart_id: str
+    ) -> None:
+        upload = {
+            "user_id": user_id,
+            "s3_key": s3_key,
+            "file_name": file_name,
+            "file_size": file_size,
+            "multipart_id": multipart_id,
+        }
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hset(self._key(upload_id), mapping={field: json.dumps(value) for field, value in upload.items()})
+            pipe.expire(self._key(upload_id), self.ttl)
+            await pipe.execute()
+
+    async def get(self, upload_id: str, user_id: int) -> dict | None:
+        """Returns the upload with its received `parts` if it exists and belongs to `user_id`."""
+        fields = await self.redis.hgetall(self._key(upload_id))
+        if not fields:
+            return None
+
+        upload, parts = {}, {}
+        for field, value in fields.items():
+            field = field.decode() if isinstance(field, bytes) else field
+            if field.startswith("part:"):
+                parts[int(field[5:])] = json.loads(value)
+            else:
+                upload[field] = json.loads(value)
+
+        if upload.get("user_id") != user_id:
+            return None
+
+        upload["parts"] = parts
+        return upload
+
+    async def add_part(self, upload_id: str, part_number: int, etag: str) -> None:
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hset(self._key(upload_id), f"part:{part_number}", json.dumps(etag))
+            pipe.expire(self._key(upload_id), self.ttl)
+            await pipe.execute()
+
+    async def delete(self, upload_id: str) -> None:
+        await self.redis.delete(self._key(upload_id))
+
+    @staticmethod
+    def _key(upload_id: str) -> str:
+        return f"resumable_upload:{upload_id}"
+
+
+pending_uploads = PendingUploadStore(redis)
+resumable_uploads = ResumableUploadStore(redis)
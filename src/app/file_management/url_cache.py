@@ -0,0 +1,111 @@
+import json
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable
+
+from redis.exceptions import RedisError
+
+from src.settings.config import redis, settings, logger
+
+
+class PresignedUrlCache:
+    """
+    Reuses presigned download URLs per `s3_key`.
+
+    A URL is signed for `expires_in` seconds and handed out again as long as it stays valid for at least
+    `min_remaining` more seconds. Entries live in an in-process LRU of `max_size` keys and, when a Redis
+    client is given, in `presigned:<s3_key>` so other processes can reuse them too. `invalidate` must be
+    called whenever the object behind a key is removed or replaced.
+    """
+
+    def __init__(
+        self,
+        redis_client=None,
+        expires_in: int = settings.PRESIGNED_URL_EXPIRES_IN,
+        min_remaining: int = settings.PRESIGNED_URL_MIN_REMAINING,
+        max_size: int = settings.PRESIGNED_URL_CACHE_SIZE,
+    ):
+        self.redis = redis_client
+        self.expires_in = expires_in
+        self.min_remaining = min_remaining
+        self.max_size = max_size
+        self._entries: OrderedDict[str, tuple[str, float]] = OrderedDict()
+
+    async def get_or_sign(self, s3_key: str, sign: Callable[[int], Awaitable[str]]) -> str:
+        """Returns a reusable URL for `s3_key`, calling `sign(expires_in)` on a miss."""
+        url = self._get_local(s3_key) or await self._get_shared(s3_key)
+        if url:
+            return url
+
+        expires_at = time.time() + self.expires_in
+        url = await sign(self.expires_in)
+        self._set_local(s3_key, url, expires_at)
+        await self._set_shared(s3_key, url, expires_at)
+        return url
+
+    async def invalidate(self, *s3_keys: str) -> None:
+        for s3_key in s3_keys:
+            self._entries.pop(s3_key, None)
+
+        if self.redis and s3_keys:
+            try:
+                await self.redis.delete(*(self._key(s3_key) for s3_key in s3_keys))
+            except RedisError as e:
+                logger.warning(f"Failed to invalidate presigned URLs: {e}")
+
+    def _get_local(self, s3_key: str) -> str | None:
+        entry = self._entries.get(s3_key)
+        if not entry:
+            return None
+
+        url, expires_at = entry
+        if expires_at - time.time() < self.min_remaining:
+            del self._entries[s3_key]
+            return None
+
+        self._entries.move_to_end(s3_key)
+        return url
+
+    def _set_local(self, s3_key: str, url: str, expires_at: float) -> None:
+        self._entries[s3_key] = (url, expires_at)
+        self._entries.move_to_end(s3_key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    async def _get_shared(self, s3_key: str) -> str | None:
+        if not self.redis:
+            return None
+
+        try:
+            cached = await self.redis.get(self._key(s3_key))
+        except RedisError as e:
+            logger.warning(f"Failed to read presigned URL cache: {e}")
+            return None
+
+        if not cached:
+            return None
+
+        entry = json.loads(cached)
+        self._set_local(s3_key, entry["url"], entry["expires_at"])
+        return self._get_local(s3_key)
+
+    async def _set_shared(self, s3_key: str, url: str, expires_at: float) -> None:
+        if not self.redis:
+            return
+
+        # The Redis entry expires as soon as the URL is no longer worth handing out
+        ttl = int(expires_at - time.time() - self.min_remaining)
+        if ttl <= 0:
+            return
+
+        try:
+            await self.redis.set(self._key(s3_key), json.dumps({"url": url, "expires_at": expires_at}), ex=ttl)
+        except RedisError as e:
+            logger.warning(f"Failed to write presigned URL cache: {e}")
+
+    @staticmethod
+    def _key(s3_key: str) -> str:
+        return f"presigned:{s3_key}"
+
+
+presigned_url_cache = PresignedUrlCache(redis if settings.PRESIGNED_URL_REDIS_CACHE else None)
@@ -5,6 +5,16 @@ class ResponseErrorMessage(str, Enum):
     # Object error responses
     FILE_DOES_NOT_EXIST = "File does not exist"
     FILE_PROCESSING_ERROR = "An error occurred while processing file"
+    FILE_TOO_LARGE = "File exceeds the maximum allowed size"
+    JOB_DOES_NOT_EXIST = "Job does not exist"
+    INVALID_CURSOR = "Invalid pagination cursor"
+    UPLOAD_DOES_NOT_EXIST = "Upload does not exist or has expired"
+    UPLOAD_NOT_COMPLETED = "The file has not been uploaded yet"
+    UPLOAD_CONFIRM_IN_PROGRESS = "The upload is already being confirmed"
+    INVALID_CHUNK = "The chunk does not match the upload offset or size"
+    TOO_MANY_FILES = "Too many files in one request"
+    TOO_MANY_UPLOADS = "Too many uploads in progress, retry later"
+    UPLOADS_BUSY = "The server is busy with other uploads, retry later"
 
     # AWS error responses
     AWS_MISSED_DOWNLOAD_AGS = "Either s3_key or (file_id and user_id) must be provided"
@@ -13,9 +23,15 @@ class ResponseErrorMessage(str, Enum):
     AWS_MISSED_CREDENTIALS = "AWS credentials not found"
     AWS_INCOMPLETE_CREDENTIALS = "Incomplete AWS credentials"
 
+    # Job transport error responses
+    JOB_ENQUEUE_ERROR = "Failed to enqueue task"
+
     # Webhook error
     TIMEOUT_ERROR = "Timeout while waiting for analysis result"
 
+    # Auth error responses
+    AUTH_BUSY = "Too many logins in progress, retry later"
+
     # Server error responses
     INTERNAL_ERROR = "Internal server error"
 
@@ -23,3 +39,8 @@ class ResponseErrorMessage(str, Enum):
 class ProcessingStatus(str, Enum):
     SUCCESS = "success"
     ERROR = "error"
+
+
+class JobStatus(str, Enum):
+    PENDING = "pending"
+    COMPLETED = "completed"
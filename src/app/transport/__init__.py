@@ -0,0 +1,4 @@
+from .base import JobQueue, JobTransport
+from .utils import enqueue_job, get_transport, outbox_relay
+
+__all__ = ["JobQueue", "JobTransport", "enqueue_job", "get_transport", "outbox_relay"]
@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from enum import Enum
+
+
+class JobQueue(str, Enum):
+    CONVERTER = "converter"
+    ANALYSIS = "analysis"
+
+
+class JobTransport(ABC):
+    """Delivers processing job messages to the workers of a logical queue."""
+
+    @abstractmethod
+    async def send(self, queue: JobQueue, body: str) -> str:
+        """Enqueues the message and returns the id assigned to it by the backend."""
+
+    def start(self) -> None:
+        """Starts the consumers of backends that process jobs in-process."""
+
+    async def close(self) -> None:
+        """Flushes buffered messages and releases backend resources."""
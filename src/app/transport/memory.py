@@ -0,0 +1,76 @@
+import asyncio
+import uuid
+from typing import Awaitable, Callable
+
+from src.app.transport.base import JobQueue, JobTransport
+from src.settings.config import settings, logger
+
+JobHandler = Callable[[str], Awaitable[None]]
+
+
+class QueueFullError(Exception):
+    pass
+
+
+class InMemoryTransport(JobTransport):
+    """
+    Keeps jobs in bounded per-queue asyncio queues inside the API process.
+
+    Meant for local, zero-network deployments and benchmarks where the workers run in the same
+    process: each queue needs a handler registered with `register_consumer` before `start`, which
+    runs one consumer task per queue. A full queue rejects the message instead of growing, so the
+    caller (or the outbox relay) sees the failure.
+    """
+
+    def __init__(self, max_size: int = settings.MEMORY_TRANSPORT_MAX_SIZE):
+        self.max_size = max_size
+        self._queues: dict[JobQueue, asyncio.Queue] = {}
+        self._handlers: dict[JobQueue, JobHandler] = {}
+        self._consumers: list[asyncio.Task] = []
+
+    def register_consumer(self, queue: JobQueue, handler: JobHandler) -> None:
+        """Sets the coroutine function that processes the message bodies of `queue`."""
+        self._handlers[queue] = handler
+
+    def start(self) -> None:
+        if self._consumers:
+            return
+
+        missing = [queue.value for queue in JobQueue if queue not in self._handlers]
+        if missing:
+            raise RuntimeError(f"No in-process consumer registered for job queues: {', '.join(missing)}")
+
+        self._consumers = [
+            asyncio.create_task(self._consume(queue, handler)) for queue, handler in self._handlers.items()
+        ]
+
+    async def close(self) -> None:
+        for task in self._consumers:
+            task.cancel()
+        await asyncio.gather(*self._consumers, return_exceptions=True)
+        self._consumers = []
+
+    async def send(self, queue: JobQueue, body: str) -> str:
+        message_id = str(uuid.uuid4())
+        try:
+            self._get_queue(queue).put_nowait((message_id, body))
+        except asyncio.QueueFull:
+            raise QueueFullError(f"In-memory job queue {queue.value} is full")
+        return message_id
+
+    async def receive(self, queue: JobQueue) -> tuple[str, str]:
+        """Waits for the next message of `queue` and returns its id and body."""
+        return await self._get_queue(queue).get()
+
+    async def _consume(self, queue: JobQueue, handler: JobHandler) -> None:
+        while True:
+            message_id, body = await self.receive(queue)
+            try:
+                await handler(body)
+            except Exception as e:
+                logger.error(f"In-process {queue.value} job {message_id} failed: {str(e)}", exc_info=True)
+
+    def _get_queue(self, queue: JobQueue) -> asyncio.Queue:
+        if queue not in self._queues:
+            self._queues[queue] = asyncio.Queue(maxsize=self.max_size)
+        return self._queues[queue]
@@ -0,0 +1,133 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, or_, select
+from sqlalchemy.sql import func
+
+from src.app.constants import OUTBOX_MAX_RETRY_DELAY
+from src.app.transport.base import JobQueue, JobTransport
+from src.app.transport.models import OutboxMessage
+from src.settings.config import settings, logger
+
+
+class OutboxRelay:
+    """
+    Drains the `outbox` table to the job transport.
+
+    Each pass locks up to `batch_size` due rows with `FOR UPDATE SKIP LOCKED`, so several API processes
+    can relay concurrently without sending the same row twice. Sent rows are deleted in the same
+    transaction. Failed rows stay in the table with `attempts` increased and are retried after an
+    exponential backoff (`next_attempt_at`), after the rows that have not failed yet. Rows that failed
+    `max_attempts` times are dead-lettered: they are no longer sent and stay in the table for inspection.
+    Delivery is at-least-once: a crash between sending and committing resends the batch.
+    """
+
+    def __init__(
+        self,
+        session_factory,
+        get_transport,
+        batch_size: int = settings.OUTBOX_BATCH_SIZE,
+        poll_interval: float = settings.OUTBOX_POLL_INTERVAL,
+        max_attempts: int = settings.OUTBOX_MAX_ATTEMPTS,
+        retry_delay: float = settings.OUTBOX_RETRY_DELAY,
+    ):
+        self.session_factory = session_factory
+        self.get_transport = get_transport
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task and not self._task.done():
+            return
+
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def notify(self) -> None:
+        """Wakes the relay up right after a commit instead of waiting for the next poll."""
+        if self._wakeup:
+            self._wakeup.set()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                sent = await self.relay_batch()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Outbox relay error: {str(e)}", exc_info=True)
+                sent = 0
+
+            # Only a full batch of sent messages means more are waiting; failures wait for their backoff
+            if sent < self.batch_size:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+
+    async def relay_batch(self) -> int:
+        """Sends one batch of due messages and returns how many were sent."""
+        async with self.session_factory() as session:
+            async with session.begin():
+                stmt = (
+                    select(OutboxMessage)
+                    .filter(
+                        OutboxMessage.attempts < self.max_attempts,
+                        or_(OutboxMessage.next_attempt_at.is_(None), OutboxMessage.next_attempt_at <= func.now()),
+                    )
+                    .order_by(OutboxMessage.attempts, OutboxMessage.id)
+                    .limit(self.batch_size)
+                    .with_for_update(skip_locked=True)
+                )
+                messages = (await session.execute(stmt)).scalars().all()
+                if not messages:
+                    return 0
+
+                sent_ids, failed_ids = await self.send(messages)
+                if sent_ids:
+                    await session.execute(delete(OutboxMessage).where(OutboxMessage.id.in_(sent_ids)))
+                if failed_ids:
+                    self.schedule_retries([message for message in messages if message.id in failed_ids])
+
+        return len(sent_ids)
+
+    def schedule_retries(self, messages: list[OutboxMessage]) -> None:
+        """Counts the failed attempt and backs each message off exponentially, flushed with the transaction."""
+        now = datetime.now(timezone.utc)
+        for message in messages:
+            message.attempts += 1
+            delay = min(self.retry_delay * 2 ** (message.attempts - 1), OUTBOX_MAX_RETRY_DELAY)
+            message.next_attempt_at = now + timedelta(seconds=delay)
+            if message.attempts >= self.max_attempts:
+                logger.error(f"Outbox message {message.id} dead-lettered after {message.attempts} attempts")
+
+    async def send(self, messages: list[OutboxMessage]) -> tuple[list[int], list[int]]:
+        """Sends the messages concurrently so the transport can batch them; returns (sent ids, failed ids)."""
+        transport: JobTransport = self.get_transport()
+        results = await asyncio.gather(
+            *(transport.send(JobQueue(message.queue), message.body) for message in messages), return_exceptions=True
+        )
+
+        sent_ids, failed_ids = [], []
+        for message, result in zip(messages, results):
+            if isinstance(result, Exception):
+                logger.error(f"Outbox message {message.id} was not sent: {str(result)}")
+                failed_ids.append(message.id)
+            else:
+                sent_ids.append(message.id)
+
+        return sent_ids, failed_ids
@@ -0,0 +1,22 @@
+from src.app.transport.base import JobQueue, JobTransport
+from src.settings.config import settings
+
+
+class RedisStreamsTransport(JobTransport):
+    """Appends jobs to a Redis Stream per queue (`<prefix>:<queue>`) for consumer-group workers."""
+
+    def __init__(
+        self, redis_client, prefix: str = settings.REDIS_STREAM_PREFIX, maxlen: int = settings.REDIS_STREAM_MAXLEN
+    ):
+        self.redis = redis_client
+        self.prefix = prefix
+        self.maxlen = maxlen
+
+    async def send(self, queue: JobQueue, body: str) -> str:
+        message_id = await self.redis.xadd(
+            self.stream_name(queue), {"body": body}, maxlen=self.maxlen, approximate=True
+        )
+        return message_id.decode("utf-8") if isinstance(message_id, bytes) else message_id
+
+    def stream_name(self, queue: JobQueue) -> str:
+        return f"{self.prefix}:{queue.value}"
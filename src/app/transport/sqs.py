@@ -0,0 +1,18 @@
+from src.app.aws.utils import sqs_producer
+from src.app.transport.base import JobQueue, JobTransport
+from src.settings.config import settings
+
+
+class SQSTransport(JobTransport):
+    def __init__(self, producer=sqs_producer):
+        self.producer = producer
+        self.queue_urls = {
+            JobQueue.CONVERTER: settings.AWS_SQS_QUEUE_CONVERTER_URL,
+            JobQueue.ANALYSIS: settings.AWS_SQS_QUEUE_ANALYSIS_URL,
+        }
+
+    async def send(self, queue: JobQueue, body: str) -> str:
+        return await self.producer.send(self.queue_urls[queue], body)
+
+    async def close(self) -> None:
+        await self.producer.stop()
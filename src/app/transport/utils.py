@@ -0,0 +1,65 @@
+from typing import Tuple, Optional, Dict
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.app.aws.producer import SQSSendError
+from src.app.responses.statuses import ResponseErrorMessage
+from src.app.transport.base import JobQueue, JobTransport
+from src.app.transport.models import OutboxMessage
+from src.app.transport.outbox import OutboxRelay
+from src.settings.config import settings, redis, logger
+from src.settings.database import async_session
+
+_transport: JobTransport | None = None
+
+
+def create_transport(name: str) -> JobTransport:
+    if name == "sqs":
+        from src.app.transport.sqs import SQSTransport
+
+        return SQSTransport()
+    if name == "redis":
+        from src.app.transport.redis_streams import RedisStreamsTransport
+
+        return RedisStreamsTransport(redis)
+    if name == "memory":
+        from src.app.transport.memory import InMemoryTransport
+
+        return InMemoryTransport()
+
+    raise ValueError(f"Unknown job transport: {name}")
+
+
+def get_transport() -> JobTransport:
+    global _transport
+    if _transport is None:
+        _transport = create_transport(settings.JOB_TRANSPORT)
+    return _transport
+
+
+outbox_relay = OutboxRelay(async_session, get_transport)
+
+
+async def enqueue_job(
+    queue: JobQueue, request_body: str, db: AsyncSession | None = None
+) -> Tuple[Optional[Dict[str, str | bool]], bool]:
+    """
+    Enqueues the job message.
+
+    When the outbox is enabled and a session is given, the message is written to the `outbox` table and
+    committed together with whatever the request already changed in that session; the relay then sends it.
+    Otherwise it is sent straight to the transport.
+    """
+    try:
+        if db is not None and settings.JOB_OUTBOX_ENABLED:
+            db.add(OutboxMessage(queue=queue.value, body=request_body))
+            await db.commit()
+            outbox_relay.notify()
+        else:
+            await get_transport().send(queue, request_body)
+    except SQSSendError as e:
+        return {"success": False, "message": e.message}, False
+    except Exception as e:
+        logger.error(f"Job enqueue error: {str(e)}", exc_info=True)
+        return {"success": False, "message": ResponseErrorMessage.JOB_ENQUEUE_ERROR}, False
+    return None, True
@@ -1,35 +1,109 @@
-from src.app.constants import MAX_FILE_SIZE_BYTES, SUPPORTED_FORMATS
+import codecs
+
+from src.app.constants import CONTENT_SNIFF_BYTES, MAX_FILE_SIZE_BYTES, SUPPORTED_FORMATS
+
+# Leading bytes of each binary format, DOCX is a ZIP container and DOC an OLE2 compound file
+MAGIC_BYTES = {
+    "pdf": [b"%PDF-"],
+    "zip": [b"PK\x03\x04"],
+    "ole": [b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1"],
+    "png": [b"\x89PNG\r\n\x1a\n"],
+    "jpeg": [b"\xff\xd8\xff"],
+}
+
+# Content types every supported extension may contain
+FORMAT_CONTENT_TYPES = {
+    "pdf": "pdf",
+    "docx": "zip",
+    "doc": "ole",
+    "png": "png",
+    "jpg": "jpeg",
+    "jpeg": "jpeg",
+    "txt": "text",
+}
+
+TEXT_CONTROL_CHARS = set(range(32)) - {9, 10, 12, 13}
+
+
+def sniff_content_type(head: bytes) -> str | None:
+    """
+    Detects the content type of a file from its first bytes: one of the MAGIC_BYTES keys, "text" for UTF-8
+    (or UTF-16 with a BOM) text, or None if it is not recognized. Only the first CONTENT_SNIFF_BYTES are
+    inspected, however much is passed.
+    """
+    head = head[:CONTENT_SNIFF_BYTES]
+    for content_type, signatures in MAGIC_BYTES.items():
+        if head.startswith(tuple(signatures)):
+            return content_type
+
+    if head.startswith((b"\xff\xfe", b"\xfe\xff")):
+        return "text"
+    if b"\x00" in head:
+        return None
+
+    try:
+        # Not final: the head may end in the middle of a multi-byte character
+        text = codecs.getincrementaldecoder("utf-8")().decode(head, final=False)
+    except UnicodeDecodeError:
+        return None
+
+    control_chars = sum(ord(char) in TEXT_CONTROL_CHARS for char in text)
+    return "text" if control_chars <= len(text) * 0.01 else None
 
 
 class FileValidator:
     def __init__(self):
-        self.file = None
+        self.file_name = None
+        self.file_size = None
 
     def validate_file(self, file) -> bool:
-        self.file = file
+        return self.validate_metadata(file.filename, file.size)
+
+    def validate_metadata(self, file_name: str, file_size: int) -> bool:
+        """Validates a file by its name and size, e.g. before it is uploaded directly to S3."""
+        self.file_name = file_name
+        self.file_size = file_size
 
         return all(
             [self.file_type_is_supported(), self.file_size_is_valid(), not self.file_name_is_more_than_128_characters()]
         )
 
+    async def validate_content(self, file) -> bool:
+        """
+        Validates that the content of an upload matches its extension, reading only its first
+        CONTENT_SNIFF_BYTES. The upload is rewound afterwards.
+        """
+        head = await file.read(CONTENT_SNIFF_BYTES)
+        await file.seek(0)
+        return self.content_matches_type(file.filename, head)
+
+    def content_matches_type(self, file_name: str, head: bytes) -> bool:
+        """Returns True if the leading bytes of a file match its extension and False otherwise."""
+        self.file_name = file_name
+        if not self.file_type_is_supported():
+            return False
+
+        return sniff_content_type(head) == FORMAT_CONTENT_TYPES[self.file_format()]
+
+    def file_format(self) -> str:
+        return self.file_name.split(".")[-1]
+
     def file_type_is_supported(self):
         """Returns True if the file type is supported and False otherwise."""
-        file_format = self.file.filename.split(".")[-1]
-        return file_format in SUPPORTED_FORMATS
+        return self.file_format() in SUPPORTED_FORMATS
 
     def file_size_is_valid(self):
         """Returns True if the size of the file is less or equal MAX_FILE_SIZE_BYTES and False otherwise."""
-        file_size = self.file.size
-        return file_size <= MAX_FILE_SIZE_BYTES
+        return self.file_size <= MAX_FILE_SIZE_BYTES
 
     def file_name_is_more_than_128_characters(self):
         """Returns True if the file name length is more than 128 characters long and False otherwise."""
-        file_name = self.file.filename
-        return len(file_name) > 128
+        return len(self.file_name) > 128
 
 
 invalid_file = {
     "file_name": "max length is 128 characters",
     "max_size": "20 MB",
     "supported_formats": SUPPORTED_FORMATS,
+    "content": "must match the file extension",
 }
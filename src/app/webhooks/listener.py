@@ -0,0 +1,171 @@
+import asyncio
+import json
+
+from src.app.constants import RESULT_CACHE_PREFIXES, SSE_QUEUE_SIZE, USER_EVENTS_PREFIX
+from src.settings.config import redis, logger
+
+
+class CacheResultListener:
+    """
+    One Redis pattern subscription per process that fans webhook results out to in-process waiters.
+
+    Waiters register an asyncio future under the full cache key (e.g. `file_parsing:<uuid>`).
+    When a result is published on that key every future registered for it is resolved, so a
+    pending request costs a future and a dict entry instead of its own Redis connection.
+
+    Long-lived consumers (the SSE stream) subscribe with a queue instead of a future and keep
+    receiving every message published on their channel until they unsubscribe.
+    """
+
+    def __init__(self, redis_client, prefixes: list[str], reconnect_delay: float = 1.0):
+        self.redis = redis_client
+        self.patterns = [f"{prefix}:*" for prefix in prefixes]
+        self.reconnect_delay = reconnect_delay
+        self._waiters: dict[str, set[asyncio.Future]] = {}
+        self._streams: dict[str, set[asyncio.Queue]] = {}
+        self._ready: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        if self._task and not self._task.done():
+            return
+
+        self._ready = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        for futures in self._waiters.values():
+            for future in futures:
+                future.cancel()
+        self._waiters.clear()
+        self._streams.clear()
+
+    def subscribe(self, channel: str, maxsize: int = SSE_QUEUE_SIZE) -> asyncio.Queue:
+        """Returns a queue that receives every decoded message published on `channel`."""
+        self.start()
+        queue = asyncio.Queue(maxsize=maxsize)
+        self._streams.setdefault(channel, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, channel: str, queue: asyncio.Queue) -> None:
+        queues = self._streams.get(channel)
+        if queues is None:
+            return
+
+        queues.discard(queue)
+        if not queues:
+            del self._streams[channel]
+
+    async def wait(self, cache_key: str, timeout: float) -> dict | None:
+        """Returns the result stored under `cache_key`, or None if it does not arrive within `timeout`."""
+        self.start()
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.setdefault(cache_key, set()).add(future)
+
+        try:
+            return await asyncio.wait_for(self._wait(cache_key, future), timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            self._discard(cache_key, future)
+
+    async def _wait(self, cache_key: str, future: asyncio.Future) -> dict:
+        await self._ready.wait()
+
+        # The webhook may have landed before the subscription was active
+        status_data = await self.redis.get(cache_key)
+        if status_data:
+            return load_cached_data(status_data)
+
+        return await future
+
+    async def _run(self) -> None:
+        while True:
+            pubsub = self.redis.pubsub()
+            try:
+                await pubsub.psubscribe(*self.patterns)
+                self._ready.set()
+                await self._recheck_pending()
+
+                async for message in pubsub.listen():
+                    if message["type"] == "pmessage":
+                        self._dispatch(message["channel"], message["data"])
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Cache result listener error: {str(e)}", exc_info=True)
+                await asyncio.sleep(self.reconnect_delay)
+            finally:
+                await pubsub.aclose()
+
+    async def _recheck_pending(self) -> None:
+        """Catches up on results published while the listener was (re)connecting."""
+        for cache_key in list(self._waiters):
+            status_data = await self.redis.get(cache_key)
+            if status_data:
+                self._dispatch(cache_key, status_data)
+
+    def _dispatch(self, channel: bytes | str, data: bytes | str) -> None:
+        cache_key = channel.decode("utf-8") if isinstance(channel, bytes) else channel
+        self._publish_to_streams(cache_key, data)
+
+        futures = self._waiters.pop(cache_key, None)
+        if not futures:
+            return
+
+        try:
+            result = load_cached_data(data)
+        except ValueError as e:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for future in futures:
+            if not future.done():
+                future.set_result(result)
+
+    def _publish_to_streams(self, channel: str, data: bytes | str) -> None:
+        queues = self._streams.get(channel)
+        if not queues:
+            return
+
+        try:
+            message = load_cached_data(data)
+        except ValueError:
+            logger.error(f"Invalid message on channel {channel}", exc_info=True)
+            return
+
+        for queue in queues:
+            if queue.full():
+                logger.warning(f"Dropping event for slow subscriber on channel {channel}")
+                continue
+            queue.put_nowait(message)
+
+    def _discard(self, cache_key: str, future: asyncio.Future) -> None:
+        futures = self._waiters.get(cache_key)
+        if futures is None:
+            return
+
+        futures.discard(future)
+        if not futures:
+            del self._waiters[cache_key]
+
+
+def load_cached_data(data: bytes | str) -> dict:
+    try:
+        return json.loads(data)
+    except json.JSONDecodeError:
+        raise ValueError("Invalid data in cache")
+
+
+result_listener = CacheResultListener(redis, RESULT_CACHE_PREFIXES + [USER_EVENTS_PREFIX])
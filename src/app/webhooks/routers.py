@@ -1,15 +1,27 @@
 import json
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.requests import Request
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.responses import StreamingResponse
 
+from src.app.auth.utils import blacklist_check
+from src.app.file_management.jobs import job_store, job_coalescer
+from src.app.file_management.results import result_cache, converted_content_hash
 from src.app.file_management.services import FileManagementService
+from src.app.file_management.url_cache import presigned_url_cache
+from src.app.responses.generator import ResponseGeneratorService
+from src.app.responses.statuses import ProcessingStatus
+from src.app.webhooks.utils import stream_job_events, publish_job_event
 from src.settings.config import redis, logger
 from src.settings.database import get_db
 
 router = APIRouter()
 
+# Appended to the callback URL by the processing routes to key the result in the result cache
+ResultDigest = Query(None, pattern="^[0-9a-f]{64}$")
+
 
 class FileConverterResponse(BaseModel):
     file_url: str
@@ -38,8 +50,24 @@ class FileTonalityAnalysisResponse(BaseModel):
     status: str
 
 
+@router.get("/events", dependencies=[Depends(blacklist_check)])
+async def job_events(request: Request, db: AsyncSession = Depends(get_db)):
+    user_id = request.session.get("user_id")
+    if not user_id:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+
+    response_generator = ResponseGeneratorService(file_manager_service=FileManagementService(db))
+    return StreamingResponse(
+        stream_job_events(user_id, request, response_generator),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post("/converter-webhook")
-async def convert_webhook(request: FileConverterResponse, db: AsyncSession = Depends(get_db)):
+async def convert_webhook(
+    request: FileConverterResponse, result_digest: str | None = ResultDigest, db: AsyncSession = Depends(get_db)
+):
     service = FileManagementService(db)
 
     if request.status == "success":
@@ -47,24 +75,37 @@ async def convert_webhook(request: FileConverterResponse, db: AsyncSession = Dep
         if not file:
             return {"error": "File not found"}
 
+        await presigned_url_cache.invalidate(file.s3_key)
         file.file_name = request.new_s3_key.split("_")[1]
         file.s3_url = request.file_url
         file.s3_key = request.new_s3_key
+        file.content_hash = converted_content_hash(file.content_hash, request.new_s3_key)
+        file.content_encoding = None  # converted objects are written by the converter, uncompressed
 
         await db.commit()
         s3_key = request.new_s3_key
         data = request.model_dump()
         data["s3_key"] = s3_key
-        await add_response_data_to_cache(request.new_s3_key, data, cache_key="file_conversion")
+        await add_response_data_to_cache(
+            db, request.new_s3_key, data, cache_key="file_conversion", result_digest=result_digest
+        )
 
         return {"message": "File updated successfully"}
 
+    # The file is left as is, but the requests and jobs waiting for the conversion still get the error
+    data = request.model_dump()
+    data["s3_key"] = request.new_s3_key
+    await add_response_data_to_cache(db, request.new_s3_key, data, cache_key="file_conversion")
     return None
 
 
 @router.post("/parser-webhook")
-async def parser_webhook(request: FileParserResponse):
-    await add_response_data_to_cache(request.s3_key, request.model_dump(), cache_key="file_parsing")
+async def parser_webhook(
+    request: FileParserResponse, result_digest: str | None = ResultDigest, db: AsyncSession = Depends(get_db)
+):
+    await add_response_data_to_cache(
+        db, request.s3_key, request.model_dump(), cache_key="file_parsing", result_digest=result_digest
+    )
     # logger.info(request.model_dump())
     #
     if request.status == "success":
@@ -75,8 +116,12 @@ async def parser_webhook(request: FileParserResponse):
 
 
 @router.post("/analysis-webhook")
-async def analysis_webhook(request: FileTonalityAnalysisResponse):
-    await add_response_data_to_cache(request.s3_key, request.model_dump(), cache_key="tonality_analysis")
+async def analysis_webhook(
+    request: FileTonalityAnalysisResponse, result_digest: str | None = ResultDigest, db: AsyncSession = Depends(get_db)
+):
+    await add_response_data_to_cache(
+        db, request.s3_key, request.model_dump(), cache_key="tonality_analysis", result_digest=result_digest
+    )
 
     if request.status == "success":
 
@@ -84,7 +129,16 @@ async def analysis_webhook(request: FileTonalityAnalysisResponse):
     return None
 
 
-async def add_response_data_to_cache(s3_key, data, cache_key):
+async def add_response_data_to_cache(db, s3_key, data, cache_key, result_digest=None):
+    if result_digest and data.get("status") == ProcessingStatus.SUCCESS:
+        await result_cache.put(db, result_digest, cache_key, data)
+
     uuid_key = s3_key.split("_")[0]
     cache_key = f"{cache_key}:{uuid_key}"
-    await redis.setex(cache_key, 60, json.dumps(data))
+    payload = json.dumps(data)
+    await redis.setex(cache_key, 60, payload)
+    await redis.publish(cache_key, payload)
+    await job_coalescer.resolve(cache_key)
+
+    for job in await job_store.resolve(cache_key, data):
+        await publish_job_event(job)
@@ -1,22 +1,51 @@
 import asyncio
 import json
+from typing import AsyncIterator
 
+from fastapi.requests import Request
+
+from src.app.constants import SSE_HEARTBEAT_INTERVAL, USER_EVENTS_PREFIX
+from src.app.responses.generator import ResponseGeneratorService
+from src.app.webhooks.listener import result_listener
 from src.settings.config import redis
 
 
-async def wait_for_cache(s3_key: str, cache_key: str, timeout: int = 30, interval: float = 0.2) -> dict | None:
-    """Waits for the result to appear in the cache with timeout"""
+async def wait_for_cache(s3_key: str, cache_key: str, timeout: int = 30) -> dict | None:
+    """Waits for the result to be published to the cache with timeout"""
     uuid_key = s3_key.split("_")[0]
     cache_key = f"{cache_key}:{uuid_key}"
-    start_time = asyncio.get_event_loop().time()
+    return await result_listener.wait(cache_key, timeout)
+
+
+def user_events_channel(user_id: int) -> str:
+    return f"{USER_EVENTS_PREFIX}:{user_id}"
+
+
+async def publish_job_event(job: dict) -> None:
+    await redis.publish(user_events_channel(job["user_id"]), json.dumps(job))
+
+
+async def stream_job_events(
+    user_id: int, request: Request, response_generator: ResponseGeneratorService
+) -> AsyncIterator[str]:
+    """Yields Server-Sent Events for every job of the user completed while the stream is open"""
+    channel = user_events_channel(user_id)
+    queue = result_listener.subscribe(channel)
 
-    while (asyncio.get_event_loop().time() - start_time) < timeout:
-        status_data = await redis.get(cache_key)
-        if status_data:
+    try:
+        yield "retry: 3000\n\n"
+        while True:
             try:
-                return json.loads(status_data)
-            except json.JSONDecodeError:
-                raise {"message": "Invalid data in cache"}
-        await asyncio.sleep(interval)
+                job = await asyncio.wait_for(queue.get(), timeout=SSE_HEARTBEAT_INTERVAL)
+            except asyncio.TimeoutError:
+                if await request.is_disconnected():
+                    break
+                yield ": keep-alive\n\n"
+                continue
 
-    return None
+            use_s3 = job["job_type"] == "file_conversion"
+            result = await response_generator.generate_response(job["result"], use_s3=use_s3)
+            data = {"job_id": job["job_id"], "status": job["status"], "result": result}
+            yield f"id: {job['job_id']}\nevent: {job['job_type']}\ndata: {json.dumps(data)}\n\n"
+    finally:
+        result_listener.unsubscribe(channel, queue)
@@ -0,0 +1,164 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Callable
+
+from sqlalchemy import select, update
+from sqlalchemy.sql import func
+
+from src.app.constants import S3_DELETE_BATCH_SIZE
+from src.app.file_management.models import File as FileModel
+from src.settings.config import logger
+
+ORPHAN_OBJECT = "orphan_object"  # object in the bucket without a file row
+MISSING_OBJECT = "missing_object"  # live file row whose object is not in the bucket
+
+
+@dataclass
+class ReconcileReport:
+    orphan_objects: int = 0
+    missing_objects: int = 0
+    deleted_objects: int = 0
+    removed_rows: int = 0
+
+
+async def iter_s3_keys(s3_client, bucket: str, page_size: int = 1000) -> AsyncIterator[tuple[str, datetime]]:
+    """Yields `(key, last_modified)` of every object, one `ListObjectsV2` page at a time, in key byte order."""
+    kwargs = {"Bucket": bucket, "MaxKeys": page_size}
+    while True:
+        page = await s3_client.list_objects_v2(**kwargs)
+        for obj in page.get("Contents", []):
+            yield obj["Key"], obj["LastModified"]
+
+        if not page.get("IsTruncated"):
+            return
+        kwargs["ContinuationToken"] = page["NextContinuationToken"]
+
+
+async def iter_db_keys(session, batch_size: int = 1000) -> AsyncIterator[tuple[str, bool]]:
+    """
+    Yields `(s3_key, is_live)` of every file row through a server-side cursor. Keys are ordered with the
+    "C" collation, i.e. by bytes, which is the order S3 lists objects in.
+    """
+    stmt = (
+        select(FileModel.s3_key, FileModel.deleted_at.is_(None))
+        .order_by(FileModel.s3_key.collate("C"))
+        .execution_options(yield_per=batch_size)
+    )
+    result = await session.stream(stmt)
+    async for s3_key, is_live in result.tuples():
+        yield s3_key, is_live
+
+
+async def merge_diff(
+    s3_keys: AsyncIterator[tuple[str, datetime]], db_keys: AsyncIterator[tuple[str, bool]], grace: timedelta
+) -> AsyncIterator[tuple[str, str]]:
+    """
+    Merges both sorted streams and yields `(ORPHAN_OBJECT | MISSING_OBJECT, key)` mismatches.
+
+    Only the current key of each side is held in memory. Objects modified within `grace` are skipped:
+    uploads write the object before the row is committed. Tombstoned rows are left to the reaper.
+    """
+    cutoff = datetime.now(timezone.utc) - grace
+    s3_entry = await anext(s3_keys, None)
+    db_entry = await anext(db_keys, None)
+
+    while s3_entry or db_entry:
+        s3_key = s3_entry[0] if s3_entry else None
+        db_key = db_entry[0] if db_entry else None
+
+        if db_key is None or (s3_key is not None and s3_key.encode() < db_key.encode()):
+            if s3_entry[1] < cutoff:
+                yield ORPHAN_OBJECT, s3_key
+            s3_entry = await anext(s3_keys, None)
+        elif s3_key is None or db_key.encode() < s3_key.encode():
+            if db_entry[1]:
+                yield MISSING_OBJECT, db_key
+            db_entry = await anext(db_keys, None)
+        else:
+            # Several rows may point at the same object; the object is consumed after the last one
+            db_entry = await anext(db_keys, None)
+            if not db_entry or db_entry[0] != s3_key:
+                s3_entry = await anext(s3_keys, None)
+
+
+class Reconciler:
+    """
+    Finds objects in the bucket without a file row and live file rows without an object.
+
+    Both sides are streamed in sorted order and merge-diffed, so memory use does not depend on the
+    number of keys. With `fix`, orphan objects are deleted in `DeleteObjects` batches and rows without
+    an object are soft-deleted in batches, leaving the purge to the `FileReaper`.
+    """
+
+    def __init__(
+        self,
+        s3_client,
+        bucket: str,
+        session_factory,
+        grace: timedelta = timedelta(hours=1),
+        batch_size: int = S3_DELETE_BATCH_SIZE,
+        fix: bool = False,
+    ):
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.session_factory = session_factory
+        self.grace = grace
+        self.batch_size = min(batch_size, S3_DELETE_BATCH_SIZE)
+        self.fix = fix
+
+    async def run(self, on_mismatch: Callable[[str, str], None] = lambda kind, key: None) -> ReconcileReport:
+        report = ReconcileReport()
+        orphan_batch, missing_batch = [], []
+
+        async with self.session_factory() as session:
+            s3_keys = iter_s3_keys(self.s3_client, self.bucket, self.batch_size)
+            db_keys = iter_db_keys(session, self.batch_size)
+
+            async for kind, key in merge_diff(s3_keys, db_keys, self.grace):
+                on_mismatch(kind, key)
+                if kind == ORPHAN_OBJECT:
+                    report.orphan_objects += 1
+                    orphan_batch.append(key)
+                else:
+                    report.missing_objects += 1
+                    missing_batch.append(key)
+
+                if len(orphan_batch) >= self.batch_size:
+                    report.deleted_objects += await self._delete_orphans(orphan_batch)
+                    orphan_batch = []
+                if len(missing_batch) >= self.batch_size:
+                    report.removed_rows += await self._remove_rows(missing_batch)
+                    missing_batch = []
+
+        report.deleted_objects += await self._delete_orphans(orphan_batch)
+        report.removed_rows += await self._remove_rows(missing_batch)
+        return report
+
+    async def _delete_orphans(self, s3_keys: list[str]) -> int:
+        if not self.fix or not s3_keys:
+            return 0
+
+        response = await self.s3_client.delete_objects(
+            Bucket=self.bucket, Delete={"Objects": [{"Key": s3_key} for s3_key in s3_keys], "Quiet": True}
+        )
+        errors = response.get("Errors", [])
+        for error in errors:
+            logger.warning(f"Failed to delete orphan {error['Key']}: {error.get('Message')}")
+
+        return len(s3_keys) - len(errors)
+
+    async def _remove_rows(self, s3_keys: list[str]) -> int:
+        if not self.fix or not s3_keys:
+            return 0
+
+        # A separate session: the one streaming the keys keeps its cursor open
+        async with self.session_factory() as session:
+            stmt = (
+                update(FileModel)
+                .where(FileModel.s3_key.in_(s3_keys), FileModel.deleted_at.is_(None))
+                .values(deleted_at=func.now())
+            )
+            result = await session.execute(stmt)
+            await session.commit()
+
+        return result.rowcount
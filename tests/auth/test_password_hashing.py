@@ -0,0 +1,70 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import HTTPException
+from passlib.context import CryptContext
+
+from src.app.auth.services import AuthService
+from src.app.auth.utils import PasswordHasher
+from src.app.responses.statuses import ResponseErrorMessage
+
+
+def _hasher(rounds: int = 4, max_pending: int = 4) -> PasswordHasher:
+    context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=rounds)
+    return PasswordHasher(context, ThreadPoolExecutor(max_workers=1, thread_name_prefix="bcrypt"), max_pending)
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify():
+    hasher = _hasher()
+
+    hashed = await hasher.hash("SecurePass123")
+
+    assert await hasher.verify_and_update("SecurePass123", hashed) == (True, None)
+    assert await hasher.verify_and_update("wrong", hashed) == (False, None)
+    assert hasher.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_verify_rehashes_when_rounds_change():
+    hashed = await _hasher(rounds=4).hash("SecurePass123")
+
+    is_valid, new_hash = await _hasher(rounds=5).verify_and_update("SecurePass123", hashed)
+
+    assert is_valid is True
+    assert new_hash.startswith("$2b$05$")
+
+
+@pytest.mark.asyncio
+async def test_hashing_runs_on_executor():
+    hasher = _hasher()
+    hasher.context = MagicMock()
+    hasher.context.hash.side_effect = lambda password: threading.current_thread().name
+
+    assert (await hasher.hash("SecurePass123")).startswith("bcrypt")
+
+
+@pytest.mark.asyncio
+async def test_saturated_hasher_rejects_fast():
+    hasher = _hasher(max_pending=0)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await hasher.hash("SecurePass123")
+
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.detail == ResponseErrorMessage.AUTH_BUSY
+    assert exc_info.value.headers == {"Retry-After": "1"}
+
+
+@pytest.mark.asyncio
+async def test_authenticate_user_stores_rehashed_password():
+    user = MagicMock(password="old-hash")
+    service = AuthService(AsyncMock())
+    service.db.execute.return_value = MagicMock(**{"scalars.return_value.first.return_value": user})
+    service.auth_util = MagicMock()
+    service.auth_util.verify_password = AsyncMock(return_value=(True, "new-hash"))
+
+    assert await service.authenticate_user("testuser", "SecurePass123") is user
+    assert user.password == "new-hash"
@@ -0,0 +1,49 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.app.aws.clients import AsyncAWSClient
+
+
+class FakeBotoClient:
+    def __init__(self):
+        self.thread_names = []
+
+    def put_object(self, **kwargs):
+        self.thread_names.append(threading.current_thread().name)
+        return {"ETag": "etag", "Key": kwargs["Key"]}
+
+    def delete_object(self, **kwargs):
+        raise RuntimeError("S3 unavailable")
+
+
+@pytest.fixture
+def executor():
+    pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="test-aws")
+    yield pool
+    pool.shutdown(wait=True)
+
+
+@pytest.mark.asyncio
+async def test_calls_run_on_executor(executor):
+    boto_client = FakeBotoClient()
+    client = AsyncAWSClient(boto_client, executor)
+
+    response = await client.put_object(Bucket="bucket", Key="uuid_doc.txt", Body=b"data")
+
+    assert response == {"ETag": "etag", "Key": "uuid_doc.txt"}
+    assert boto_client.thread_names[0].startswith("test-aws")
+
+
+@pytest.mark.asyncio
+async def test_exceptions_propagate_to_caller(executor):
+    client = AsyncAWSClient(FakeBotoClient(), executor)
+
+    with pytest.raises(RuntimeError, match="S3 unavailable"):
+        await client.delete_object(Bucket="bucket", Key="uuid_doc.txt")
+
+
+def test_sync_client_is_exposed(executor):
+    boto_client = FakeBotoClient()
+    assert AsyncAWSClient(boto_client, executor).sync is boto_client
@@ -0,0 +1,112 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+from src.app.aws.producer import SQSBatchProducer, SQSSendError
+from src.app.aws.utils import send_message_to_sqs
+from src.app.responses.statuses import ResponseErrorMessage
+
+
+class FakeSQSClient:
+    def __init__(self, fail_bodies=(), retryable_bodies=(), error=None):
+        self.batches = []
+        self.fail_bodies = set(fail_bodies)
+        self.retryable_bodies = set(retryable_bodies)
+        self.error = error
+
+    async def send_message_batch(self, QueueUrl, Entries):
+        self.batches.append((QueueUrl, [entry["MessageBody"] for entry in Entries]))
+        if self.error:
+            raise self.error
+
+        successful, failed = [], []
+        for entry in Entries:
+            body = entry["MessageBody"]
+            if body in self.fail_bodies:
+                failed.append({"Id": entry["Id"], "SenderFault": True, "Code": "InvalidMessage", "Message": "bad"})
+            elif body in self.retryable_bodies:
+                self.retryable_bodies.discard(body)
+                failed.append({"Id": entry["Id"], "SenderFault": False, "Code": "InternalError", "Message": "retry"})
+            else:
+                successful.append({"Id": entry["Id"], "MessageId": f"id-{body}"})
+        return {"Successful": successful, "Failed": failed}
+
+
+@pytest_asyncio.fixture
+async def make_producer():
+    producers = []
+
+    def _make(client, linger=0.05):
+        producer = SQSBatchProducer(client, linger=linger, max_retries=1)
+        producers.append(producer)
+        return producer
+
+    yield _make
+    for producer in producers:
+        await producer.stop()
+
+
+@pytest.mark.asyncio
+async def test_messages_are_coalesced_into_batches_of_ten(make_producer):
+    client = FakeSQSClient()
+    producer = make_producer(client)
+
+    message_ids = await asyncio.gather(*(producer.send("queue-a", str(i)) for i in range(15)))
+
+    assert message_ids == [f"id-{i}" for i in range(15)]
+    assert [len(bodies) for _, bodies in client.batches] == [10, 5]
+
+
+@pytest.mark.asyncio
+async def test_batches_are_grouped_by_queue(make_producer):
+    client = FakeSQSClient()
+    producer = make_producer(client)
+
+    await asyncio.gather(producer.send("queue-a", "a1"), producer.send("queue-b", "b1"), producer.send("queue-a", "a2"))
+
+    assert sorted(client.batches) == [("queue-a", ["a1", "a2"]), ("queue-b", ["b1"])]
+
+
+@pytest.mark.asyncio
+async def test_partial_batch_failure(make_producer):
+    client = FakeSQSClient(fail_bodies={"bad"}, retryable_bodies={"flaky"})
+    producer = make_producer(client)
+
+    results = await asyncio.gather(
+        producer.send("queue-a", "ok"),
+        producer.send("queue-a", "bad"),
+        producer.send("queue-a", "flaky"),
+        return_exceptions=True,
+    )
+
+    assert results[0] == "id-ok"
+    assert isinstance(results[1], SQSSendError)
+    assert results[1].message == ResponseErrorMessage.AWS_SQS_ENQUEUE_TASK_ERROR
+    assert results[2] == "id-flaky"
+    assert client.batches[-1] == ("queue-a", ["flaky"])
+
+
+@pytest.mark.asyncio
+async def test_send_message_to_sqs_reports_queue_error(make_producer, monkeypatch):
+    producer = make_producer(FakeSQSClient(error=RuntimeError("SQS unavailable")), linger=0)
+    monkeypatch.setattr("src.app.aws.utils.sqs_producer", producer)
+
+    message, is_sent = await send_message_to_sqs("queue-a", "{}")
+
+    assert is_sent is False
+    assert message == {"success": False, "message": ResponseErrorMessage.AWS_QUEUE_ERROR}
+
+
+@pytest.mark.asyncio
+async def test_stop_flushes_messages_held_during_linger(make_producer):
+    client = FakeSQSClient()
+    producer = make_producer(client, linger=10)
+
+    sends = [asyncio.create_task(producer.send("queue-a", str(i))) for i in range(3)]
+    await asyncio.sleep(0.01)
+    await producer.stop()
+
+    assert all(send.done() for send in sends)
+    assert [send.result() for send in sends] == ["id-0", "id-1", "id-2"]
+    assert client.batches == [("queue-a", ["0", "1", "2"])]
@@ -0,0 +1,111 @@
+import pytest
+
+from src.app.file_management.admission import UploadAdmission
+from src.app.file_management.jobs import JobCoalescer
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+
+        return queue
+
+    async def execute(self):
+        return [await getattr(self.redis, name)(*args, **kwargs) for name, args, kwargs in self.commands]
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def getex(self, key, ex=None):
+        return self.data.get(key)
+
+    async def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def sadd(self, key, *members):
+        self.data.setdefault(key, set()).update(members)
+        return len(members)
+
+    async def smembers(self, key):
+        return set(self.data.get(key, set()))
+
+    async def hset(self, key, field=None, value=None, mapping=None):
+        fields = self.data.setdefault(key, {})
+        if field is not None:
+            fields[field] = value
+        fields.update(mapping or {})
+        return 1
+
+    async def hgetall(self, key):
+        return dict(self.data.get(key, {}))
+
+    async def zadd(self, key, mapping):
+        self.data.setdefault(key, {}).update(mapping)
+        return len(mapping)
+
+    async def zrem(self, key, *members):
+        return sum(self.data.get(key, {}).pop(member, None) is not None for member in members)
+
+    async def zcard(self, key):
+        return len(self.data.get(key, {}))
+
+    async def zremrangebyscore(self, key, min_score, max_score):
+        scores = self.data.get(key, {})
+        removed = [member for member, score in scores.items() if float(min_score) <= score <= float(max_score)]
+        for member in removed:
+            del scores[member]
+        return len(removed)
+
+    async def expire(self, key, ttl):
+        return True
+
+    async def delete(self, *keys):
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+
+@pytest.fixture(autouse=True)
+def job_coalescer(monkeypatch):
+    coalescer = JobCoalescer(FakeRedis())
+    monkeypatch.setattr("src.app.file_management.routers.job_coalescer", coalescer)
+    return coalescer
+
+
+class FakeResultCache:
+    async def lookup(self, db, kind, s3_key, **params):
+        return None, None
+
+
+@pytest.fixture(autouse=True)
+def result_cache(monkeypatch):
+    cache = FakeResultCache()
+    monkeypatch.setattr("src.app.file_management.routers.result_cache", cache)
+    return cache
+
+
+@pytest.fixture(autouse=True)
+def upload_admission(monkeypatch):
+    admission = UploadAdmission(FakeRedis())
+    monkeypatch.setattr("src.app.file_management.routers.upload_admission", admission)
+    return admission
@@ -0,0 +1,125 @@
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI, HTTPException
+from httpx import AsyncClient, ASGITransport
+from redis.exceptions import ConnectionError as RedisConnectionError
+from starlette.middleware.sessions import SessionMiddleware
+
+from src.app.auth.utils import blacklist_check
+from src.app.file_management.admission import UploadAdmission
+from src.app.file_management.routers import router as files_router, get_file_manager
+from src.app.responses.statuses import ResponseErrorMessage
+from tests.files.conftest import FakeRedis
+
+
+class BrokenRedis(FakeRedis):
+    async def zadd(self, key, mapping):
+        raise RedisConnectionError("down")
+
+
+@pytest.mark.asyncio
+async def test_process_budget_rejects_with_503():
+    admission = UploadAdmission(FakeRedis(), max_bytes=100, max_per_user=10, retry_after=7)
+
+    async with admission.admit(1, 60):
+        with pytest.raises(HTTPException) as exc_info:
+            async with admission.admit(2, 60):
+                pass
+        async with admission.admit(2, 40):
+            assert admission.inflight_bytes == 100
+
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.headers == {"Retry-After": "7"}
+    assert admission.inflight_bytes == 0
+
+
+@pytest.mark.asyncio
+async def test_request_larger_than_budget_runs_alone():
+    admission = UploadAdmission(FakeRedis(), max_bytes=100)
+
+    async with admission.admit(1, 500):
+        assert admission.inflight_bytes == 100
+
+
+@pytest.mark.asyncio
+async def test_user_concurrency_rejects_with_429():
+    redis = FakeRedis()
+    admission = UploadAdmission(redis, max_bytes=1000, max_per_user=2)
+
+    async with admission.admit(1, 10), admission.admit(1, 10):
+        with pytest.raises(HTTPException) as exc_info:
+            async with admission.admit(1, 10):
+                pass
+        async with admission.admit(2, 10):
+            pass
+
+    assert exc_info.value.status_code == 429
+    assert exc_info.value.detail == ResponseErrorMessage.TOO_MANY_UPLOADS
+    assert redis.data["upload_slots:1"] == {}
+    assert admission.inflight_bytes == 0
+
+
+@pytest.mark.asyncio
+async def test_stale_slots_expire(monkeypatch):
+    redis = FakeRedis()
+    redis.data["upload_slots:1"] = {"crashed": 0.0}
+    admission = UploadAdmission(redis, max_per_user=1, slot_ttl=60)
+
+    async with admission.admit(1, 10):
+        assert "crashed" not in redis.data["upload_slots:1"]
+
+
+@pytest.mark.asyncio
+async def test_redis_failure_fails_open():
+    admission = UploadAdmission(BrokenRedis(), max_per_user=0)
+
+    async with admission.admit(1, 10):
+        assert admission.inflight_bytes == 10
+
+
+async def _noop_blacklist_check():
+    return True
+
+
+@pytest_asyncio.fixture
+async def app_base():
+    app = FastAPI()
+    app.add_middleware(SessionMiddleware, secret_key="test-secret-key")
+    app.include_router(files_router, prefix="/files")
+    app.dependency_overrides[blacklist_check] = _noop_blacklist_check
+    return app
+
+
+class StubFileManagementService:
+    async def add_file(self, file, user_id: int):
+        return {"file_name": file.filename}
+
+
+@pytest.mark.asyncio
+async def test_upload_is_rejected_when_user_is_at_capacity(app_base, upload_admission):
+    upload_admission.max_per_user = 0
+    app_base.dependency_overrides[get_file_manager] = lambda: StubFileManagementService()
+
+    async with AsyncClient(transport=ASGITransport(app=app_base), base_url="http://test") as ac:
+        resp = await ac.post("/files/upload", files={"file": ("doc.txt", b"hello", "text/plain")})
+
+    assert resp.status_code == 429
+    assert resp.headers["retry-after"] == str(upload_admission.retry_after)
+
+
+@pytest.mark.asyncio
+async def test_rejected_upload_body_is_not_parsed(app_base, upload_admission, monkeypatch):
+    async def _form(*args, **kwargs):
+        raise AssertionError("body parsed before admission")
+
+    monkeypatch.setattr("starlette.requests.Request.form", _form)
+    upload_admission.max_bytes = 100
+    upload_admission.inflight_bytes = 90
+    app_base.dependency_overrides[get_file_manager] = lambda: StubFileManagementService()
+
+    async with AsyncClient(transport=ASGITransport(app=app_base), base_url="http://test") as ac:
+        single = await ac.post("/files/upload", files={"file": ("doc.txt", b"x" * 50, "text/plain")})
+        batch = await ac.post("/files/upload-batch", files=[("files", ("doc.txt", b"x" * 50, "text/plain"))])
+
+    assert single.status_code == 503
+    assert batch.status_code == 503
@@ -0,0 +1,190 @@
+import asyncio
+import hashlib
+from io import BytesIO
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from httpx import AsyncClient, ASGITransport
+from sqlalchemy.dialects import postgresql
+from starlette.middleware.sessions import SessionMiddleware
+
+from src.app.auth.utils import blacklist_check
+from src.app.file_management.routers import router as files_router, get_file_manager
+from src.app.file_management.services import FileManagementService
+from src.app.responses.statuses import ResponseErrorMessage
+
+
+class FakeS3Client:
+    def __init__(self, failing_keys=()):
+        self.failing_keys = set(failing_keys)
+        self.put_keys = []
+        self.active = 0
+        self.max_active = 0
+
+    async def put_object(self, Bucket, Key, Body):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0)
+        self.active -= 1
+        if Key in self.failing_keys:
+            raise ConnectionError("S3 is down")
+        self.put_keys.append(Key)
+
+
+class FakeUploadFile:
+    def __init__(self, filename: str, content: bytes):
+        self.filename = filename
+        self.size = len(content)
+        self._stream = BytesIO(content)
+
+    async def read(self, size: int = -1) -> bytes:
+        return self._stream.read(size)
+
+    async def seek(self, offset: int) -> None:
+        self._stream.seek(offset)
+
+
+class StubResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def tuples(self):
+        return self
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self.rows
+
+
+class StubDB:
+    def __init__(self, shared_rows=(), removed_keys=()):
+        self.shared_rows = list(shared_rows)
+        self.removed_keys = set(removed_keys)
+        self.added = []
+        self.commits = 0
+        self.locks = []
+
+    async def execute(self, stmt):
+        if "FOR SHARE" in str(stmt.compile(dialect=postgresql.dialect())):
+            self.locks.append(self.commits)
+            return StubResult([s3_key for _, s3_key, _ in self.shared_rows if s3_key not in self.removed_keys])
+        return StubResult(self.shared_rows)
+
+    def add_all(self, instances):
+        self.added.extend(instances)
+
+    async def commit(self):
+        self.commits += 1
+
+
+def _sha256(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+@pytest.mark.asyncio
+async def test_add_files_transfers_concurrently_and_adds_rows_at_once(monkeypatch):
+    monkeypatch.setattr("src.app.file_management.services.BATCH_UPLOAD_CONCURRENCY", 2)
+    service = FileManagementService(StubDB())
+    service.s3_client = FakeS3Client()
+    files = [FakeUploadFile(f"doc{i}.txt", f"content {i}".encode()) for i in range(5)]
+
+    result = await service.add_files(files, user_id=1)
+
+    assert [new_file.file_name for new_file in result["uploaded"]] == [f"doc{i}.txt" for i in range(5)]
+    assert result["failed"] == []
+    assert len(service.s3_client.put_keys) == 5
+    assert service.s3_client.max_active == 2
+    assert service.db.added == result["uploaded"]
+    assert service.db.commits == 2  # the shared object lookup, then the rows
+
+
+@pytest.mark.asyncio
+async def test_add_files_reports_failures_per_file():
+    service = FileManagementService(StubDB(shared_rows=[(_sha256(b"stored"), "old-uuid_stored.txt", None)]))
+    service.s3_client = FakeS3Client()
+    files = [
+        FakeUploadFile("stored.txt", b"stored"),
+        FakeUploadFile("copy.txt", b"same"),
+        FakeUploadFile("copy2.txt", b"same"),
+        FakeUploadFile("fake.pdf", b"not a pdf"),
+        FakeUploadFile("tool.exe", b"MZ"),
+    ]
+
+    result = await service.add_files(files, user_id=1)
+
+    uploaded = {new_file.file_name: new_file for new_file in result["uploaded"]}
+    assert uploaded["stored.txt"].s3_key == "old-uuid_stored.txt"
+    assert uploaded["copy.txt"].s3_key == uploaded["copy2.txt"].s3_key
+    assert service.s3_client.put_keys == [uploaded["copy.txt"].s3_key]
+    assert [failure["file_name"] for failure in result["failed"]] == ["fake.pdf", "tool.exe"]
+    assert service.db.locks == [1]  # locked after the lookup transaction ended, before the rows are added
+
+
+@pytest.mark.asyncio
+async def test_add_files_uploads_shared_object_removed_during_transfers():
+    shared_rows = [(_sha256(b"stored"), "old-uuid_stored.txt", None)]
+    service = FileManagementService(StubDB(shared_rows=shared_rows, removed_keys={"old-uuid_stored.txt"}))
+    service.s3_client = FakeS3Client()
+
+    result = await service.add_files([FakeUploadFile("stored.txt", b"stored")], user_id=1)
+
+    new_file = result["uploaded"][0]
+    assert new_file.s3_key == f"{new_file.file_uuid}_stored.txt"
+    assert service.s3_client.put_keys == [new_file.s3_key]
+
+
+@pytest.mark.asyncio
+async def test_add_files_keeps_rows_of_failed_transfers_out():
+    service = FileManagementService(StubDB())
+    service.s3_client = FakeS3Client()
+    files = [FakeUploadFile("a.txt", b"a"), FakeUploadFile("b.txt", b"b")]
+    original_stream = service._stream_to_s3
+
+    async def stream_to_s3(s3_key, file):
+        if s3_key.endswith("_b.txt"):
+            return {"status": "error", "message": "S3 is down"}
+        return await original_stream(s3_key, file)
+
+    service._stream_to_s3 = stream_to_s3
+
+    result = await service.add_files(files, user_id=1)
+
+    assert [new_file.file_name for new_file in result["uploaded"]] == ["a.txt"]
+    assert result["failed"] == [{"file_name": "b.txt", "detail": "S3 is down"}]
+
+
+async def _noop_blacklist_check():
+    return True
+
+
+@pytest_asyncio.fixture
+async def app_base():
+    app = FastAPI()
+    app.add_middleware(SessionMiddleware, secret_key="test-secret-key")
+    app.include_router(files_router, prefix="/files")
+    app.dependency_overrides[blacklist_check] = _noop_blacklist_check
+    return app
+
+
+class StubFileManagementService:
+    async def add_files(self, files, user_id: int):
+        return {"uploaded": [{"file_name": file.filename} for file in files], "failed": []}
+
+
+@pytest.mark.asyncio
+async def test_batch_upload_endpoint(app_base, monkeypatch):
+    monkeypatch.setattr("src.app.file_management.routers.BATCH_UPLOAD_MAX_FILES", 2)
+    app_base.dependency_overrides[get_file_manager] = lambda: StubFileManagementService()
+    two_files = [("files", ("a.txt", b"a", "text/plain")), ("files", ("b.txt", b"b", "text/plain"))]
+
+    async with AsyncClient(transport=ASGITransport(app=app_base), base_url="http://test") as ac:
+        resp = await ac.post("/files/upload-batch", files=two_files)
+        too_many = await ac.post("/files/upload-batch", files=two_files + [("files", ("c.txt", b"c", "text/plain"))])
+
+    assert resp.status_code == 201
+    assert resp.json() == {"uploaded": [{"file_name": "a.txt"}, {"file_name": "b.txt"}], "failed": []}
+    assert too_many.status_code == 400
+    assert too_many.json() == {"message": ResponseErrorMessage.TOO_MANY_FILES}
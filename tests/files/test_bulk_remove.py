@@ -0,0 +1,129 @@
+import json
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from httpx import AsyncClient, ASGITransport
+from starlette.middleware.sessions import SessionMiddleware
+
+from src.app.auth.utils import blacklist_check
+from src.app.file_management.routers import router as files_router, get_file_manager
+from src.app.file_management.services import FileManagementService
+from src.app.file_management.url_cache import PresignedUrlCache
+from src.app.responses.statuses import ResponseErrorMessage
+
+
+class StubResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def tuples(self):
+        return self
+
+    def all(self):
+        return self.rows
+
+    def scalar_one_or_none(self):
+        return self.rows[0][1] if self.rows else None
+
+
+class StubDB:
+    def __init__(self, owned):
+        self.owned = owned
+        self.statements = []
+        self.committed = False
+
+    async def execute(self, stmt):
+        self.statements.append(str(stmt))
+        return StubResult(list(self.owned.items()))
+
+    async def commit(self):
+        self.committed = True
+
+
+class StubReaper:
+    def __init__(self):
+        self.notified = False
+
+    def notify(self):
+        self.notified = True
+
+
+@pytest.fixture
+def reaper(monkeypatch):
+    stub_reaper = StubReaper()
+    monkeypatch.setattr("src.app.file_management.services.file_reaper", stub_reaper)
+    return stub_reaper
+
+
+def _service(owned):
+    service = FileManagementService(StubDB(owned))
+    service.url_cache = PresignedUrlCache()
+    return service
+
+
+@pytest.mark.asyncio
+async def test_remove_files_tombstones_in_one_statement(reaper):
+    service = _service({1: "uuid1_a.txt", 2: "uuid2_b.txt"})
+
+    result = await service.remove_files([1, 2, 3, 1], user_id=7)
+
+    assert result == {
+        "deleted": [1, 2],
+        "failed": [{"file_id": 3, "message": ResponseErrorMessage.FILE_DOES_NOT_EXIST}],
+    }
+    assert len(service.db.statements) == 1
+    assert service.db.statements[0].startswith("UPDATE files SET deleted_at=now()")
+    assert "files.deleted_at IS NULL RETURNING files.id, files.s3_key" in service.db.statements[0]
+    assert service.db.committed is True
+    assert reaper.notified is True
+
+
+@pytest.mark.asyncio
+async def test_remove_files_nothing_owned(reaper):
+    service = _service({})
+
+    result = await service.remove_files([1], user_id=7)
+
+    assert result == {"deleted": [], "failed": [{"file_id": 1, "message": ResponseErrorMessage.FILE_DOES_NOT_EXIST}]}
+    assert reaper.notified is False
+
+
+@pytest.mark.asyncio
+async def test_remove_file_does_not_touch_s3(reaper):
+    service = _service({1: "uuid1_a.txt"})
+    service.s3_client = None
+
+    assert await service.remove_file(1, user_id=7) == {"detail": "File deleted successfully"}
+    assert service.db.statements[0].startswith("UPDATE files SET deleted_at=now()")
+    assert reaper.notified is True
+
+
+async def _noop_blacklist_check():
+    return True
+
+
+@pytest_asyncio.fixture
+async def app_base():
+    app = FastAPI()
+    app.add_middleware(SessionMiddleware, secret_key="test-secret-key")
+    app.include_router(files_router, prefix="/files")
+    app.dependency_overrides[blacklist_check] = _noop_blacklist_check
+    return app
+
+
+class StubFileManagementService:
+    async def remove_files(self, file_ids: list[int], user_id: int):
+        return {"deleted": file_ids, "failed": []}
+
+
+@pytest.mark.asyncio
+async def test_bulk_remove_endpoint(app_base):
+    app_base.dependency_overrides[get_file_manager] = lambda: StubFileManagementService()
+    async with AsyncClient(transport=ASGITransport(app=app_base), base_url="http://test") as ac:
+        resp = await ac.post("/files/remove", content=json.dumps({"file_ids": [1, 2]}))
+        empty = await ac.post("/files/remove", content=json.dumps({"file_ids": []}))
+
+    assert resp.status_code == 200
+    assert resp.json() == {"deleted": [1, 2], "failed": []}
+    assert empty.status_code == 422
@@ -0,0 +1,126 @@
+import asyncio
+import json
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from httpx import AsyncClient, ASGITransport
+from starlette.middleware.sessions import SessionMiddleware
+
+from src.app.auth.utils import blacklist_check
+from src.app.file_management.jobs import JobCoalescer
+from src.app.file_management.routers import router as files_router, get_file_manager
+from src.app.responses.statuses import ProcessingStatus
+
+
+class StubFileManagementService:
+    async def check_user_file(self, s3_key: str, user_id: int) -> bool:
+        return True
+
+
+async def _noop_blacklist_check():
+    return True
+
+
+@pytest_asyncio.fixture
+async def app_base():
+    app = FastAPI()
+    app.add_middleware(SessionMiddleware, secret_key="test-secret-key")
+    app.include_router(files_router, prefix="/files")
+    app.dependency_overrides[blacklist_check] = _noop_blacklist_check
+    app.dependency_overrides[get_file_manager] = lambda: StubFileManagementService()
+    return app
+
+
+def test_fingerprint_ignores_parameter_order():
+    first = JobCoalescer.fingerprint("file_parsing", "uuid_file.txt", keywords=["a", "b"], mode="x")
+    second = JobCoalescer.fingerprint("file_parsing", "uuid_file.txt", mode="x", keywords=["a", "b"])
+    other = JobCoalescer.fingerprint("file_parsing", "uuid_file.txt", keywords=["a"], mode="x")
+
+    assert first == second
+    assert first != other
+
+
+@pytest.mark.asyncio
+async def test_concurrent_duplicates_enqueue_once(job_coalescer):
+    sent = []
+    release = asyncio.Event()
+
+    async def enqueue():
+        sent.append(1)
+        await release.wait()
+        return "msg-1", True
+
+    tasks = [asyncio.create_task(job_coalescer.run("fp", "file_parsing:uuid", enqueue)) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert sent == [1]
+    assert results == [("msg-1", True)] * 5
+
+
+@pytest.mark.asyncio
+async def test_claim_is_shared_across_processes(job_coalescer):
+    other_process = JobCoalescer(job_coalescer.redis)
+    sent = []
+
+    async def enqueue():
+        sent.append(1)
+        return "msg-1", True
+
+    assert await job_coalescer.run("fp", "file_parsing:uuid", enqueue) == ("msg-1", True)
+    assert await other_process.run("fp", "file_parsing:uuid", enqueue) == (None, True)
+    assert sent == [1]
+
+
+@pytest.mark.asyncio
+async def test_resolve_releases_claim(job_coalescer):
+    sent = []
+
+    async def enqueue():
+        sent.append(1)
+        return "msg", True
+
+    await job_coalescer.run("fp", "file_parsing:uuid", enqueue)
+    await job_coalescer.resolve("file_parsing:uuid")
+    await job_coalescer.run("fp", "file_parsing:uuid", enqueue)
+
+    assert sent == [1, 1]
+
+
+@pytest.mark.asyncio
+async def test_failed_enqueue_releases_claim(job_coalescer):
+    results = iter([("SQS error", False), ("msg", True)])
+
+    async def enqueue():
+        return next(results)
+
+    assert await job_coalescer.run("fp", "file_parsing:uuid", enqueue) == ("SQS error", False)
+    assert await job_coalescer.run("fp", "file_parsing:uuid", enqueue) == ("msg", True)
+
+
+@pytest.mark.asyncio
+async def test_duplicate_parse_requests_share_one_job(app_base, monkeypatch):
+    sent = []
+
+    async def _mock_enqueue_job(queue, body, db=None):
+        sent.append(json.loads(body))
+        return ("ok", True)
+
+    async def _mock_wait_for_cache(s3_key, cache_key):
+        await asyncio.sleep(0.01)
+        return {"status": ProcessingStatus.SUCCESS, "s3_key": s3_key, "count": 1, "sentences": ["one"]}
+
+    monkeypatch.setattr("src.app.file_management.routers.enqueue_job", _mock_enqueue_job)
+    monkeypatch.setattr("src.app.file_management.routers.wait_for_cache", _mock_wait_for_cache)
+
+    async with AsyncClient(transport=ASGITransport(app=app_base), base_url="http://test") as ac:
+        responses = await asyncio.gather(
+            ac.post("/files/parse-file", content=json.dumps({"s3_key": "uuid_file.txt", "keywords": ["a", "b"]})),
+            ac.post("/files/parse-file", content=json.dumps({"s3_key": "uuid_file.txt", "keywords": ["b", "a"]})),
+            ac.post("/files/parse-file", content=json.dumps({"s3_key": "uuid_file.txt", "keywords": ["c"]})),
+        )
+
+    assert [resp.status_code for resp in responses] == [200, 200, 200]
+    assert sorted(body["keywords"] for body in sent) == [["a", "b"], ["c"]]
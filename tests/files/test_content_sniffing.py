@@ -0,0 +1,67 @@
+from io import BytesIO
+
+import pytest
+
+from src.app.validators.file_validation import FileValidator, sniff_content_type
+
+
+@pytest.mark.parametrize(
+    "head, content_type",
+    [
+        (b"%PDF-1.7\n%\xe2\xe3\xcf\xd3", "pdf"),
+        (b"PK\x03\x04\x14\x00\x06\x00[Content_Types].xml", "zip"),
+        (b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1\x00\x00", "ole"),
+        (b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR", "png"),
+        (b"\xff\xd8\xff\xe0\x00\x10JFIF", "jpeg"),
+        ("Plain text, café\n".encode("utf-8"), "text"),
+        ("truncated é".encode("utf-8")[:-1], "text"),
+        (b"\xff\xfeh\x00i\x00", "text"),
+        (b"MZ\x90\x00\x03\x00\x00\x00", None),
+        (b"\x7fELF\x02\x01\x01", None),
+        (b"caf\xe9 latin-1", None),
+    ],
+)
+def test_sniff_content_type(head, content_type):
+    assert sniff_content_type(head) == content_type
+
+
+def test_sniff_ignores_bytes_past_the_head(monkeypatch):
+    monkeypatch.setattr("src.app.validators.file_validation.CONTENT_SNIFF_BYTES", 8)
+
+    # A whole upload chunk may be passed: the binary tail past the head is not inspected
+    assert sniff_content_type(b"plain te" + b"\x00\x01" * 1024) == "text"
+
+
+def test_content_must_match_extension():
+    validator = FileValidator()
+
+    assert validator.content_matches_type("report.pdf", b"%PDF-1.4") is True
+    assert validator.content_matches_type("report.docx", b"PK\x03\x04") is True
+    assert validator.content_matches_type("report.docx", b"%PDF-1.4") is False
+    assert validator.content_matches_type("photo.jpg", b"\x89PNG\r\n\x1a\n") is False
+    assert validator.content_matches_type("notes.txt", b"MZ\x90\x00") is False
+    assert validator.content_matches_type("script.exe", b"plain text") is False
+
+
+class FakeUploadFile:
+    def __init__(self, filename: str, content: bytes):
+        self.filename = filename
+        self._stream = BytesIO(content)
+        self.reads = []
+
+    async def read(self, size: int = -1) -> bytes:
+        self.reads.append(size)
+        return self._stream.read(size)
+
+    async def seek(self, offset: int) -> None:
+        self._stream.seek(offset)
+
+
+@pytest.mark.asyncio
+async def test_validate_content_reads_only_the_head(monkeypatch):
+    monkeypatch.setattr("src.app.validators.file_validation.CONTENT_SNIFF_BYTES", 8)
+    file = FakeUploadFile("report.pdf", b"%PDF-1.7" + b"\x00" * 100)
+
+    assert await FileValidator().validate_content(file) is True
+    assert file.reads == [8]
+    assert await file.read() == b"%PDF-1.7" + b"\x00" * 100
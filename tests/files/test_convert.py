@@ -12,15 +12,35 @@ from src.app.responses.statuses import ResponseErrorMessage, ProcessingStatus
 
 
 class StubFileManagementServiceDownloadSuccess:
+    async def check_user_file(self, s3_key: str, user_id: int) -> bool:
+        return True
+
+    async def detach_shared_object(self, s3_key: str, user_id: int):
+        return s3_key
+
     async def download_file(self, s3_key: str):
         return {"message": "converted", "s3_key": s3_key}
 
 
 class StubFileManagementServiceDownloadError:
+    async def check_user_file(self, s3_key: str, user_id: int) -> bool:
+        return True
+
+    async def detach_shared_object(self, s3_key: str, user_id: int):
+        return s3_key
+
     async def download_file(self, s3_key: str):
         raise Exception("Download failed")
 
 
+class StubFileManagementServiceNotOwner:
+    async def check_user_file(self, s3_key: str, user_id: int) -> bool:
+        return False
+
+    async def detach_shared_object(self, s3_key: str, user_id: int):
+        raise AssertionError("must not touch files of other users")
+
+
 async def _noop_blacklist_check():
     return True
 
@@ -38,7 +58,7 @@ async def app_base():
 async def test_convert_success(app_base, monkeypatch):
     app_base.dependency_overrides[get_file_manager] = lambda: StubFileManagementServiceDownloadSuccess()
 
-    async def _mock_send_message_to_sqs(queue_url, body):
+    async def _mock_enqueue_job(queue, body, db=None):
         return ("ok", True)
 
     async def _mock_wait_for_cache(s3_key, cache_key):
@@ -48,7 +68,7 @@ async def test_convert_success(app_base, monkeypatch):
         }
 
     # Monkeypatch external calls used in the route
-    monkeypatch.setattr("src.app.file_management.routers.send_message_to_sqs", _mock_send_message_to_sqs)
+    monkeypatch.setattr("src.app.file_management.routers.enqueue_job", _mock_enqueue_job)
     monkeypatch.setattr("src.app.file_management.routers.wait_for_cache", _mock_wait_for_cache)
 
     async with AsyncClient(transport=ASGITransport(app=app_base), base_url="http://test") as ac:
@@ -65,13 +85,13 @@ async def test_convert_success(app_base, monkeypatch):
 async def test_convert_sqs_error(app_base, monkeypatch):
     app_base.dependency_overrides[get_file_manager] = lambda: StubFileManagementServiceDownloadSuccess()
 
-    async def _mock_send_message_to_sqs(queue_url, body):
+    async def _mock_enqueue_job(queue, body, db=None):
         return ("enqueue error", False)
 
     async def _mock_wait_for_cache(s3_key, cache_key):
         return None
 
-    monkeypatch.setattr("src.app.file_management.routers.send_message_to_sqs", _mock_send_message_to_sqs)
+    monkeypatch.setattr("src.app.file_management.routers.enqueue_job", _mock_enqueue_job)
     monkeypatch.setattr("src.app.file_management.routers.wait_for_cache", _mock_wait_for_cache)
 
     async with AsyncClient(transport=ASGITransport(app=app_base), base_url="http://test") as ac:
@@ -87,14 +107,14 @@ async def test_convert_sqs_error(app_base, monkeypatch):
 async def test_convert_timeout(app_base, monkeypatch):
     app_base.dependency_overrides[get_file_manager] = lambda: StubFileManagementServiceDownloadSuccess()
 
-    async def _mock_send_message_to_sqs(queue_url, body):
+    async def _mock_enqueue_job(queue, body, db=None):
         return ("ok", True)
 
     async def _mock_wait_for_cache(s3_key, cache_key):
         # Simulate no cached data -> timeout
         return None
 
-    monkeypatch.setattr("src.app.file_management.routers.send_message_to_sqs", _mock_send_message_to_sqs)
+    monkeypatch.setattr("src.app.file_management.routers.enqueue_job", _mock_enqueue_job)
     monkeypatch.setattr("src.app.file_management.routers.wait_for_cache", _mock_wait_for_cache)
 
     async with AsyncClient(transport=ASGITransport(app=app_base), base_url="http://test") as ac:
@@ -109,11 +129,11 @@ async def test_convert_timeout(app_base, monkeypatch):
 async def test_convert_internal_error(app_base, monkeypatch):
     app_base.dependency_overrides[get_file_manager] = lambda: StubFileManagementServiceDownloadSuccess()
 
-    async def _mock_send_message_to_sqs(queue_url, body):
+    async def _mock_enqueue_job(queue, body, db=None):
         # Simulate unexpected exception in SQS send
         raise Exception("boom")
 
-    monkeypatch.setattr("src.app.file_management.routers.send_message_to_sqs", _mock_send_message_to_sqs)
+    monkeypatch.setattr("src.app.file_management.routers.enqueue_job", _mock_enqueue_job)
 
     async with AsyncClient(transport=ASGITransport(app=app_base), base_url="http://test") as ac:
         payload = {"s3_key": "uuid_key_file.txt", "format_from": "txt", "format_to": "pdf"}
@@ -121,3 +141,20 @@ async def test_convert_internal_error(app_base, monkeypatch):
         assert resp.status_code == 500
         data = resp.json()
         assert data["detail"] == ResponseErrorMessage.INTERNAL_ERROR
+
+
+@pytest.mark.asyncio
+async def test_convert_rejects_file_of_other_user(app_base, monkeypatch):
+    app_base.dependency_overrides[get_file_manager] = lambda: StubFileManagementServiceNotOwner()
+
+    async def _fail_lookup(db, kind, s3_key, **params):
+        raise AssertionError("must not look up results of other users' files")
+
+    monkeypatch.setattr("src.app.file_management.routers.result_cache.lookup", _fail_lookup)
+
+    async with AsyncClient(transport=ASGITransport(app=app_base), base_url="http://test") as ac:
+        payload = {"s3_key": "uuid_key_file.txt", "format_from": "txt", "format_to": "pdf"}
+        resp = await ac.post("/files/convert", content=json.dumps(payload))
+
+    assert resp.status_code == 400
+    assert resp.json() == {"message": ResponseErrorMessage.FILE_DOES_NOT_EXIST}
@@ -0,0 +1,188 @@
+import asyncio
+import json
+from io import BytesIO
+
+import pytest
+import pytest_asyncio
+from botocore.exceptions import ClientError
+from fastapi import FastAPI, HTTPException
+from httpx import AsyncClient, ASGITransport
+from starlette.middleware.sessions import SessionMiddleware
+
+from src.app.auth.utils import blacklist_check
+from src.app.file_management.routers import router as files_router, get_file_manager
+from src.app.file_management.services import FileManagementService
+from src.app.file_management.uploads import PendingUploadStore
+from src.app.responses.statuses import ResponseErrorMessage
+from tests.files.conftest import FakeRedis
+
+
+class FakeS3Client:
+    def __init__(self, objects=None):
+        self.objects = objects or {}
+        self.deleted = []
+        self.post_kwargs = None
+
+    async def generate_presigned_post(self, **kwargs):
+        self.post_kwargs = kwargs
+        return {"url": "https://bucket.s3.amazonaws.com/", "fields": {"key": kwargs["Key"], "policy": "p"}}
+
+    async def head_object(self, Bucket, Key):
+        if Key not in self.objects:
+            raise ClientError({"Error": {"Code": "404", "Message": "Not Found"}}, "HeadObject")
+        return {"ContentLength": len(self.objects[Key])}
+
+    async def get_object(self, Bucket, Key, Range):
+        end = int(Range.split("-")[1])
+        return {"Body": BytesIO(self.objects[Key][: end + 1])}
+
+    async def delete_object(self, Bucket, Key):
+        self.deleted.append(Key)
+
+
+class StubDB:
+    def __init__(self):
+        self.added = []
+        self.committed = False
+
+    def add(self, instance):
+        self.added.append(instance)
+
+    async def commit(self):
+        self.committed = True
+
+
+def _service(objects=None):
+    service = FileManagementService(StubDB())
+    service.s3_client = FakeS3Client(objects)
+    return service
+
+
+@pytest.mark.asyncio
+async def test_create_upload_url_limits_content_length():
+    service = _service()
+
+    upload = await service.create_upload_url("doc.txt", 120)
+
+    assert upload["s3_key"] == f"{upload['upload_id']}_doc.txt"
+    assert service.s3_client.post_kwargs["Key"] == upload["s3_key"]
+    assert service.s3_client.post_kwargs["Conditions"] == [["content-length-range", 1, 120]]
+    assert upload["fields"]["key"] == upload["s3_key"]
+
+
+@pytest.mark.asyncio
+async def test_confirm_upload_registers_file():
+    service = _service({"abc_doc.txt": b"plain text " * 10})
+
+    new_file = await service.confirm_upload("abc_doc.txt", "doc.txt", user_id=1)
+
+    assert new_file.file_uuid == "abc"
+    assert new_file.user_id == 1
+    assert service.db.added == [new_file]
+    assert service.db.committed is True
+
+
+@pytest.mark.asyncio
+async def test_confirm_upload_missing_object():
+    service = _service()
+
+    assert await service.confirm_upload("abc_doc.txt", "doc.txt", user_id=1) is None
+    assert service.db.committed is False
+
+
+@pytest.mark.asyncio
+async def test_confirm_upload_deletes_invalid_object(monkeypatch):
+    monkeypatch.setattr("src.app.validators.file_validation.MAX_FILE_SIZE_BYTES", 100)
+    service = _service({"abc_doc.txt": b"plain text " * 10})
+
+    with pytest.raises(HTTPException) as exc_info:
+        await service.confirm_upload("abc_doc.txt", "doc.txt", user_id=1)
+
+    assert exc_info.value.status_code == 400
+    assert service.s3_client.deleted == ["abc_doc.txt"]
+    assert service.db.committed is False
+
+
+@pytest.mark.asyncio
+async def test_confirm_upload_deletes_mismatched_content():
+    service = _service({"abc_doc.pdf": b"MZ\x90\x00\x03\x00\x00\x00"})
+
+    with pytest.raises(HTTPException):
+        await service.confirm_upload("abc_doc.pdf", "doc.pdf", user_id=1)
+
+    assert service.s3_client.deleted == ["abc_doc.pdf"]
+
+
+async def _noop_blacklist_check():
+    return True
+
+
+@pytest_asyncio.fixture
+async def app_base(monkeypatch):
+    monkeypatch.setattr("src.app.file_management.routers.pending_uploads", PendingUploadStore(FakeRedis()))
+    app = FastAPI()
+    app.add_middleware(SessionMiddleware, secret_key="test-secret-key")
+    app.include_router(files_router, prefix="/files")
+    app.dependency_overrides[blacklist_check] = _noop_blacklist_check
+    return app
+
+
+class StubFileManagementService:
+    def __init__(self):
+        self.uploaded = False
+
+    async def create_upload_url(self, file_name: str, file_size: int):
+        return {"upload_id": "abc", "s3_key": f"abc_{file_name}", "url": "u", "fields": {}, "expires_in": 900}
+
+    async def confirm_upload(self, s3_key: str, file_name: str, user_id: int):
+        if not self.uploaded:
+            return None
+        return {"file_name": file_name, "s3_key": s3_key}
+
+
+@pytest.mark.asyncio
+async def test_direct_upload_flow(app_base):
+    service = StubFileManagementService()
+    app_base.dependency_overrides[get_file_manager] = lambda: service
+    async with AsyncClient(transport=ASGITransport(app=app_base), base_url="http://test") as ac:
+        invalid = await ac.post("/files/upload-url", content=json.dumps({"file_name": "doc.exe", "file_size": 10}))
+        upload = await ac.post("/files/upload-url", content=json.dumps({"file_name": "doc.txt", "file_size": 10}))
+        early = await ac.post("/files/upload-confirm", content=json.dumps({"upload_id": "abc"}))
+        service.uploaded = True
+        confirmed = await ac.post("/files/upload-confirm", content=json.dumps({"upload_id": "abc"}))
+        again = await ac.post("/files/upload-confirm", content=json.dumps({"upload_id": "abc"}))
+
+    assert invalid.status_code == 400
+    assert upload.status_code == 201
+    assert upload.json()["upload_id"] == "abc"
+    assert early.status_code == 409
+    assert early.json() == {"message": ResponseErrorMessage.UPLOAD_NOT_COMPLETED}
+    assert confirmed.status_code == 201
+    assert confirmed.json() == {"file_name": "doc.txt", "s3_key": "abc_doc.txt"}
+    assert again.status_code == 404
+
+
+class SlowConfirmService(StubFileManagementService):
+    def __init__(self):
+        super().__init__()
+        self.uploaded = True
+        self.confirmed = 0
+
+    async def confirm_upload(self, s3_key: str, file_name: str, user_id: int):
+        self.confirmed += 1
+        await asyncio.sleep(0.01)
+        return await super().confirm_upload(s3_key, file_name, user_id)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_confirms_register_once(app_base):
+    service = SlowConfirmService()
+    app_base.dependency_overrides[get_file_manager] = lambda: service
+    async with AsyncClient(transport=ASGITransport(app=app_base), base_url="http://test") as ac:
+        await ac.post("/files/upload-url", content=json.dumps({"file_name": "doc.txt", "file_size": 10}))
+        confirms = await asyncio.gather(
+            *(ac.post("/files/upload-confirm", content=json.dumps({"upload_id": "abc"})) for _ in range(2))
+        )
+
+    assert sorted(resp.status_code for resp in confirms) == [201, 409]
+    assert service.confirmed == 1
@@ -0,0 +1,189 @@
+import json
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from httpx import AsyncClient, ASGITransport
+from starlette.middleware.sessions import SessionMiddleware
+
+from src.app.file_management.routers import router as files_router, get_file_manager
+from src.app.auth.utils import blacklist_check
+from src.app.file_management.jobs import JobStore
+from src.app.responses.statuses import ResponseErrorMessage, ProcessingStatus, JobStatus
+from tests.files.conftest import FakePipeline, FakeRedis
+
+
+class StubFileManagementService:
+    async def detach_shared_object(self, s3_key: str, user_id: int):
+        return s3_key
+
+    async def check_user_file(self, s3_key: str, user_id: int) -> bool:
+        return True
+
+    async def download_file(self, s3_key: str):
+        return {"file_url": f"https://bucket.s3.region.amazonaws.com/presigned/{s3_key}"}
+
+
+class FakeJobStore:
+    def __init__(self, jobs=None):
+        self.jobs = jobs or {}
+        self.deleted = []
+
+    async def create(self, user_id, job_type, s3_key):
+        job_id = f"job-{len(self.jobs) + 1}"
+        self.jobs[job_id] = {
+            "job_id": job_id,
+            "user_id": user_id,
+            "job_type": job_type,
+            "s3_key": s3_key,
+            "status": JobStatus.PENDING,
+        }
+        return job_id
+
+    async def get(self, job_id):
+        return self.jobs.get(job_id)
+
+    async def delete(self, job_id):
+        self.deleted.append(job_id)
+        self.jobs.pop(job_id, None)
+
+
+async def _noop_blacklist_check():
+    return True
+
+
+async def _fail_wait_for_cache(s3_key, cache_key):
+    raise AssertionError("async mode must not wait for the result")
+
+
+@pytest_asyncio.fixture
+async def app_base():
+    app = FastAPI()
+    app.add_middleware(SessionMiddleware, secret_key="test-secret-key")
+    app.include_router(files_router, prefix="/files")
+    app.dependency_overrides[blacklist_check] = _noop_blacklist_check
+    app.dependency_overrides[get_file_manager] = lambda: StubFileManagementService()
+    return app
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "path, payload, job_type",
+    [
+        ("/files/convert", {"s3_key": "uuid_file.txt", "format_from": "txt", "format_to": "pdf"}, "file_conversion"),
+        ("/files/parse-file", {"s3_key": "uuid_file.txt", "keywords": ["foo"]}, "file_parsing"),
+        ("/files/tonality-analysis", {"s3_key": "uuid_file.txt"}, "tonality_analysis"),
+    ],
+)
+async def test_async_mode_returns_accepted_job(app_base, monkeypatch, path, payload, job_type):
+    fake_job_store = FakeJobStore()
+
+    async def _mock_enqueue_job(queue, body, db=None):
+        return ("ok", True)
+
+    monkeypatch.setattr("src.app.file_management.routers.job_store", fake_job_store)
+    monkeypatch.setattr("src.app.file_management.routers.enqueue_job", _mock_enqueue_job)
+    monkeypatch.setattr("src.app.file_management.routers.wait_for_cache", _fail_wait_for_cache)
+
+    async with AsyncClient(transport=ASGITransport(app=app_base), base_url="http://test") as ac:
+        resp = await ac.post(f"{path}?async_mode=true", content=json.dumps(payload))
+
+    assert resp.status_code == 202
+    data = resp.json()
+    assert data["job_id"] == "job-1"
+    assert data["status"] == JobStatus.PENDING
+    assert data["status_url"] == "http://test/files/jobs/job-1"
+    assert fake_job_store.jobs["job-1"]["job_type"] == job_type
+
+
+@pytest.mark.asyncio
+async def test_async_mode_sqs_error_removes_job(app_base, monkeypatch):
+    fake_job_store = FakeJobStore()
+
+    async def _mock_enqueue_job(queue, body, db=None):
+        return ("enqueue error", False)
+
+    monkeypatch.setattr("src.app.file_management.routers.job_store", fake_job_store)
+    monkeypatch.setattr("src.app.file_management.routers.enqueue_job", _mock_enqueue_job)
+
+    async with AsyncClient(transport=ASGITransport(app=app_base), base_url="http://test") as ac:
+        payload = {"s3_key": "uuid_file.txt"}
+        resp = await ac.post("/files/tonality-analysis?async_mode=true", content=json.dumps(payload))
+
+    assert resp.status_code == 500
+    assert fake_job_store.deleted == ["job-1"]
+
+
+@pytest.mark.asyncio
+async def test_job_status_pending(app_base, monkeypatch):
+    fake_job_store = FakeJobStore(
+        {"job-1": {"job_id": "job-1", "user_id": None, "job_type": "file_parsing", "status": JobStatus.PENDING}}
+    )
+    monkeypatch.setattr("src.app.file_management.routers.job_store", fake_job_store)
+
+    async with AsyncClient(transport=ASGITransport(app=app_base), base_url="http://test") as ac:
+        resp = await ac.get("/files/jobs/job-1")
+
+    assert resp.status_code == 200
+    assert resp.json() == {"job_id": "job-1", "status": JobStatus.PENDING}
+
+
+@pytest.mark.asyncio
+async def test_job_status_completed_conversion_returns_download_url(app_base, monkeypatch):
+    fake_job_store = FakeJobStore(
+        {
+            "job-1": {
+                "job_id": "job-1",
+                "user_id": None,
+                "job_type": "file_conversion",
+                "status": JobStatus.COMPLETED,
+                "result": {"status": ProcessingStatus.SUCCESS, "s3_key": "uuid_file.pdf"},
+            }
+        }
+    )
+    monkeypatch.setattr("src.app.file_management.routers.job_store", fake_job_store)
+
+    async with AsyncClient(transport=ASGITransport(app=app_base), base_url="http://test") as ac:
+        resp = await ac.get("/files/jobs/job-1")
+
+    assert resp.status_code == 200
+    data = resp.json()
+    assert data["status"] == JobStatus.COMPLETED
+    assert data["result"]["file_url"].endswith("uuid_file.pdf")
+
+
+@pytest.mark.asyncio
+async def test_job_status_other_users_job_is_hidden(app_base, monkeypatch):
+    fake_job_store = FakeJobStore(
+        {"job-1": {"job_id": "job-1", "user_id": 42, "job_type": "file_parsing", "status": JobStatus.PENDING}}
+    )
+    monkeypatch.setattr("src.app.file_management.routers.job_store", fake_job_store)
+
+    async with AsyncClient(transport=ASGITransport(app=app_base), base_url="http://test") as ac:
+        resp = await ac.get("/files/jobs/job-1")
+
+    assert resp.status_code == 404
+    assert resp.json()["message"] == ResponseErrorMessage.JOB_DOES_NOT_EXIST
+
+
+@pytest.mark.asyncio
+async def test_job_store_resolve_clears_index_atomically():
+    fake_redis = FakeRedis()
+    pipelines = []
+
+    def pipeline(transaction=True):
+        pipelines.append((transaction, FakePipeline(fake_redis)))
+        return pipelines[-1][1]
+
+    fake_redis.pipeline = pipeline
+    store = JobStore(fake_redis)
+    job_id = await store.create(7, "file_parsing", "uuid1_file.txt")
+
+    jobs = await store.resolve("file_parsing:uuid1", {"status": "success"})
+
+    assert [job["job_id"] for job in jobs] == [job_id]
+    assert (await store.get(job_id))["status"] == JobStatus.COMPLETED
+    transaction, resolve_pipe = pipelines[-1]
+    assert transaction is True
+    assert [name for name, _, _ in resolve_pipe.commands] == ["smembers", "delete"]
+    assert "job_index:file_parsing:uuid1" not in fake_redis.data
@@ -0,0 +1,36 @@
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.app.file_management.services import FileManagementService
+
+
+class StubResult:
+    def scalar_one_or_none(self):
+        return None
+
+
+class StubDB:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(str(stmt.compile(dialect=postgresql.dialect())))
+        return StubResult()
+
+
+@pytest.mark.asyncio
+async def test_find_file_by_uuid_uses_indexed_column():
+    db = StubDB()
+    await FileManagementService(db).find_file_by_uuid("550e8400-e29b-41d4-a716-446655440000_report.pdf")
+
+    assert "WHERE files.file_uuid = %(file_uuid_1)s" in db.statements[0]
+    assert "LIKE" not in db.statements[0]
+
+
+@pytest.mark.asyncio
+async def test_check_user_file_selects_id_only():
+    db = StubDB()
+    assert await FileManagementService(db).check_user_file("uuid_report.pdf", user_id=1) is False
+
+    assert db.statements[0].startswith("SELECT files.id \nFROM files")
+    assert "files.s3_key = %(s3_key_1)s AND files.user_id = %(user_id_1)s" in db.statements[0]
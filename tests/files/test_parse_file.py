@@ -38,7 +38,7 @@ async def app_base():
 async def test_parse_file_success(app_base, monkeypatch):
     app_base.dependency_overrides[get_file_manager] = lambda: StubFileManagementServiceUserFileYes()
 
-    async def _mock_send_message_to_sqs(queue_url, body):
+    async def _mock_enqueue_job(queue, body, db=None):
         return ("ok", True)
 
     async def _mock_wait_for_cache(s3_key, cache_key):
@@ -50,7 +50,7 @@ async def test_parse_file_success(app_base, monkeypatch):
         }
 
     # Patch at the import location within routers
-    monkeypatch.setattr("src.app.file_management.routers.send_message_to_sqs", _mock_send_message_to_sqs)
+    monkeypatch.setattr("src.app.file_management.routers.enqueue_job", _mock_enqueue_job)
     monkeypatch.setattr("src.app.file_management.routers.wait_for_cache", _mock_wait_for_cache)
 
     async with AsyncClient(transport=ASGITransport(app=app_base), base_url="http://test") as ac:
@@ -80,13 +80,13 @@ async def test_parse_file_not_user_file(app_base, monkeypatch):
 async def test_parse_file_sqs_error(app_base, monkeypatch):
     app_base.dependency_overrides[get_file_manager] = lambda: StubFileManagementServiceUserFileYes()
 
-    async def _mock_send_message_to_sqs(queue_url, body):
+    async def _mock_enqueue_job(queue, body, db=None):
         return ("enqueue error", False)
 
     async def _mock_wait_for_cache(s3_key, cache_key):
         return None
 
-    monkeypatch.setattr("src.app.file_management.routers.send_message_to_sqs", _mock_send_message_to_sqs)
+    monkeypatch.setattr("src.app.file_management.routers.enqueue_job", _mock_enqueue_job)
     monkeypatch.setattr("src.app.file_management.routers.wait_for_cache", _mock_wait_for_cache)
 
     async with AsyncClient(transport=ASGITransport(app=app_base), base_url="http://test") as ac:
@@ -101,13 +101,13 @@ async def test_parse_file_sqs_error(app_base, monkeypatch):
 async def test_parse_file_timeout(app_base, monkeypatch):
     app_base.dependency_overrides[get_file_manager] = lambda: StubFileManagementServiceUserFileYes()
 
-    async def _mock_send_message_to_sqs(queue_url, body):
+    async def _mock_enqueue_job(queue, body, db=None):
         return ("ok", True)
 
     async def _mock_wait_for_cache(s3_key, cache_key):
         return None
 
-    monkeypatch.setattr("src.app.file_management.routers.send_message_to_sqs", _mock_send_message_to_sqs)
+    monkeypatch.setattr("src.app.file_management.routers.enqueue_job", _mock_enqueue_job)
     monkeypatch.setattr("src.app.file_management.routers.wait_for_cache", _mock_wait_for_cache)
 
     async with AsyncClient(transport=ASGITransport(app=app_base), base_url="http://test") as ac:
@@ -122,10 +122,10 @@ async def test_parse_file_timeout(app_base, monkeypatch):
 async def test_parse_file_internal_error(app_base, monkeypatch):
     app_base.dependency_overrides[get_file_manager] = lambda: StubFileManagementServiceUserFileYes()
 
-    async def _mock_send_message_to_sqs(queue_url, body):
+    async def _mock_enqueue_job(queue, body, db=None):
         raise Exception("boom")
 
-    monkeypatch.setattr("src.app.file_management.routers.send_message_to_sqs", _mock_send_message_to_sqs)
+    monkeypatch.setattr("src.app.file_management.routers.enqueue_job", _mock_enqueue_job)
 
     async with AsyncClient(transport=ASGITransport(app=app_base), base_url="http://test") as ac:
         payload = {"s3_key": "uuid_key_file.txt", "keywords": ["foo"]}
@@ -0,0 +1,109 @@
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.app.file_management.reaper import FileReaper
+
+
+class StubResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def tuples(self):
+        return self
+
+    def all(self):
+        return self.rows
+
+
+class StubTransaction:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class StubSession:
+    def __init__(self, rows, shared_keys=()):
+        self.rows = rows
+        self.shared_keys = [(s3_key,) for s3_key in shared_keys]
+        self.statements = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def begin(self):
+        return StubTransaction()
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        return StubResult({1: self.rows, 2: self.shared_keys}.get(len(self.statements), []))
+
+
+class FakeS3Client:
+    def __init__(self, failing_keys=(), error=None):
+        self.failing_keys = set(failing_keys)
+        self.error = error
+        self.calls = []
+
+    async def delete_objects(self, Bucket, Delete):
+        self.calls.append([obj["Key"] for obj in Delete["Objects"]])
+        if self.error:
+            raise self.error
+        return {
+            "Errors": [{"Key": key, "Message": "Access Denied"} for key in self.calls[-1] if key in self.failing_keys]
+        }
+
+
+@pytest.mark.asyncio
+async def test_reap_batch_purges_deleted_objects_and_retries_failures():
+    session = StubSession([(1, "uuid1_a.txt"), (2, "uuid2_b.txt")])
+    s3 = FakeS3Client(failing_keys={"uuid2_b.txt"})
+    reaper = FileReaper(lambda: session, s3, bucket="bucket", batch_size=10, poll_interval=1)
+
+    assert await reaper.reap_batch() == 2
+
+    assert s3.calls == [["uuid1_a.txt", "uuid2_b.txt"]]
+    select_stmt, _, delete_stmt, update_stmt = session.statements
+    assert "FOR UPDATE SKIP LOCKED" in str(select_stmt.compile(dialect=postgresql.dialect()))
+    assert delete_stmt.compile().params["id_1"] == [1]
+    assert update_stmt.compile().params["id_1"] == [2]
+    assert "purge_attempts=(files.purge_attempts +" in str(update_stmt)
+
+
+@pytest.mark.asyncio
+async def test_reap_batch_keeps_rows_when_s3_is_down():
+    session = StubSession([(1, "uuid1_a.txt")])
+    reaper = FileReaper(lambda: session, FakeS3Client(error=ConnectionError("down")), bucket="bucket")
+
+    assert await reaper.reap_batch() == 1
+    assert [str(stmt).split()[0] for stmt in session.statements] == ["SELECT", "SELECT", "UPDATE"]
+
+
+@pytest.mark.asyncio
+async def test_reap_batch_keeps_objects_with_other_references():
+    session = StubSession([(1, "uuid1_a.txt"), (2, "uuid2_b.txt"), (3, "uuid2_b.txt")], shared_keys=["uuid1_a.txt"])
+    s3 = FakeS3Client()
+    reaper = FileReaper(lambda: session, s3, bucket="bucket")
+
+    assert await reaper.reap_batch() == 3
+
+    assert s3.calls == [["uuid2_b.txt"]]
+    delete_stmt = session.statements[2]
+    assert delete_stmt.compile().params["id_1"] == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_reap_batch_without_tombstones():
+    s3 = FakeS3Client()
+    reaper = FileReaper(lambda: StubSession([]), s3, bucket="bucket")
+
+    assert await reaper.reap_batch() == 0
+    assert s3.calls == []
+
+
+def test_batch_size_is_capped_by_delete_objects_limit():
+    assert FileReaper(None, None, batch_size=5000).batch_size == 1000
@@ -0,0 +1,193 @@
+import json
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from httpx import AsyncClient, ASGITransport
+from starlette.middleware.sessions import SessionMiddleware
+
+from src.app.auth.utils import blacklist_check
+from src.app.file_management.results import ResultCache
+from src.app.file_management.routers import router as files_router, get_file_manager
+from src.app.responses.statuses import ProcessingStatus
+from src.settings.database import get_db
+from tests.files.conftest import FakeRedis
+
+
+class StubResult:
+    def __init__(self, value):
+        self.value = value
+
+    def scalar_one_or_none(self):
+        return self.value
+
+
+class StubSession:
+    def __init__(self, payload=None, content_hash=None):
+        self.payload = payload
+        self.content_hash = content_hash
+        self.statements = []
+        self.committed = False
+
+    async def scalar(self, stmt):
+        return self.content_hash
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        return StubResult(self.payload)
+
+    async def commit(self):
+        self.committed = True
+
+    async def rollback(self):
+        pass
+
+
+PARSE_RESULT = {"status": ProcessingStatus.SUCCESS, "s3_key": "uuid1_a.txt", "count": 1, "sentences": ["one"]}
+
+
+@pytest.fixture
+def session():
+    return StubSession()
+
+
+@pytest.fixture
+def cache():
+    return ResultCache(FakeRedis(), ttl=60, max_entries=10, trim_every=2)
+
+
+@pytest.mark.asyncio
+async def test_hot_tier_hit_skips_database(cache, session):
+    await cache.redis.set("result:abc", json.dumps(PARSE_RESULT))
+
+    assert await cache.get(session, "abc") == PARSE_RESULT
+    assert session.statements == []
+
+
+@pytest.mark.asyncio
+async def test_cold_tier_hit_is_promoted(cache, session):
+    session.payload = PARSE_RESULT
+
+    assert await cache.get(session, "abc") == PARSE_RESULT
+    assert json.loads(cache.redis.data["result:abc"]) == PARSE_RESULT
+    assert session.committed is True
+
+
+@pytest.mark.asyncio
+async def test_miss(cache, session):
+    assert await cache.get(session, "abc") is None
+    assert "result:abc" not in cache.redis.data
+
+
+@pytest.mark.asyncio
+async def test_put_stores_both_tiers_and_trims_periodically(cache, session):
+    await cache.put(session, "abc", "file_parsing", PARSE_RESULT)
+    assert json.loads(cache.redis.data["result:abc"]) == PARSE_RESULT
+    assert len(session.statements) == 1
+
+    await cache.put(session, "def", "file_parsing", PARSE_RESULT)
+    assert len(session.statements) == 3
+    assert "DELETE FROM processing_results" in str(session.statements[-1])
+
+
+@pytest.mark.asyncio
+async def test_lookup_digest_depends_on_content_and_params(cache):
+    digest, result = await cache.lookup(
+        StubSession(content_hash="hash-1"), "file_parsing", "uuid1_a.txt", keywords=["a"]
+    )
+    same_content, _ = await cache.lookup(
+        StubSession(content_hash="hash-1"), "file_parsing", "uuid2_b.txt", keywords=["a"]
+    )
+    other_params, _ = await cache.lookup(
+        StubSession(content_hash="hash-1"), "file_parsing", "uuid1_a.txt", keywords=["b"]
+    )
+
+    assert result is None
+    assert digest == same_content
+    assert digest != other_params
+
+
+@pytest.mark.asyncio
+async def test_lookup_reads_cold_tier_on_request_session(cache):
+    db = StubSession(payload=PARSE_RESULT, content_hash="hash-1")
+
+    _, result = await cache.lookup(db, "file_parsing", "uuid1_a.txt", keywords=["a"])
+
+    assert result == PARSE_RESULT
+    assert "UPDATE processing_results" in str(db.statements[0])
+    assert db.committed is True
+
+
+@pytest.mark.asyncio
+async def test_lookup_without_content_hash(cache):
+    assert await cache.lookup(StubSession(), "file_parsing", "uuid1_a.txt", keywords=["a"]) == (None, None)
+
+
+class StubFileManagementService:
+    async def check_user_file(self, s3_key: str, user_id: int) -> bool:
+        return True
+
+
+class HitResultCache:
+    async def lookup(self, db, kind, s3_key, **params):
+        return "d" * 64, PARSE_RESULT
+
+
+async def _noop_blacklist_check():
+    return True
+
+
+async def _override_get_db():
+    return None
+
+
+@pytest_asyncio.fixture
+async def app_base(monkeypatch):
+    app = FastAPI()
+    app.add_middleware(SessionMiddleware, secret_key="test-secret-key")
+    app.include_router(files_router, prefix="/files")
+    app.dependency_overrides[blacklist_check] = _noop_blacklist_check
+    app.dependency_overrides[get_file_manager] = lambda: StubFileManagementService()
+    app.dependency_overrides[get_db] = _override_get_db
+    monkeypatch.setattr("src.app.file_management.routers.result_cache", HitResultCache())
+    return app
+
+
+@pytest.mark.asyncio
+async def test_cached_result_skips_queue(app_base, monkeypatch):
+    async def _fail_enqueue_job(queue, body, db=None):
+        raise AssertionError("a cached result must not be enqueued")
+
+    monkeypatch.setattr("src.app.file_management.routers.enqueue_job", _fail_enqueue_job)
+
+    async with AsyncClient(transport=ASGITransport(app=app_base), base_url="http://test") as ac:
+        resp = await ac.post("/files/parse-file", content=json.dumps({"s3_key": "uuid2_b.txt", "keywords": ["a"]}))
+
+    assert resp.status_code == 200
+    assert resp.json() == {**PARSE_RESULT, "s3_key": "uuid2_b.txt"}
+
+
+@pytest.mark.asyncio
+async def test_digest_is_passed_to_the_webhook(app_base, monkeypatch):
+    sent = []
+
+    class MissResultCache:
+        async def lookup(self, db, kind, s3_key, **params):
+            return "d" * 64, None
+
+    async def _mock_enqueue_job(queue, body, db=None):
+        sent.append(json.loads(body))
+        return ("ok", True)
+
+    async def _mock_wait_for_cache(s3_key, cache_key):
+        return PARSE_RESULT
+
+    monkeypatch.setattr("src.app.file_management.routers.result_cache", MissResultCache())
+    monkeypatch.setattr("src.app.file_management.routers.enqueue_job", _mock_enqueue_job)
+    monkeypatch.setattr("src.app.file_management.routers.wait_for_cache", _mock_wait_for_cache)
+
+    async with AsyncClient(transport=ASGITransport(app=app_base), base_url="http://test") as ac:
+        resp = await ac.post("/files/parse-file", content=json.dumps({"s3_key": "uuid1_a.txt", "keywords": ["a"]}))
+
+    assert resp.status_code == 200
+    assert sent[0]["callback_url"].endswith(f"?result_digest={'d' * 64}")
@@ -0,0 +1,146 @@
+import json
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from httpx import AsyncClient, ASGITransport
+from starlette.middleware.sessions import SessionMiddleware
+
+from src.app.auth.utils import blacklist_check
+from src.app.file_management.routers import router as files_router, get_file_manager
+from src.app.file_management.services import FileManagementService
+from src.app.file_management.uploads import (
+    ResumableUploadStore,
+    chunk_part_number,
+    missing_parts,
+    received_offset,
+)
+from src.app.responses.statuses import ResponseErrorMessage
+from tests.files.conftest import FakeRedis
+
+
+def test_chunk_part_number():
+    assert chunk_part_number(0, 4, file_size=10, chunk_size=4) == 1
+    assert chunk_part_number(8, 2, file_size=10, chunk_size=4) == 3
+
+    for offset, length in [(2, 4), (4, 3), (8, 4), (12, 4), (-4, 4)]:
+        with pytest.raises(ValueError):
+            chunk_part_number(offset, length, file_size=10, chunk_size=4)
+
+
+def test_received_offset_stops_at_first_gap():
+    upload = {"file_size": 10, "parts": {1: "a", 3: "c"}}
+
+    assert missing_parts(upload, chunk_size=4) == [2]
+    assert received_offset(upload, chunk_size=4) == 4
+    upload["parts"][2] = "b"
+    assert received_offset(upload, chunk_size=4) == 10
+
+
+@pytest.mark.asyncio
+async def test_store_keeps_parts_per_owner():
+    store = ResumableUploadStore(FakeRedis())
+    await store.create("abc", 1, "abc_doc.txt", "doc.txt", 10, "mp-1")
+    await store.add_part("abc", 2, '"etag-2"')
+
+    upload = await store.get("abc", 1)
+
+    assert upload["multipart_id"] == "mp-1"
+    assert upload["file_size"] == 10
+    assert upload["parts"] == {2: '"etag-2"'}
+    assert await store.get("abc", 2) is None
+
+
+class FakeS3Client:
+    def __init__(self):
+        self.completed = None
+
+    async def complete_multipart_upload(self, **kwargs):
+        self.completed = kwargs
+
+
+class StubDB:
+    def __init__(self):
+        self.added = []
+
+    def add(self, instance):
+        self.added.append(instance)
+
+    async def commit(self):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_complete_orders_parts_and_registers_file():
+    service = FileManagementService(StubDB())
+    service.s3_client = FakeS3Client()
+    upload = {"s3_key": "abc_doc.txt", "file_name": "doc.txt", "multipart_id": "mp-1", "parts": {2: "b", 1: "a"}}
+
+    new_file = await service.complete_resumable_upload(upload, user_id=1)
+
+    assert service.s3_client.completed["MultipartUpload"]["Parts"] == [
+        {"ETag": "a", "PartNumber": 1},
+        {"ETag": "b", "PartNumber": 2},
+    ]
+    assert new_file.file_uuid == "abc"
+    assert service.db.added == [new_file]
+
+
+async def _noop_blacklist_check():
+    return True
+
+
+@pytest_asyncio.fixture
+async def app_base(monkeypatch):
+    monkeypatch.setattr("src.app.file_management.routers.resumable_uploads", ResumableUploadStore(FakeRedis()))
+    monkeypatch.setattr("src.app.file_management.routers.UPLOAD_CHUNK_SIZE", 4)
+    app = FastAPI()
+    app.add_middleware(SessionMiddleware, secret_key="test-secret-key")
+    app.include_router(files_router, prefix="/files")
+    app.dependency_overrides[blacklist_check] = _noop_blacklist_check
+    return app
+
+
+class StubFileManagementService:
+    def __init__(self):
+        self.chunks = {}
+
+    async def start_resumable_upload(self, file_name: str):
+        return {"upload_id": "abc", "s3_key": f"abc_{file_name}", "multipart_id": "mp-1"}
+
+    async def upload_chunk(self, upload: dict, part_number: int, body: bytes):
+        self.chunks[part_number] = body
+        return f"etag-{part_number}"
+
+    async def complete_resumable_upload(self, upload: dict, user_id: int):
+        return {"file_name": upload["file_name"], "parts": sorted(upload["parts"])}
+
+
+@pytest.mark.asyncio
+async def test_resumable_upload_flow(app_base):
+    service = StubFileManagementService()
+    app_base.dependency_overrides[get_file_manager] = lambda: service
+
+    async with AsyncClient(transport=ASGITransport(app=app_base), base_url="http://test") as ac:
+        created = await ac.post("/files/uploads", content=json.dumps({"file_name": "doc.txt", "file_size": 10}))
+        await ac.put("/files/uploads/abc", params={"offset": 0}, content=b"0123")
+        await ac.put("/files/uploads/abc", params={"offset": 8}, content=b"89")
+        bad_chunk = await ac.put("/files/uploads/abc", params={"offset": 4}, content=b"45")
+        early = await ac.post("/files/uploads/abc/complete")
+        status = await ac.get("/files/uploads/abc")
+        resumed = await ac.put("/files/uploads/abc", params={"offset": status.json()["offset"]}, content=b"4567")
+        completed = await ac.post("/files/uploads/abc/complete")
+        gone = await ac.get("/files/uploads/abc")
+
+    assert created.status_code == 201
+    assert created.json()["offset"] == 0
+    assert bad_chunk.status_code == 400
+    assert bad_chunk.json() == {"message": ResponseErrorMessage.INVALID_CHUNK}
+    assert early.status_code == 409
+    assert status.json()["offset"] == 4
+    assert status.json()["missing_parts"] == [2]
+    assert resumed.json()["offset"] == 10
+    assert completed.status_code == 201
+    assert completed.json() == {"file_name": "doc.txt", "parts": [1, 2, 3]}
+    assert service.chunks == {1: b"0123", 2: b"4567", 3: b"89"}
+    assert gone.status_code == 404
@@ -1,3 +1,5 @@
+from datetime import datetime, timezone
+
 import pytest
 import pytest_asyncio
 from fastapi import FastAPI
@@ -6,26 +8,31 @@ from starlette.middleware.sessions import SessionMiddleware
 
 from src.app.file_management.routers import router as files_router, get_file_manager
 from src.app.auth.utils import blacklist_check
+from src.app.file_management.pagination import decode_cursor, encode_cursor
+from src.app.file_management.services import FileManagementService
+from src.app.responses.statuses import ResponseErrorMessage
 
 
 class StubFileManagementService:
-    async def get_files_history(self, user_id: int):
-        # Return empty list behavior
-        return {"detail": "The files have not been uploaded yet"}
+    async def get_files_history(self, user_id: int, limit: int, cursor: str | None):
+        return {"items": [], "next_cursor": None}
 
 
 class StubFileManagementServiceWithFiles:
-    async def get_files_history(self, user_id: int):
-        # Return a mock list of files
-        return [
-            {
-                "id": 1,
-                "file_name": "doc.txt",
-                "s3_url": "https://bucket.s3.region.amazonaws.com/uuid_doc.txt",
-                "s3_key": "uuid_doc.txt",
-                "user_id": user_id,
-            }
-        ]
+    async def get_files_history(self, user_id: int, limit: int, cursor: str | None):
+        # Return a mock page of files
+        return {
+            "items": [
+                {
+                    "id": 1,
+                    "file_name": "doc.txt",
+                    "s3_url": "https://bucket.s3.region.amazonaws.com/uuid_doc.txt",
+                    "s3_key": "uuid_doc.txt",
+                    "uploaded_at": "2025-08-20T10:12:45+00:00",
+                }
+            ],
+            "next_cursor": None,
+        }
 
 
 async def _noop_blacklist_check():
@@ -66,7 +73,7 @@ async def test_files_history_empty(client_empty_history):
     resp = await client_empty_history.get("/files/storage")
     assert resp.status_code == 200
     data = resp.json()
-    assert data == {"detail": "The files have not been uploaded yet"}
+    assert data == {"items": [], "next_cursor": None}
 
 
 @pytest.mark.asyncio
@@ -74,6 +81,86 @@ async def test_files_history_with_items(client_with_files):
     resp = await client_with_files.get("/files/storage")
     assert resp.status_code == 200
     data = resp.json()
-    assert isinstance(data, list)
-    assert len(data) == 1
-    assert data[0]["file_name"] == "doc.txt"
+    assert len(data["items"]) == 1
+    assert data["items"][0]["file_name"] == "doc.txt"
+    assert data["next_cursor"] is None
+
+
+class StubResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def mappings(self):
+        return self
+
+    def all(self):
+        return self.rows
+
+
+class StubDB:
+    def __init__(self, rows):
+        self.rows = rows
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        return StubResult(self.rows)
+
+
+def _rows(count):
+    return [
+        {
+            "id": file_id,
+            "file_name": f"doc{file_id}.txt",
+            "s3_url": f"https://bucket.s3.region.amazonaws.com/uuid{file_id}_doc.txt",
+            "s3_key": f"uuid{file_id}_doc.txt",
+            "uploaded_at": datetime(2025, 8, 20, 10, 0, file_id, tzinfo=timezone.utc),
+        }
+        for file_id in range(count, 0, -1)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_history_page_returns_next_cursor():
+    db = StubDB(_rows(3))
+    page = await FileManagementService(db).get_files_history(user_id=1, limit=2)
+
+    assert [item["id"] for item in page["items"]] == [3, 2]
+    assert decode_cursor(page["next_cursor"]) == (page["items"][-1]["uploaded_at"], 2)
+    sql = str(db.statements[0])
+    assert "files.user_id" in sql and "ORDER BY files.uploaded_at DESC, files.id DESC" in sql
+    assert "content_hash" not in sql
+
+
+@pytest.mark.asyncio
+async def test_history_last_page_has_no_cursor():
+    db = StubDB(_rows(2))
+    cursor = encode_cursor(datetime(2025, 8, 21, tzinfo=timezone.utc), 10)
+    page = await FileManagementService(db).get_files_history(user_id=1, limit=2, cursor=cursor)
+
+    assert len(page["items"]) == 2
+    assert page["next_cursor"] is None
+    assert "(files.uploaded_at, files.id) <" in str(db.statements[0])
+
+
+@pytest.mark.asyncio
+async def test_history_without_files_is_an_empty_page():
+    page = await FileManagementService(StubDB([])).get_files_history(user_id=1, limit=2)
+
+    assert page == {"items": [], "next_cursor": None}
+
+
+@pytest.mark.asyncio
+async def test_history_invalid_cursor(app_base):
+    class StubInvalidCursorService:
+        async def get_files_history(self, user_id: int, limit: int, cursor: str | None):
+            decode_cursor(cursor)
+
+    app_base.dependency_overrides[get_file_manager] = lambda: StubInvalidCursorService()
+    async with AsyncClient(transport=ASGITransport(app=app_base), base_url="http://test") as ac:
+        resp = await ac.get("/files/storage", params={"cursor": "not-a-cursor"})
+        too_large = await ac.get("/files/storage", params={"limit": 10000})
+
+    assert resp.status_code == 400
+    assert resp.json()["detail"] == ResponseErrorMessage.INVALID_CURSOR
+    assert too_large.status_code == 422
@@ -0,0 +1,259 @@
+import gzip
+import hashlib
+from io import BytesIO
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
+
+from src.app.file_management.models import File as FileModel
+from src.app.file_management.services import FileManagementService
+from src.app.responses.statuses import ResponseErrorMessage
+
+
+class FakeS3Client:
+    def __init__(self):
+        self.calls = []
+
+    async def put_object(self, **kwargs):
+        self.calls.append(("put_object", kwargs))
+
+    async def create_multipart_upload(self, **kwargs):
+        self.calls.append(("create_multipart_upload", kwargs))
+        return {"UploadId": "upload-1"}
+
+    async def upload_part(self, **kwargs):
+        self.calls.append(("upload_part", kwargs))
+        return {"ETag": f"etag-{kwargs['PartNumber']}"}
+
+    async def complete_multipart_upload(self, **kwargs):
+        self.calls.append(("complete_multipart_upload", kwargs))
+
+    async def abort_multipart_upload(self, **kwargs):
+        self.calls.append(("abort_multipart_upload", kwargs))
+
+    async def copy_object(self, **kwargs):
+        self.calls.append(("copy_object", kwargs))
+
+    def names(self):
+        return [name for name, _ in self.calls]
+
+
+class FakeUploadFile:
+    def __init__(self, filename: str, content: bytes):
+        self.filename = filename
+        self._stream = BytesIO(content)
+
+    async def read(self, size: int = -1) -> bytes:
+        return self._stream.read(size)
+
+    async def seek(self, offset: int) -> None:
+        self._stream.seek(offset)
+
+
+class StubResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def tuples(self):
+        return self
+
+    def scalars(self):
+        return self
+
+    def first(self):
+        return self.rows[0] if self.rows else None
+
+    def all(self):
+        return self.rows
+
+
+class StubDB:
+    def __init__(self):
+        self.added = []
+        self.committed = False
+        self.shared_object = None
+        self.shared_object_removed = False
+        self.scalar_result = None
+        self.statements = []
+        self.commits = 0
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        if not self.shared_object:
+            return StubResult([])
+        if "FOR SHARE" in str(stmt.compile(dialect=postgresql.dialect())):
+            return StubResult([] if self.shared_object_removed else [self.shared_object[0]])
+        return StubResult([self.shared_object])
+
+    async def scalar(self, stmt):
+        self.statements.append(stmt)
+        return self.scalar_result
+
+    def add(self, instance):
+        self.added.append(instance)
+
+    async def commit(self):
+        self.committed = True
+        self.commits += 1
+
+
+async def _record_commits(db, commits):
+    commits.append(db.commits)
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setattr("src.app.file_management.services.UPLOAD_CHUNK_SIZE", 4)
+    fm_service = FileManagementService(StubDB())
+    fm_service.s3_client = FakeS3Client()
+    return fm_service
+
+
+@pytest.mark.asyncio
+async def test_small_file_uses_single_put(service):
+    new_file = await service.add_file(FakeUploadFile("doc.txt", b"abc"), user_id=1)
+
+    assert service.s3_client.names() == ["put_object"]
+    assert service.s3_client.calls[0][1]["Body"] == b"abc"
+    assert new_file.file_name == "doc.txt"
+    assert new_file.content_hash == hashlib.sha256(b"abc").hexdigest()
+    assert new_file.s3_key == f"{new_file.file_uuid}_doc.txt"
+    assert service.db.committed is True
+
+
+@pytest.mark.asyncio
+async def test_large_file_is_streamed_in_parts(service):
+    await service.add_file(FakeUploadFile("doc.txt", b"0123456789"), user_id=1)
+
+    assert service.s3_client.names() == [
+        "create_multipart_upload",
+        "upload_part",
+        "upload_part",
+        "upload_part",
+        "complete_multipart_upload",
+    ]
+    bodies = [kwargs["Body"] for name, kwargs in service.s3_client.calls if name == "upload_part"]
+    assert bodies == [b"0123", b"4567", b"89"]
+    _, complete_kwargs = service.s3_client.calls[-1]
+    assert [part["PartNumber"] for part in complete_kwargs["MultipartUpload"]["Parts"]] == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_oversized_file_is_rejected_before_upload(service, monkeypatch):
+    monkeypatch.setattr("src.app.file_management.services.MAX_FILE_SIZE_BYTES", 6)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await service.add_file(FakeUploadFile("doc.txt", b"0123456789"), user_id=1)
+
+    assert exc_info.value.status_code == 413
+    assert exc_info.value.detail == ResponseErrorMessage.FILE_TOO_LARGE
+    assert service.s3_client.calls == []
+    assert service.db.committed is False
+
+
+@pytest.mark.asyncio
+async def test_stream_aborts_oversized_upload(service, monkeypatch):
+    monkeypatch.setattr("src.app.file_management.services.MAX_FILE_SIZE_BYTES", 6)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await service._stream_to_s3("abc_doc.txt", FakeUploadFile("doc.txt", b"0123456789"))
+
+    assert exc_info.value.status_code == 413
+    assert service.s3_client.names() == ["create_multipart_upload", "upload_part", "abort_multipart_upload"]
+
+
+@pytest.mark.asyncio
+async def test_duplicate_upload_references_shared_object(service):
+    service.db.shared_object = ("first-uuid_doc.txt", "gzip")
+
+    new_file = await service.add_file(FakeUploadFile("doc.txt", b"abc"), user_id=2)
+
+    assert service.s3_client.calls == []
+    assert new_file.s3_key == "first-uuid_doc.txt"
+    assert new_file.file_uuid != "first-uuid"
+    assert new_file.content_hash == hashlib.sha256(b"abc").hexdigest()
+    assert new_file.content_encoding == "gzip"
+    assert service.db.commits == 2
+    lookup, lock = [str(stmt.compile(dialect=postgresql.dialect())) for stmt in service.db.statements]
+    assert "FOR SHARE" not in lookup
+    assert "files.user_id = " in lookup
+    assert "FOR SHARE" in lock
+
+
+@pytest.mark.asyncio
+async def test_transfer_runs_outside_the_lookup_transaction(service):
+    commits_before_transfer = []
+    service.s3_client.put_object = lambda **kwargs: _record_commits(service.db, commits_before_transfer)
+
+    await service.add_file(FakeUploadFile("doc.txt", b"abc"), user_id=1)
+
+    assert commits_before_transfer == [1]
+    assert service.db.commits == 2
+
+
+@pytest.mark.asyncio
+async def test_shared_object_removed_after_lookup_is_uploaded(service):
+    service.db.shared_object = ("first-uuid_doc.txt", None)
+    service.db.shared_object_removed = True
+
+    new_file = await service.add_file(FakeUploadFile("doc.txt", b"abc"), user_id=2)
+
+    assert service.s3_client.names() == ["put_object"]
+    assert new_file.s3_key == f"{new_file.file_uuid}_doc.txt"
+
+
+@pytest.mark.asyncio
+async def test_detach_shared_object_copies_before_conversion(service):
+    service.db.scalar_result = FileModel(file_name="doc.txt", s3_key="first-uuid_doc.txt", file_uuid="own-uuid")
+
+    assert await service.detach_shared_object("first-uuid_doc.txt", user_id=2) == "own-uuid_doc.txt"
+    assert service.s3_client.calls == [
+        (
+            "copy_object",
+            {
+                "Bucket": service.bucket,
+                "Key": "own-uuid_doc.txt",
+                "CopySource": {"Bucket": service.bucket, "Key": "first-uuid_doc.txt"},
+            },
+        )
+    ]
+    assert service.db.scalar_result.s3_key == "own-uuid_doc.txt"
+    assert service.db.committed is True
+
+
+@pytest.mark.asyncio
+async def test_detach_own_object_is_a_noop(service):
+    service.db.scalar_result = FileModel(file_name="doc.txt", s3_key="own-uuid_doc.txt", file_uuid="own-uuid")
+
+    assert await service.detach_shared_object("own-uuid_doc.txt", user_id=2) == "own-uuid_doc.txt"
+    assert service.s3_client.calls == []
+    query = service.db.statements[0].compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True})
+    assert "ORDER BY files.file_uuid = 'own-uuid' DESC, files.id" in str(query)
+
+
+@pytest.mark.asyncio
+async def test_compressible_file_is_gzipped(service, monkeypatch):
+    monkeypatch.setattr("src.app.file_management.services.settings.S3_COMPRESSION", "gzip")
+    content = b"hello hello hello hello"
+
+    new_file = await service.add_file(FakeUploadFile("doc.txt", content), user_id=1)
+
+    assert new_file.content_encoding == "gzip"
+    assert service.s3_client.names()[0] == "create_multipart_upload"
+    assert service.s3_client.calls[0][1]["ContentEncoding"] == "gzip"
+    parts = b"".join(kwargs["Body"] for name, kwargs in service.s3_client.calls if name == "upload_part")
+    assert gzip.decompress(parts) == content
+    assert new_file.content_hash == hashlib.sha256(content).hexdigest()
+
+
+@pytest.mark.asyncio
+async def test_compressed_formats_are_stored_as_is(service, monkeypatch):
+    monkeypatch.setattr("src.app.file_management.services.settings.S3_COMPRESSION", "gzip")
+
+    new_file = await service.add_file(FakeUploadFile("doc.pdf", b"%PD"), user_id=1)
+
+    assert new_file.content_encoding is None
+    assert service.s3_client.calls == [
+        ("put_object", {"Bucket": service.bucket, "Key": new_file.s3_key, "Body": b"%PD"})
+    ]
@@ -38,7 +38,7 @@ async def app_base():
 async def test_tonality_analysis_success(app_base, monkeypatch):
     app_base.dependency_overrides[get_file_manager] = lambda: StubFileManagementServiceUserFileYes()
 
-    async def _mock_send_message_to_sqs(queue_url, body):
+    async def _mock_enqueue_job(queue, body, db=None):
         return ("ok", True)
 
     async def _mock_wait_for_cache(s3_key, cache_key):
@@ -56,7 +56,7 @@ async def test_tonality_analysis_success(app_base, monkeypatch):
             "objective_sentiment_description": "Low objective sentiment",
         }
 
-    monkeypatch.setattr("src.app.file_management.routers.send_message_to_sqs", _mock_send_message_to_sqs)
+    monkeypatch.setattr("src.app.file_management.routers.enqueue_job", _mock_enqueue_job)
     monkeypatch.setattr("src.app.file_management.routers.wait_for_cache", _mock_wait_for_cache)
 
     async with AsyncClient(transport=ASGITransport(app=app_base), base_url="http://test") as ac:
@@ -87,13 +87,13 @@ async def test_tonality_analysis_not_user_file(app_base):
 async def test_tonality_analysis_sqs_error(app_base, monkeypatch):
     app_base.dependency_overrides[get_file_manager] = lambda: StubFileManagementServiceUserFileYes()
 
-    async def _mock_send_message_to_sqs(queue_url, body):
+    async def _mock_enqueue_job(queue, body, db=None):
         return ("enqueue error", False)
 
     async def _mock_wait_for_cache(s3_key, cache_key):
         return None
 
-    monkeypatch.setattr("src.app.file_management.routers.send_message_to_sqs", _mock_send_message_to_sqs)
+    monkeypatch.setattr("src.app.file_management.routers.enqueue_job", _mock_enqueue_job)
     monkeypatch.setattr("src.app.file_management.routers.wait_for_cache", _mock_wait_for_cache)
 
     async with AsyncClient(transport=ASGITransport(app=app_base), base_url="http://test") as ac:
@@ -108,13 +108,13 @@ async def test_tonality_analysis_sqs_error(app_base, monkeypatch):
 async def test_tonality_analysis_timeout(app_base, monkeypatch):
     app_base.dependency_overrides[get_file_manager] = lambda: StubFileManagementServiceUserFileYes()
 
-    async def _mock_send_message_to_sqs(queue_url, body):
+    async def _mock_enqueue_job(queue, body, db=None):
         return ("ok", True)
 
     async def _mock_wait_for_cache(s3_key, cache_key):
         return None
 
-    monkeypatch.setattr("src.app.file_management.routers.send_message_to_sqs", _mock_send_message_to_sqs)
+    monkeypatch.setattr("src.app.file_management.routers.enqueue_job", _mock_enqueue_job)
     monkeypatch.setattr("src.app.file_management.routers.wait_for_cache", _mock_wait_for_cache)
 
     async with AsyncClient(transport=ASGITransport(app=app_base), base_url="http://test") as ac:
@@ -129,10 +129,10 @@ async def test_tonality_analysis_timeout(app_base, monkeypatch):
 async def test_tonality_analysis_internal_error(app_base, monkeypatch):
     app_base.dependency_overrides[get_file_manager] = lambda: StubFileManagementServiceUserFileYes()
 
-    async def _mock_send_message_to_sqs(queue_url, body):
+    async def _mock_enqueue_job(queue, body, db=None):
         raise Exception("boom")
 
-    monkeypatch.setattr("src.app.file_management.routers.send_message_to_sqs", _mock_send_message_to_sqs)
+    monkeypatch.setattr("src.app.file_management.routers.enqueue_job", _mock_enqueue_job)
 
     async with AsyncClient(transport=ASGITransport(app=app_base), base_url="http://test") as ac:
         payload = {"s3_key": "uuid_key_file.txt"}
@@ -10,21 +10,23 @@ from src.app.validators.file_validation import FileValidator
 
 
 class StubFileManagementService:
-    async def get_files_history(self, user_id: int):
-        return {"detail": "The files have not been uploaded yet"}
+    async def get_files_history(self, user_id: int, limit: int, cursor: str | None):
+        return {"items": [], "next_cursor": None}
 
 
 class StubFileManagementServiceWithFiles:
-    async def get_files_history(self, user_id: int):
-        return [
-            {
-                "id": 1,
-                "file_name": "doc.txt",
-                "s3_url": "https://bucket.s3.region.amazonaws.com/uuid_doc.txt",
-                "s3_key": "uuid_doc.txt",
-                "user_id": user_id,
-            }
-        ]
+    async def get_files_history(self, user_id: int, limit: int, cursor: str | None):
+        return {
+            "items": [
+                {
+                    "id": 1,
+                    "file_name": "doc.txt",
+                    "s3_url": "https://bucket.s3.region.amazonaws.com/uuid_doc.txt",
+                    "s3_key": "uuid_doc.txt",
+                }
+            ],
+            "next_cursor": None,
+        }
 
 
 class StubFileManagementServiceForUpload:
@@ -77,7 +79,7 @@ async def test_files_history_empty(client_empty_history):
     resp = await client_empty_history.get("/files/storage")
     assert resp.status_code == 200
     data = resp.json()
-    assert data == {"detail": "The files have not been uploaded yet"}
+    assert data == {"items": [], "next_cursor": None}
 
 
 @pytest.mark.asyncio
@@ -85,9 +87,8 @@ async def test_files_history_with_items(client_with_files):
     resp = await client_with_files.get("/files/storage")
     assert resp.status_code == 200
     data = resp.json()
-    assert isinstance(data, list)
-    assert len(data) == 1
-    assert data[0]["file_name"] == "doc.txt"
+    assert len(data["items"]) == 1
+    assert data["items"][0]["file_name"] == "doc.txt"
 
 
 @pytest.mark.asyncio
@@ -111,3 +112,18 @@ async def test_upload_invalid_file(monkeypatch, app_base):
         assert resp.status_code == 400
         data = resp.json()
         assert "supported_formats" in data["detail"]
+
+
+@pytest.mark.asyncio
+async def test_upload_content_not_matching_extension(client_upload_success):
+    files = {"file": ("doc.pdf", b"MZ\x90\x00\x03\x00\x00\x00", "application/pdf")}
+    resp = await client_upload_success.post("/files/upload", files=files)
+    assert resp.status_code == 400
+    assert "content" in resp.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_upload_without_file_field(client_upload_success):
+    resp = await client_upload_success.post("/files/upload", data={"other": "value"}, files={"x": ("a.txt", b"a")})
+
+    assert resp.status_code == 400
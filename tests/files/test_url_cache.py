@@ -0,0 +1,131 @@
+import pytest
+
+from src.app.file_management.services import FileManagementService
+from src.app.file_management.url_cache import PresignedUrlCache
+from tests.files.conftest import FakeRedis
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+
+class Signer:
+    def __init__(self):
+        self.calls = 0
+
+    async def __call__(self, expires_in):
+        self.calls += 1
+        return f"https://signed/{self.calls}?expires={expires_in}"
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake_clock = FakeClock()
+    monkeypatch.setattr("src.app.file_management.url_cache.time", fake_clock)
+    return fake_clock
+
+
+@pytest.mark.asyncio
+async def test_url_is_reused_until_min_remaining(clock):
+    cache = PresignedUrlCache(expires_in=100, min_remaining=30)
+    sign = Signer()
+
+    first = await cache.get_or_sign("uuid_a.txt", sign)
+    clock.now += 70
+    assert await cache.get_or_sign("uuid_a.txt", sign) == first
+
+    clock.now += 1
+    assert await cache.get_or_sign("uuid_a.txt", sign) != first
+    assert sign.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_key_is_evicted(clock):
+    cache = PresignedUrlCache(expires_in=100, min_remaining=30, max_size=2)
+    sign = Signer()
+
+    await cache.get_or_sign("a", sign)
+    await cache.get_or_sign("b", sign)
+    await cache.get_or_sign("a", sign)
+    await cache.get_or_sign("c", sign)
+
+    assert list(cache._entries) == ["a", "c"]
+
+
+@pytest.mark.asyncio
+async def test_invalidate_forces_new_signature(clock):
+    redis = FakeRedis()
+    cache = PresignedUrlCache(redis, expires_in=100, min_remaining=30)
+    sign = Signer()
+
+    first = await cache.get_or_sign("uuid_a.txt", sign)
+    await cache.invalidate("uuid_a.txt")
+
+    assert redis.data == {}
+    assert await cache.get_or_sign("uuid_a.txt", sign) != first
+
+
+@pytest.mark.asyncio
+async def test_redis_tier_is_shared_between_processes(clock):
+    redis = FakeRedis()
+    sign = Signer()
+
+    first = await PresignedUrlCache(redis, expires_in=100, min_remaining=30).get_or_sign("uuid_a.txt", sign)
+    second = await PresignedUrlCache(redis, expires_in=100, min_remaining=30).get_or_sign("uuid_a.txt", sign)
+
+    assert first == second
+    assert sign.calls == 1
+
+
+class FakeS3Client:
+    def __init__(self):
+        self.signed = []
+
+    async def generate_presigned_url(self, operation, Params, ExpiresIn):
+        self.params = Params
+        self.signed.append(Params["Key"])
+        return f"https://bucket/{Params['Key']}?expires={ExpiresIn}"
+
+
+class StubResult:
+    def __init__(self, content_encoding=None):
+        self.content_encoding = content_encoding
+
+    def first(self):
+        return "uuid_a.txt", self.content_encoding
+
+
+class StubDB:
+    def __init__(self, content_encoding=None):
+        self.content_encoding = content_encoding
+
+    async def execute(self, stmt):
+        return StubResult(self.content_encoding)
+
+
+@pytest.mark.asyncio
+async def test_download_file_signs_once(clock):
+    service = FileManagementService(StubDB())
+    service.s3_client = FakeS3Client()
+    service.url_cache = PresignedUrlCache(expires_in=1800, min_remaining=300)
+
+    first = await service.download_file(file_id=1, user_id=1)
+    second = await service.download_file(s3_key="uuid_a.txt")
+
+    assert first == second == {"file_url": "https://bucket/uuid_a.txt?expires=1800"}
+    assert service.s3_client.signed == ["uuid_a.txt"]
+
+
+@pytest.mark.asyncio
+async def test_download_file_of_compressed_object_carries_encoding(clock):
+    service = FileManagementService(StubDB(content_encoding="gzip"))
+    service.s3_client = FakeS3Client()
+    service.url_cache = PresignedUrlCache(expires_in=1800, min_remaining=300)
+
+    await service.download_file(file_id=1, user_id=1)
+
+    assert service.s3_client.params["ResponseContentEncoding"] == "gzip"
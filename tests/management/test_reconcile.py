@@ -0,0 +1,146 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.management.reconcile import MISSING_OBJECT, ORPHAN_OBJECT, Reconciler, iter_s3_keys, merge_diff
+
+OLD = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+
+async def _aiter(items):
+    for item in items:
+        yield item
+
+
+async def _diff(s3_keys, db_keys, grace=timedelta(hours=1)):
+    return [mismatch async for mismatch in merge_diff(_aiter(s3_keys), _aiter(db_keys), grace)]
+
+
+@pytest.mark.asyncio
+async def test_merge_diff_reports_both_sides():
+    s3_keys = [("a", OLD), ("b", OLD), ("d", OLD)]
+    db_keys = [("b", True), ("c", True), ("e", True)]
+
+    assert await _diff(s3_keys, db_keys) == [
+        (ORPHAN_OBJECT, "a"),
+        (MISSING_OBJECT, "c"),
+        (ORPHAN_OBJECT, "d"),
+        (MISSING_OBJECT, "e"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_merge_diff_tolerates_rows_sharing_an_object():
+    s3_keys = [("a", OLD), ("b", OLD)]
+    db_keys = [("a", True), ("a", True), ("b", True)]
+
+    assert await _diff(s3_keys, db_keys) == []
+
+
+@pytest.mark.asyncio
+async def test_merge_diff_skips_recent_objects_and_tombstones():
+    recent = datetime.now(timezone.utc)
+    s3_keys = [("a", recent), ("b", OLD)]
+    db_keys = [("c", False)]
+
+    assert await _diff(s3_keys, db_keys) == [(ORPHAN_OBJECT, "b")]
+
+
+@pytest.mark.asyncio
+async def test_merge_diff_uses_byte_order():
+    # "Z" < "a" < "é" in byte order
+    s3_keys = [("Z", OLD), ("a", OLD), ("é", OLD)]
+    db_keys = [("Z", True), ("a", True), ("é", True)]
+
+    assert await _diff(s3_keys, db_keys) == []
+
+
+class FakeS3Client:
+    def __init__(self, keys, page_size):
+        self.pages = [keys[start : start + page_size] for start in range(0, len(keys), page_size)]
+        self.deleted = []
+        self.list_calls = []
+
+    async def list_objects_v2(self, **kwargs):
+        self.list_calls.append(kwargs)
+        index = int(kwargs.get("ContinuationToken", 0))
+        page = {"Contents": [{"Key": key, "LastModified": OLD} for key in self.pages[index]]}
+        if index + 1 < len(self.pages):
+            page.update(IsTruncated=True, NextContinuationToken=str(index + 1))
+        return page
+
+    async def delete_objects(self, Bucket, Delete):
+        self.deleted.append([obj["Key"] for obj in Delete["Objects"]])
+        return {}
+
+
+@pytest.mark.asyncio
+async def test_iter_s3_keys_follows_continuation_tokens():
+    s3 = FakeS3Client(["a", "b", "c"], page_size=2)
+
+    assert [key async for key, _ in iter_s3_keys(s3, "bucket", page_size=2)] == ["a", "b", "c"]
+    assert [call.get("ContinuationToken") for call in s3.list_calls] == [None, "1"]
+
+
+class StubStreamResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def tuples(self):
+        return _aiter(self.rows)
+
+
+class StubResult:
+    def __init__(self, rowcount):
+        self.rowcount = rowcount
+
+
+class StubSession:
+    def __init__(self, rows):
+        self.rows = rows
+        self.updates = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def stream(self, stmt):
+        return StubStreamResult(self.rows)
+
+    async def execute(self, stmt):
+        keys = stmt.compile().params["s3_key_1"]
+        self.updates.append(keys)
+        return StubResult(len(keys))
+
+    async def commit(self):
+        pass
+
+
+@pytest.mark.asyncio
+async def test_reconciler_fixes_in_batches():
+    s3 = FakeS3Client(["a", "b", "c", "x"], page_size=2)
+    session = StubSession([("x", True), ("y", True), ("z", True)])
+    reconciler = Reconciler(s3, "bucket", lambda: session, batch_size=2, fix=True)
+    mismatches = []
+
+    report = await reconciler.run(lambda kind, key: mismatches.append((kind, key)))
+
+    assert report.orphan_objects == report.deleted_objects == 3
+    assert report.missing_objects == report.removed_rows == 2
+    assert s3.deleted == [["a", "b"], ["c"]]
+    assert session.updates == [["y", "z"]]
+    assert len(mismatches) == 5
+
+
+@pytest.mark.asyncio
+async def test_reconciler_reports_only_by_default():
+    s3 = FakeS3Client(["a"], page_size=2)
+    session = StubSession([("b", True)])
+
+    report = await Reconciler(s3, "bucket", lambda: session).run()
+
+    assert (report.orphan_objects, report.missing_objects) == (1, 1)
+    assert (report.deleted_objects, report.removed_rows) == (0, 0)
+    assert s3.deleted == [] and session.updates == []
@@ -0,0 +1,141 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+import src.app.file_management.models  # noqa: F401, registers File for the User mapper
+from src.app.transport import JobQueue, enqueue_job
+from src.app.transport.memory import InMemoryTransport
+from src.app.transport.models import OutboxMessage
+from src.app.transport.outbox import OutboxRelay
+
+
+class StubDB:
+    def __init__(self):
+        self.added = []
+        self.committed = False
+
+    def add(self, instance):
+        self.added.append(instance)
+
+    async def commit(self):
+        self.committed = True
+
+
+class StubResult:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self.rows
+
+
+class StubSession:
+    def __init__(self, rows):
+        self.rows = rows
+        self.statements = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def begin(self):
+        return self
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        return StubResult(self.rows)
+
+
+class PartiallyFailingTransport(InMemoryTransport):
+    async def send(self, queue, body):
+        if body == "broken":
+            raise ConnectionError("backend down")
+        return await super().send(queue, body)
+
+
+@pytest.mark.asyncio
+async def test_enqueue_job_writes_outbox_row_in_request_session(monkeypatch):
+    monkeypatch.setattr("src.settings.config.settings.JOB_OUTBOX_ENABLED", True)
+    transport = InMemoryTransport()
+    monkeypatch.setattr("src.app.transport.utils._transport", transport)
+    db = StubDB()
+
+    message, is_sent = await enqueue_job(JobQueue.CONVERTER, '{"s3_key": "uuid_file.txt"}', db=db)
+
+    assert (message, is_sent) == (None, True)
+    assert db.committed is True
+    assert len(db.added) == 1
+    assert isinstance(db.added[0], OutboxMessage)
+    assert db.added[0].queue == "converter"
+    assert transport._queues == {}
+
+
+@pytest.mark.asyncio
+async def test_enqueue_job_without_outbox_sends_directly(monkeypatch):
+    monkeypatch.setattr("src.settings.config.settings.JOB_OUTBOX_ENABLED", False)
+    transport = InMemoryTransport()
+    monkeypatch.setattr("src.app.transport.utils._transport", transport)
+    db = StubDB()
+
+    await enqueue_job(JobQueue.ANALYSIS, "{}", db=db)
+
+    assert db.added == []
+    assert (await transport.receive(JobQueue.ANALYSIS))[1] == "{}"
+
+
+@pytest.mark.asyncio
+async def test_relay_reports_sent_and_failed_messages():
+    transport = PartiallyFailingTransport()
+    relay = OutboxRelay(session_factory=None, get_transport=lambda: transport, batch_size=10, poll_interval=1)
+    messages = [
+        SimpleNamespace(id=1, queue="converter", body="first"),
+        SimpleNamespace(id=2, queue="analysis", body="broken"),
+        SimpleNamespace(id=3, queue="converter", body="second"),
+    ]
+
+    sent_ids, failed_ids = await relay.send(messages)
+
+    assert sent_ids == [1, 3]
+    assert failed_ids == [2]
+    assert (await transport.receive(JobQueue.CONVERTER))[1] == "first"
+    assert (await transport.receive(JobQueue.CONVERTER))[1] == "second"
+
+
+@pytest.mark.asyncio
+async def test_relay_batch_backs_off_failed_messages():
+    messages = [
+        SimpleNamespace(id=1, queue="converter", body="first", attempts=0, next_attempt_at=None),
+        SimpleNamespace(id=2, queue="analysis", body="broken", attempts=2, next_attempt_at=None),
+    ]
+    session = StubSession(messages)
+    relay = OutboxRelay(
+        lambda: session, lambda: PartiallyFailingTransport(), batch_size=2, poll_interval=1, retry_delay=1
+    )
+
+    assert await relay.relay_batch() == 1
+
+    select_stmt = str(session.statements[0].compile(dialect=postgresql.dialect()))
+    assert "outbox.attempts < " in select_stmt
+    assert "next_attempt_at" in select_stmt
+    assert "ORDER BY outbox.attempts, outbox.id" in select_stmt
+    assert "DELETE FROM outbox" in str(session.statements[1])
+    assert messages[1].attempts == 3
+    delay = (messages[1].next_attempt_at - datetime.now(timezone.utc)).total_seconds()
+    assert 3 < delay <= 4
+
+
+def test_message_is_dead_lettered_at_max_attempts(caplog):
+    relay = OutboxRelay(session_factory=None, get_transport=None, max_attempts=3, retry_delay=1)
+    message = SimpleNamespace(id=1, attempts=2, next_attempt_at=None)
+
+    relay.schedule_retries([message])
+
+    assert message.attempts == relay.max_attempts
+    assert "Outbox message 1 dead-lettered after 3 attempts" in caplog.text
@@ -0,0 +1,109 @@
+import asyncio
+
+import pytest
+
+from src.app.responses.statuses import ResponseErrorMessage
+from src.app.transport import JobQueue, enqueue_job
+from src.app.transport.memory import InMemoryTransport, QueueFullError
+from src.app.transport.redis_streams import RedisStreamsTransport
+from src.app.transport.sqs import SQSTransport
+from src.app.transport.utils import create_transport
+
+
+class FakeRedis:
+    def __init__(self):
+        self.streams = []
+
+    async def xadd(self, name, fields, maxlen=None, approximate=True):
+        self.streams.append((name, fields, maxlen))
+        return b"1700000000000-0"
+
+
+class FakeProducer:
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, queue_url, body):
+        self.sent.append((queue_url, body))
+        return "message-id"
+
+
+class FailingTransport(InMemoryTransport):
+    async def send(self, queue, body):
+        raise ConnectionError("backend down")
+
+
+@pytest.mark.asyncio
+async def test_memory_transport_round_trip():
+    transport = InMemoryTransport()
+
+    message_id = await transport.send(JobQueue.ANALYSIS, '{"s3_key": "uuid_file.txt"}')
+
+    assert await transport.receive(JobQueue.ANALYSIS) == (message_id, '{"s3_key": "uuid_file.txt"}')
+
+
+@pytest.mark.asyncio
+async def test_memory_transport_runs_registered_consumers():
+    transport = InMemoryTransport()
+    handled = asyncio.Queue()
+    transport.register_consumer(JobQueue.CONVERTER, handled.put)
+    transport.register_consumer(JobQueue.ANALYSIS, handled.put)
+    transport.start()
+
+    await transport.send(JobQueue.CONVERTER, "convert")
+    await transport.send(JobQueue.ANALYSIS, "analyse")
+
+    assert {await handled.get(), await handled.get()} == {"convert", "analyse"}
+    await transport.close()
+
+
+def test_memory_transport_start_requires_consumers():
+    transport = InMemoryTransport()
+    transport.register_consumer(JobQueue.CONVERTER, lambda body: None)
+
+    with pytest.raises(RuntimeError, match="analysis"):
+        transport.start()
+
+
+@pytest.mark.asyncio
+async def test_memory_transport_rejects_when_full():
+    transport = InMemoryTransport(max_size=1)
+    await transport.send(JobQueue.ANALYSIS, "first")
+
+    with pytest.raises(QueueFullError):
+        await transport.send(JobQueue.ANALYSIS, "second")
+
+
+@pytest.mark.asyncio
+async def test_redis_streams_transport_appends_to_queue_stream():
+    fake_redis = FakeRedis()
+    transport = RedisStreamsTransport(fake_redis, prefix="jobs", maxlen=10)
+
+    message_id = await transport.send(JobQueue.CONVERTER, "{}")
+
+    assert message_id == "1700000000000-0"
+    assert fake_redis.streams == [("jobs:converter", {"body": "{}"}, 10)]
+
+
+@pytest.mark.asyncio
+async def test_sqs_transport_maps_queue_to_url(monkeypatch):
+    monkeypatch.setattr("src.settings.config.settings.AWS_SQS_QUEUE_ANALYSIS_URL", "analysis-url")
+    producer = FakeProducer()
+
+    assert await SQSTransport(producer).send(JobQueue.ANALYSIS, "{}") == "message-id"
+    assert producer.sent == [("analysis-url", "{}")]
+
+
+def test_unknown_transport_is_rejected():
+    with pytest.raises(ValueError):
+        create_transport("kafka")
+
+
+@pytest.mark.asyncio
+async def test_enqueue_job_reports_backend_failure(monkeypatch):
+    monkeypatch.setattr("src.app.transport.utils._transport", FailingTransport())
+
+    message, is_sent = await enqueue_job(JobQueue.CONVERTER, "{}")
+
+    assert is_sent is False
+    assert message == {"success": False, "message": ResponseErrorMessage.JOB_ENQUEUE_ERROR}
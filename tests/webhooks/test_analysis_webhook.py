@@ -11,10 +11,31 @@ from src.app.webhooks.routers import router as webhooks_router
 class FakeRedis:
     def __init__(self):
         self.calls = []
+        self.published = []
 
     async def setex(self, key, ttl, value):
         self.calls.append((key, ttl, value))
 
+    async def publish(self, channel, message):
+        self.published.append((channel, message))
+
+
+class FakeJobStore:
+    def __init__(self):
+        self.resolved = []
+
+    async def resolve(self, cache_key, result):
+        self.resolved.append((cache_key, result))
+        return []
+
+
+class FakeJobCoalescer:
+    def __init__(self):
+        self.resolved = []
+
+    async def resolve(self, cache_key):
+        self.resolved.append(cache_key)
+
 
 @pytest_asyncio.fixture
 async def app_base():
@@ -27,6 +48,8 @@ async def app_base():
 async def test_analysis_webhook_success(app_base, monkeypatch):
     fake_redis = FakeRedis()
     monkeypatch.setattr("src.app.webhooks.routers.redis", fake_redis)
+    monkeypatch.setattr("src.app.webhooks.routers.job_store", FakeJobStore())
+    monkeypatch.setattr("src.app.webhooks.routers.job_coalescer", FakeJobCoalescer())
 
     payload = {
         "s3_key": "uuid777_file.txt",
@@ -57,11 +80,16 @@ async def test_analysis_webhook_success(app_base, monkeypatch):
     for k, v in payload.items():
         assert cached[k] == v
 
+    # Waiters are notified with the same payload
+    assert fake_redis.published == [(key, value)]
+
 
 @pytest.mark.asyncio
 async def test_analysis_webhook_non_success_returns_null(app_base, monkeypatch):
     fake_redis = FakeRedis()
     monkeypatch.setattr("src.app.webhooks.routers.redis", fake_redis)
+    monkeypatch.setattr("src.app.webhooks.routers.job_store", FakeJobStore())
+    monkeypatch.setattr("src.app.webhooks.routers.job_coalescer", FakeJobCoalescer())
 
     payload = {
         "s3_key": "uuid001_file.txt",
@@ -13,10 +13,31 @@ from src.settings.database import get_db
 class FakeRedis:
     def __init__(self):
         self.calls = []
+        self.published = []
 
     async def setex(self, key, ttl, value):
         self.calls.append((key, ttl, value))
 
+    async def publish(self, channel, message):
+        self.published.append((channel, message))
+
+
+class FakeJobStore:
+    def __init__(self):
+        self.resolved = []
+
+    async def resolve(self, cache_key, result):
+        self.resolved.append((cache_key, result))
+        return []
+
+
+class FakeJobCoalescer:
+    def __init__(self):
+        self.resolved = []
+
+    async def resolve(self, cache_key):
+        self.resolved.append(cache_key)
+
 
 class StubDB:
     def __init__(self):
@@ -31,6 +52,7 @@ class StubFile:
         self.file_name = None
         self.s3_url = None
         self.s3_key = None
+        self.content_hash = None
 
 
 class StubServiceFound:
@@ -73,6 +95,8 @@ async def test_converter_webhook_success(app_base, monkeypatch):
     overrides[get_db] = _override_get_db
     monkeypatch.setattr("src.app.webhooks.routers.FileManagementService", StubServiceFound)
     monkeypatch.setattr("src.app.webhooks.routers.redis", fake_redis)
+    monkeypatch.setattr("src.app.webhooks.routers.job_store", FakeJobStore())
+    monkeypatch.setattr("src.app.webhooks.routers.job_coalescer", FakeJobCoalescer())
 
     payload = {
         "file_url": "https://example.com/converted.pdf",
@@ -119,6 +143,8 @@ async def test_converter_webhook_file_not_found(app_base, monkeypatch):
     overrides[get_db] = _override_get_db
     monkeypatch.setattr("src.app.webhooks.routers.FileManagementService", StubServiceNotFound)
     monkeypatch.setattr("src.app.webhooks.routers.redis", fake_redis)
+    monkeypatch.setattr("src.app.webhooks.routers.job_store", FakeJobStore())
+    monkeypatch.setattr("src.app.webhooks.routers.job_coalescer", FakeJobCoalescer())
 
     payload = {
         "file_url": "https://example.com/converted.pdf",
@@ -148,6 +174,8 @@ async def test_converter_webhook_non_success_status_returns_null(app_base, monke
     # Service shouldn't be used in this path, but patch to be safe
     monkeypatch.setattr("src.app.webhooks.routers.FileManagementService", StubServiceFound)
     monkeypatch.setattr("src.app.webhooks.routers.redis", fake_redis)
+    monkeypatch.setattr("src.app.webhooks.routers.job_store", FakeJobStore())
+    monkeypatch.setattr("src.app.webhooks.routers.job_coalescer", FakeJobCoalescer())
 
     payload = {
         "file_url": "https://example.com/converted.pdf",
@@ -161,4 +189,25 @@ async def test_converter_webhook_non_success_status_returns_null(app_base, monke
     assert resp.status_code == 200
     assert resp.json() is None
     assert stub_db.committed is False
-    assert len(fake_redis.calls) == 0
+    assert StubServiceFound.last_instance.file.s3_key is None
+
+
+@pytest.mark.asyncio
+async def test_converter_webhook_error_completes_waiting_jobs(app_base, monkeypatch):
+    fake_redis = FakeRedis()
+    job_store = FakeJobStore()
+    job_coalescer = FakeJobCoalescer()
+    cast(Any, app_base).dependency_overrides[get_db] = lambda: StubDB()
+    monkeypatch.setattr("src.app.webhooks.routers.redis", fake_redis)
+    monkeypatch.setattr("src.app.webhooks.routers.job_store", job_store)
+    monkeypatch.setattr("src.app.webhooks.routers.job_coalescer", job_coalescer)
+
+    payload = {"file_url": "", "new_s3_key": "uuid_file.pdf", "status": "error"}
+
+    async with AsyncClient(transport=ASGITransport(app=app_base), base_url="http://test") as ac:
+        resp = await ac.post("/webhooks/converter-webhook", content=json.dumps(payload))
+
+    assert resp.status_code == 200
+    assert fake_redis.published[0][0] == "file_conversion:uuid"
+    assert job_coalescer.resolved == ["file_conversion:uuid"]
+    assert job_store.resolved == [("file_conversion:uuid", {**payload, "s3_key": "uuid_file.pdf"})]
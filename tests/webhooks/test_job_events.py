@@ -0,0 +1,125 @@
+import asyncio
+import json
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from httpx import AsyncClient, ASGITransport
+
+from src.app.responses.generator import ResponseGeneratorService
+from src.app.responses.statuses import JobStatus
+from src.app.webhooks.listener import CacheResultListener
+from src.app.webhooks.routers import router as webhooks_router
+from src.app.webhooks.utils import stream_job_events
+
+
+class FakePubSub:
+    def __init__(self, redis):
+        self.redis = redis
+
+    async def psubscribe(self, *patterns):
+        pass
+
+    async def listen(self):
+        while True:
+            yield await self.redis.messages.get()
+
+    async def aclose(self):
+        pass
+
+
+class FakeRedis:
+    def __init__(self):
+        self.messages = asyncio.Queue()
+        self.published = []
+
+    def pubsub(self):
+        return FakePubSub(self)
+
+    async def get(self, key):
+        return None
+
+    async def setex(self, key, ttl, value):
+        pass
+
+    async def publish(self, channel, data):
+        self.published.append((channel, data))
+        await self.messages.put({"type": "pmessage", "channel": channel.encode(), "data": data.encode()})
+
+
+class FakeJobStore:
+    async def resolve(self, cache_key, result):
+        return [
+            {
+                "job_id": "job-1",
+                "user_id": 7,
+                "job_type": "file_parsing",
+                "status": JobStatus.COMPLETED,
+                "result": result,
+            }
+        ]
+
+
+class FakeRequest:
+    async def is_disconnected(self):
+        return False
+
+
+@pytest_asyncio.fixture
+async def listener(monkeypatch):
+    result_listener = CacheResultListener(FakeRedis(), ["file_parsing", "user_events"])
+    monkeypatch.setattr("src.app.webhooks.utils.result_listener", result_listener)
+    yield result_listener
+    await result_listener.stop()
+
+
+@pytest.mark.asyncio
+async def test_webhook_publishes_event_for_each_completed_job(monkeypatch):
+    fake_redis = FakeRedis()
+    monkeypatch.setattr("src.app.webhooks.routers.redis", fake_redis)
+    monkeypatch.setattr("src.app.webhooks.utils.redis", fake_redis)
+    monkeypatch.setattr("src.app.webhooks.routers.job_store", FakeJobStore())
+
+    app = FastAPI()
+    app.include_router(webhooks_router, prefix="/webhooks")
+    payload = {"count": 1, "sentences": ["Hello"], "s3_key": "uuid1_file.txt", "status": "success"}
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        resp = await ac.post("/webhooks/parser-webhook", content=json.dumps(payload))
+
+    assert resp.status_code == 200
+    channels = [channel for channel, _ in fake_redis.published]
+    assert channels == ["file_parsing:uuid1", "user_events:7"]
+    event = json.loads(fake_redis.published[1][1])
+    assert event["job_id"] == "job-1"
+    assert event["result"] == payload
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_completed_jobs(listener):
+    events = stream_job_events(7, FakeRequest(), ResponseGeneratorService())
+
+    assert await anext(events) == "retry: 3000\n\n"
+
+    next_event = asyncio.create_task(anext(events))
+    await asyncio.sleep(0.01)
+    job = {
+        "job_id": "job-1",
+        "user_id": 7,
+        "job_type": "file_parsing",
+        "status": JobStatus.COMPLETED,
+        "result": {"status": "success", "s3_key": "uuid1_file.txt", "count": 0, "sentences": []},
+    }
+    await listener.redis.publish("user_events:8", json.dumps({**job, "job_id": "other-user"}))
+    await listener.redis.publish("user_events:7", json.dumps(job))
+
+    event = await asyncio.wait_for(next_event, timeout=1)
+    lines = event.strip().split("\n")
+    assert lines[0] == "id: job-1"
+    assert lines[1] == "event: file_parsing"
+    data = json.loads(lines[2].removeprefix("data: "))
+    assert data["status"] == JobStatus.COMPLETED
+    assert data["result"]["s3_key"] == "uuid1_file.txt"
+
+    await events.aclose()
+    assert listener._streams == {}
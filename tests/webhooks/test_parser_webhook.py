@@ -11,10 +11,31 @@ from src.app.webhooks.routers import router as webhooks_router
 class FakeRedis:
     def __init__(self):
         self.calls = []
+        self.published = []
 
     async def setex(self, key, ttl, value):
         self.calls.append((key, ttl, value))
 
+    async def publish(self, channel, message):
+        self.published.append((channel, message))
+
+
+class FakeJobStore:
+    def __init__(self):
+        self.resolved = []
+
+    async def resolve(self, cache_key, result):
+        self.resolved.append((cache_key, result))
+        return []
+
+
+class FakeJobCoalescer:
+    def __init__(self):
+        self.resolved = []
+
+    async def resolve(self, cache_key):
+        self.resolved.append(cache_key)
+
 
 @pytest_asyncio.fixture
 async def app_base():
@@ -26,7 +47,10 @@ async def app_base():
 @pytest.mark.asyncio
 async def test_parser_webhook_success(app_base, monkeypatch):
     fake_redis = FakeRedis()
+    fake_job_store = FakeJobStore()
     monkeypatch.setattr("src.app.webhooks.routers.redis", fake_redis)
+    monkeypatch.setattr("src.app.webhooks.routers.job_store", fake_job_store)
+    monkeypatch.setattr("src.app.webhooks.routers.job_coalescer", FakeJobCoalescer())
 
     payload = {
         "count": 2,
@@ -52,11 +76,17 @@ async def test_parser_webhook_success(app_base, monkeypatch):
     assert cached["sentences"] == payload["sentences"]
     assert cached["status"] == payload["status"]
 
+    # Waiters are notified with the same payload
+    assert fake_redis.published == [(key, value)]
+    assert fake_job_store.resolved == [(key, payload)]
+
 
 @pytest.mark.asyncio
 async def test_parser_webhook_non_success_returns_null(app_base, monkeypatch):
     fake_redis = FakeRedis()
     monkeypatch.setattr("src.app.webhooks.routers.redis", fake_redis)
+    monkeypatch.setattr("src.app.webhooks.routers.job_store", FakeJobStore())
+    monkeypatch.setattr("src.app.webhooks.routers.job_coalescer", FakeJobCoalescer())
 
     payload = {
         "count": 0,
@@ -79,3 +109,31 @@ async def test_parser_webhook_non_success_returns_null(app_base, monkeypatch):
     cached = json.loads(value)
     assert cached["s3_key"] == payload["s3_key"]
     assert cached["status"] == payload["status"]
+
+
+class FakeResultCache:
+    def __init__(self):
+        self.stored = []
+
+    async def put(self, db, digest, kind, payload):
+        self.stored.append((digest, kind, payload))
+
+
+@pytest.mark.asyncio
+async def test_parser_webhook_stores_result_under_digest(app_base, monkeypatch):
+    fake_result_cache = FakeResultCache()
+    monkeypatch.setattr("src.app.webhooks.routers.redis", FakeRedis())
+    monkeypatch.setattr("src.app.webhooks.routers.job_store", FakeJobStore())
+    monkeypatch.setattr("src.app.webhooks.routers.job_coalescer", FakeJobCoalescer())
+    monkeypatch.setattr("src.app.webhooks.routers.result_cache", fake_result_cache)
+
+    payload = {"count": 1, "sentences": ["Hello"], "s3_key": "uuid123_file.txt", "status": "success"}
+    digest = "a" * 64
+
+    async with AsyncClient(transport=ASGITransport(app=app_base), base_url="http://test") as ac:
+        resp = await ac.post(f"/webhooks/parser-webhook?result_digest={digest}", content=json.dumps(payload))
+        invalid = await ac.post("/webhooks/parser-webhook?result_digest=../etc", content=json.dumps(payload))
+
+    assert resp.status_code == 200
+    assert fake_result_cache.stored == [(digest, "file_parsing", payload)]
+    assert invalid.status_code == 422
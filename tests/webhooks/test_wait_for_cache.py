@@ -0,0 +1,100 @@
+import asyncio
+import json
+
+import pytest
+import pytest_asyncio
+
+from src.app.webhooks.listener import CacheResultListener
+from src.app.webhooks.utils import wait_for_cache
+
+
+class FakePubSub:
+    def __init__(self, redis):
+        self.redis = redis
+        self.patterns = []
+        self.closed = False
+
+    async def psubscribe(self, *patterns):
+        self.patterns.extend(patterns)
+        self.redis.subscriptions += 1
+
+    async def listen(self):
+        while True:
+            yield await self.redis.messages.get()
+
+    async def aclose(self):
+        self.closed = True
+
+
+class FakeRedis:
+    def __init__(self):
+        self.cache = {}
+        self.messages = asyncio.Queue()
+        self.subscriptions = 0
+
+    def pubsub(self):
+        return FakePubSub(self)
+
+    async def get(self, key):
+        return self.cache.get(key)
+
+    async def publish(self, channel, data):
+        self.cache[channel] = data
+        await self.messages.put({"type": "pmessage", "channel": channel.encode(), "data": data.encode()})
+
+
+@pytest_asyncio.fixture
+async def listener(monkeypatch):
+    fake_redis = FakeRedis()
+    result_listener = CacheResultListener(fake_redis, ["file_conversion", "file_parsing", "tonality_analysis"])
+    monkeypatch.setattr("src.app.webhooks.utils.result_listener", result_listener)
+    yield result_listener
+    await result_listener.stop()
+
+
+@pytest.mark.asyncio
+async def test_waiters_share_one_subscription(listener):
+    data = {"status": "success", "s3_key": "uuid1_file.txt"}
+
+    waiters = [asyncio.create_task(wait_for_cache("uuid1_file.txt", "file_parsing", timeout=1)) for _ in range(3)]
+    await asyncio.sleep(0.01)
+    await listener.redis.publish("file_parsing:uuid1", json.dumps(data))
+
+    assert await asyncio.gather(*waiters) == [data, data, data]
+    assert listener.redis.subscriptions == 1
+    assert listener._waiters == {}
+
+
+@pytest.mark.asyncio
+async def test_returns_result_cached_before_wait(listener):
+    data = {"status": "success", "s3_key": "uuid2_file.txt"}
+    listener.redis.cache["tonality_analysis:uuid2"] = json.dumps(data).encode()
+
+    assert await wait_for_cache("uuid2_file.txt", "tonality_analysis", timeout=1) == data
+
+
+@pytest.mark.asyncio
+async def test_results_are_routed_by_key(listener):
+    waiter = asyncio.create_task(wait_for_cache("uuid3_file.txt", "file_conversion", timeout=1))
+    await asyncio.sleep(0.01)
+    await listener.redis.publish("file_parsing:uuid3", json.dumps({"status": "error"}))
+    await listener.redis.publish("file_conversion:uuid3", json.dumps({"status": "success"}))
+
+    assert await waiter == {"status": "success"}
+
+
+@pytest.mark.asyncio
+async def test_timeout_cleans_up_waiter(listener):
+    assert await wait_for_cache("uuid4_file.txt", "file_conversion", timeout=0.05) is None
+    assert listener._waiters == {}
+
+
+@pytest.mark.asyncio
+async def test_cancellation_cleans_up_waiter(listener):
+    waiter = asyncio.create_task(wait_for_cache("uuid5_file.txt", "file_parsing", timeout=1))
+    await asyncio.sleep(0.01)
+    waiter.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert listener._waiters == {}